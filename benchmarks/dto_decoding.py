@@ -0,0 +1,107 @@
+"""Microbenchmarks of :meth:`~novu.dto.base.CamelCaseDto.from_camel_case`.
+
+Compares the compiled per-class decoders with the previous implementation, which rebuilt the fields map and
+converted every key to snake case on each call.
+
+Usage:
+    python -m benchmarks.dto_decoding [--number N]
+"""
+
+import argparse
+import dataclasses
+import timeit
+
+from novu.dto.base import camel_case_to_snake_case
+from novu.dto.message import MessageDto
+from novu.dto.notification import ActivityNotificationDto
+from novu.dto.subscriber import SubscriberDto
+
+SUBSCRIBER = {
+    "_id": "63dafed97779f59258e44954",
+    "_organizationId": "63dafed97779f59258e38445",
+    "_environmentId": "63dafed97779f59258e38447",
+    "subscriberId": "subscriber-id",
+    "firstName": "Max",
+    "lastName": "Moe",
+    "email": "max.moe@example.com",
+    "phone": "+441234567893",
+    "locale": "en",
+    "channels": [],
+    "isOnline": True,
+    "lastOnlineAt": "2023-01-01T00:00:00.000Z",
+    "deleted": False,
+    "createdAt": "2023-01-01T00:00:00.000Z",
+    "updatedAt": "2023-01-01T00:00:00.000Z",
+    "__v": 0,
+}
+
+MESSAGE = {
+    "_id": "63dafed97779f59258e44954",
+    "_templateId": "63dafed97779f59258e38445",
+    "_environmentId": "63dafed97779f59258e38447",
+    "_messageTemplateId": "63dafed97779f59258e38448",
+    "_organizationId": "63dafed97779f59258e38449",
+    "_subscriberId": "63dafed97779f59258e38450",
+    "_jobId": "63dafed97779f59258e38451",
+    "templateIdentifier": "template",
+    "email": "max.moe@example.com",
+    "subject": "Subject",
+    "cta": {},
+    "channel": "email",
+    "content": "Content",
+    "providerId": "sendgrid",
+    "deviceTokens": [],
+    "seen": False,
+    "read": False,
+    "status": "sent",
+    "transactionId": "transaction-id",
+    "createdAt": "2023-01-01T00:00:00.000Z",
+}
+
+ACTIVITY_NOTIFICATION = {
+    "_id": "63dafed97779f59258e44954",
+    "_environmentId": "63dafed97779f59258e38445",
+    "_organizationId": "789er454569345",
+    "transactionId": "fefrey56v",
+    "createdAt": "2023-07-13",
+    "channels": ["in_app"],
+    "subscriber": {"firstName": "Max", "_id": "123", "lastName": "Moe", "email": "max.moe@example.com"},
+    "template": {"_id": "12crefr3", "name": "Template3", "triggers": []},
+    "jobs": [],
+}
+
+
+def legacy_from_camel_case(cls, data: dict):
+    """The implementation of :meth:`~novu.dto.base.CamelCaseDto.from_camel_case` before compiled decoders"""
+    fields = {f.name: f.type for f in dataclasses.fields(cls)}
+    kwargs = {}
+    for key, val in data.items():
+        _key = camel_case_to_snake_case(key)
+        if _key in fields.keys():
+            kwargs[_key] = fields[_key].from_camel_case(val) if hasattr(fields[_key], "from_camel_case") else val
+
+    return cls(**kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Number of decodings per measure")
+    args = parser.parse_args()
+
+    print(f"{'DTO':<24}{'legacy (µs)':>14}{'compiled (µs)':>16}{'speedup':>10}")
+    for cls, data in (
+        (SubscriberDto, SUBSCRIBER),
+        (MessageDto, MESSAGE),
+        (ActivityNotificationDto, ACTIVITY_NOTIFICATION),
+    ):
+        assert legacy_from_camel_case(cls, data) == cls.from_camel_case(data)
+        legacy = min(timeit.repeat(lambda: legacy_from_camel_case(cls, data), number=args.number, repeat=5))
+        compiled = min(timeit.repeat(lambda: cls.from_camel_case(data), number=args.number, repeat=5))
+        print(
+            f"{cls.__name__:<24}{legacy / args.number * 1e6:>14.2f}{compiled / args.number * 1e6:>16.2f}"
+            f"{legacy / compiled:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
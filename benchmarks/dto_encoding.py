@@ -0,0 +1,81 @@
+"""Microbenchmarks of :meth:`~novu.dto.base.CamelCaseDto.to_camel_case`.
+
+Compares the compiled per-class encoders with the previous implementation, which deep-copied the instance through
+:func:`dataclasses.asdict` and camelized every key on each call.
+
+Usage:
+    python -m benchmarks.dto_encoding [--number N]
+"""
+
+import argparse
+import dataclasses
+import timeit
+
+from novu.dto.base import snake_case_to_camel_case
+from novu.dto.layout import LayoutDto
+from novu.dto.subscriber import SubscriberDto
+from novu.dto.topic import TopicDto
+
+SUBSCRIBER = SubscriberDto(
+    subscriber_id="subscriber-id",
+    email="max.moe@example.com",
+    first_name="Max",
+    last_name="Moe",
+    phone="+441234567893",
+    locale="en",
+    data={"company": "Example", "tags": [f"tag-{i}" for i in range(20)], "address": {"city": "Paris", "zip": "75000"}},
+)
+
+LARGE_SUBSCRIBER = dataclasses.replace(
+    SUBSCRIBER, data={f"key-{i}": {"values": list(range(10)), "label": f"label-{i}"} for i in range(200)}
+)
+
+TOPIC = TopicDto("topic-key", "Topic name")
+
+LAYOUT = LayoutDto(
+    name="Layout",
+    description="Description",
+    content="<html>{{{body}}}</html>",
+    variables=[{"name": "body", "type": "String"}],
+    is_default=False,
+    identifier="layout",
+)
+
+
+def legacy_to_camel_case(obj) -> dict:
+    """The implementation of :meth:`~novu.dto.base.CamelCaseDto.to_camel_case` before compiled encoders"""
+    if obj.camel_case_fields:
+        return {
+            snake_case_to_camel_case(k) if k not in obj.snake_case_to_camel_case_ignored else k: v
+            for k, v in dataclasses.asdict(obj).items()
+            if k in obj.camel_case_fields
+        }
+    return {
+        snake_case_to_camel_case(k) if k not in obj.snake_case_to_camel_case_ignored else k: v
+        for k, v in dataclasses.asdict(obj).items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Number of encodings per measure")
+    args = parser.parse_args()
+
+    print(f"{'DTO':<24}{'legacy (µs)':>14}{'compiled (µs)':>16}{'speedup':>10}")
+    for label, obj in (
+        ("SubscriberDto", SUBSCRIBER),
+        ("SubscriberDto (large)", LARGE_SUBSCRIBER),
+        ("TopicDto", TOPIC),
+        ("LayoutDto", LAYOUT),
+    ):
+        assert legacy_to_camel_case(obj) == obj.to_camel_case()
+        legacy = min(timeit.repeat(lambda: legacy_to_camel_case(obj), number=args.number, repeat=5))
+        compiled = min(timeit.repeat(obj.to_camel_case, number=args.number, repeat=5))
+        print(
+            f"{label:<24}{legacy / args.number * 1e6:>14.2f}{compiled / args.number * 1e6:>16.2f}"
+            f"{legacy / compiled:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
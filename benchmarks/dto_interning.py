@@ -0,0 +1,87 @@
+"""Memory benchmark of the interning of low-cardinality fields (see :func:`~novu.dto.base.set_interned_fields`).
+
+Measures the memory kept by the DTO parsed from a synthetic stream, where each item has its own copies of the
+identifiers shared with the other items (as when they are decoded from JSON responses), with and without interning.
+
+Usage:
+    python -m benchmarks.dto_interning [--number N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Iterator
+
+from novu.dto.base import clear_intern_pool, set_interned_fields
+from novu.dto.message import MessageDto
+from novu.dto.subscriber import SubscriberDto
+
+ENVIRONMENTS = [f"63dafed97779f59258e3844{i}" for i in range(3)]
+ORGANIZATIONS = [f"63dafed97779f59258e3843{i}" for i in range(2)]
+TEMPLATES = [f"63dafed97779f59258e3845{i}" for i in range(10)]
+CHANNELS = ["email", "sms", "in_app", "push"]
+PROVIDERS = ["sendgrid", "twilio", "novu", "fcm"]
+
+
+def copy(string: str) -> str:
+    """Build a copy of a string, as decoding the same value from several JSON responses does"""
+    return "".join(list(string))
+
+
+def subscribers(number: int) -> Iterator[dict]:
+    """Generate a synthetic stream of subscribers"""
+    for i in range(number):
+        yield {
+            "_id": f"{i:024x}",
+            "_environmentId": copy(ENVIRONMENTS[i % len(ENVIRONMENTS)]),
+            "_organizationId": copy(ORGANIZATIONS[i % len(ORGANIZATIONS)]),
+            "subscriberId": f"subscriber-{i}",
+            "locale": copy("en"),
+        }
+
+
+def messages(number: int) -> Iterator[dict]:
+    """Generate a synthetic stream of messages"""
+    for i in range(number):
+        yield {
+            "_id": f"{i:024x}",
+            "_environmentId": copy(ENVIRONMENTS[i % len(ENVIRONMENTS)]),
+            "_organizationId": copy(ORGANIZATIONS[i % len(ORGANIZATIONS)]),
+            "_templateId": copy(TEMPLATES[i % len(TEMPLATES)]),
+            "channel": copy(CHANNELS[i % len(CHANNELS)]),
+            "providerId": copy(PROVIDERS[i % len(PROVIDERS)]),
+            "transactionId": f"transaction-{i}",
+        }
+
+
+def measure(cls, stream: Iterator[dict]) -> int:
+    """Return the number of bytes allocated to keep the DTO parsed from the given stream"""
+    gc.collect()
+    tracemalloc.start()
+    items = [cls.from_camel_case(item) for item in stream]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000000, help="Number of items in the stream")
+    args = parser.parse_args()
+
+    print(f"{'DTO':<24}{'regular (MiB)':>16}{'interned (MiB)':>16}{'ratio':>10}")
+    for cls, stream, fields in (
+        (SubscriberDto, subscribers, ["_environment_id", "_organization_id", "locale"]),
+        (MessageDto, messages, ["_environment_id", "_organization_id", "_template_id", "channel", "provider_id"]),
+    ):
+        regular = measure(cls, stream(args.number))
+        set_interned_fields(cls, fields)
+        interned = measure(cls, stream(args.number))
+        set_interned_fields(cls, None)
+        clear_intern_pool()
+        print(f"{cls.__name__:<24}{regular / 2**20:>16.1f}{interned / 2**20:>16.1f}{regular / interned:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
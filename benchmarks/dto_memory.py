@@ -0,0 +1,48 @@
+"""Memory benchmark of the compact DTO variants (see :func:`~novu.dto.base.get_compact_class`).
+
+Measures the memory allocated to keep many parsed DTO alive, with the regular classes and their compact variants.
+
+Usage:
+    python -m benchmarks.dto_memory [--number N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from benchmarks.dto_decoding import ACTIVITY_NOTIFICATION, MESSAGE, SUBSCRIBER
+from novu.dto.message import MessageDto
+from novu.dto.notification import ActivityNotificationDto
+from novu.dto.subscriber import SubscriberDto
+
+
+def measure(cls, data: dict, number: int) -> int:
+    """Return the number of bytes allocated to keep the given number of parsed DTO"""
+    cls.from_camel_case(data)  # Build the decoders outside of the measure
+    gc.collect()
+    tracemalloc.start()
+    items = [cls.from_camel_case(data) for _ in range(number)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000, help="Number of DTO kept in memory")
+    args = parser.parse_args()
+
+    print(f"{'DTO':<24}{'regular (B)':>14}{'compact (B)':>14}{'ratio':>10}")
+    for cls, data in (
+        (SubscriberDto, SUBSCRIBER),
+        (MessageDto, MESSAGE),
+        (ActivityNotificationDto, ACTIVITY_NOTIFICATION),
+    ):
+        regular = measure(cls, data, args.number) / args.number
+        compact = measure(cls.compact(), data, args.number) / args.number
+        print(f"{cls.__name__:<24}{regular:>14.0f}{compact:>14.0f}{regular / compact:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
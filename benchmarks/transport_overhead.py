@@ -0,0 +1,74 @@
+"""Microbenchmarks of the per-call overhead of the transports of :meth:`~novu.api.base.Api.handle_request`.
+
+Sends sequential requests to a local HTTP server standing in for Novu (answering at once, over a keep-alive
+connection), so the time per call is mostly the client overhead, with :class:`~novu.transport.RequestsTransport`
+(the default) and :class:`~novu.transport.Urllib3Transport`.
+
+Usage:
+    python -m benchmarks.transport_overhead [--number N]
+"""
+
+import argparse
+import threading
+import timeit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from novu.api.base import Api
+from novu.transport import RequestsTransport, Urllib3Transport
+
+BODY = b'{"data": {"acknowledged": true, "status": "processed", "transactionId": "transaction-id"}}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answer every request at once with the same JSON body, keeping the connection alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=C0103
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    do_POST = do_GET
+
+    def log_message(self, *_):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="Number of requests per measure")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    api = Api(url, "api-key")
+    api.retry_policy = None
+    calls = {
+        "GET": lambda: api.handle_request("GET", f"{url}/v1/subscribers", payload={"page": 0, "limit": 10}),
+        "POST": lambda: api.handle_request("POST", f"{url}/v1/events/trigger", {"name": "event", "to": "id"}),
+    }
+
+    print(f"{'request':<10}{'requests (µs)':>16}{'urllib3 (µs)':>16}{'speedup':>10}")
+    try:
+        for name, call in calls.items():
+            timings = []
+            for transport in (RequestsTransport(), Urllib3Transport()):
+                api.transport = transport
+                call()  # Open the keep-alive connection
+                timings.append(min(timeit.repeat(call, number=args.number, repeat=5)) / args.number)
+                transport.close()
+            print(f"{name:<10}{timings[0] * 1e6:>16.1f}{timings[1] * 1e6:>16.1f}{timings[0] / timings[1]:>9.1f}x")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
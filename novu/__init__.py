@@ -12,6 +12,8 @@ Available subpackages
 
 api
     Wrapper to interact with Novu API for each resource
+aio
+    Asynchronous wrapper to interact with Novu API for each resource (requires the ``aio`` extra)
 dto
     DTO dataclasses to parse Novu resources.
 enums
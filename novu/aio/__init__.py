@@ -0,0 +1,47 @@
+"""This module is used to gather all asynchronous python wrappers used to describe resources in Novu API.
+
+Each class mirrors its synchronous counterpart of :mod:`novu.api` (same methods, same signatures and same DTO
+returned), but relies on :mod:`asyncio` to communicate with the Novu API.
+
+.. note:: This module requires the ``httpx`` package, which can be installed using the ``aio`` extra
+          (``pip install novu[aio]``).
+"""
+
+from novu.aio.blueprint import BlueprintApi
+from novu.aio.change import ChangeApi
+from novu.aio.environment import EnvironmentApi
+from novu.aio.event import EventApi
+from novu.aio.execution_detail import ExecutionDetailApi
+from novu.aio.feed import FeedApi
+from novu.aio.inbound_parse import InboundParseApi
+from novu.aio.integration import IntegrationApi
+from novu.aio.layout import LayoutApi
+from novu.aio.message import MessageApi
+from novu.aio.notification import NotificationApi
+from novu.aio.notification_group import NotificationGroupApi
+from novu.aio.notification_template import NotificationTemplateApi
+from novu.aio.organization import OrganizationApi
+from novu.aio.subscriber import SubscriberApi
+from novu.aio.tenant import TenantApi
+from novu.aio.topic import TopicApi
+
+# pylint: disable=duplicate-code
+__all__ = [
+    "BlueprintApi",
+    "ChangeApi",
+    "EnvironmentApi",
+    "EventApi",
+    "ExecutionDetailApi",
+    "FeedApi",
+    "InboundParseApi",
+    "IntegrationApi",
+    "LayoutApi",
+    "MessageApi",
+    "NotificationApi",
+    "NotificationGroupApi",
+    "NotificationTemplateApi",
+    "OrganizationApi",
+    "SubscriberApi",
+    "TenantApi",
+    "TopicApi",
+]
@@ -0,0 +1,434 @@
+"""This module is used to defined an abstract class for all reusable methods to communicate asynchronously
+with the Novu API"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import (
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import httpx
+
+from novu.api.base import (
+    SessionPool,
+    _client_settings,
+    _merge_headers,
+    _PageBuffer,
+    _parse_response,
+    _release_guards,
+)
+from novu.circuit_breaker import CircuitBreaker, CircuitToken
+from novu.concurrency import AsyncAdaptiveConcurrencyLimiter, Lease
+from novu.constants import DEFAULT_PAGE_SIZE
+from novu.dto.base import CamelCaseDto
+from novu.dto.columns import Columns
+from novu.helpers import Singleton
+from novu.rate_limit import RateLimiter
+from novu.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+LOGGER = logging.getLogger(__name__)
+
+_C_co = TypeVar("_C_co", bound=CamelCaseDto, covariant=True)
+
+
+class ClientPool(metaclass=Singleton):
+    """Process-wide registry of keep-alive :class:`~httpx.AsyncClient` shared by all asynchronous API classes.
+
+    As connections of an :class:`~httpx.AsyncClient` are bound to the event loop which opened them, a client is
+    created for each couple of base URL and API key, in each running event loop. The size of the connection pools
+    follows the configuration of the :class:`~novu.api.base.SessionPool`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: MutableMapping[asyncio.AbstractEventLoop, Dict[Tuple[str, str], httpx.AsyncClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self, url: str, api_key: str) -> httpx.AsyncClient:
+        """Retrieve (or create) the shared client for the given base URL and API key in the running event loop.
+
+        Args:
+            url: The base URL of the Novu API.
+            api_key: The API key used to authenticate on the Novu API.
+
+        Returns:
+            The client to use to reach the Novu API.
+        """
+        loop = asyncio.get_running_loop()
+        key = (url, api_key)
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                pool = SessionPool()
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=pool.pool_connections * pool.pool_maxsize,
+                        max_keepalive_connections=pool.pool_maxsize,
+                    )
+                )
+                clients[key] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Close all the shared clients of the running event loop and release their connections."""
+        with self._lock:
+            clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+
+def _build_params(payload: Optional[dict]) -> Optional[dict]:
+    """Encode query params like :mod:`requests` does (drop ``None`` values and keep Python booleans format)."""
+    if payload is None:
+        return None
+
+    return {k: str(v) if isinstance(v, bool) else v for k, v in payload.items() if v is not None}
+
+
+class PaginationIterator(Generic[_C_co]):
+    """The class is a generic asynchronous iterator which allow to iterate directly on result without
+    looking for pagination during handling.
+
+    The next page is fetched in background as soon as the current one is received, so the network wait
+    overlaps with the handling of the current page items.
+
+    No request is sent until the first item is requested. The position of the iterator can be saved at any time
+    using :meth:`checkpoint`, and restored in a new iterator using ``resume_from``.
+
+    Example:
+        >>> async for subscriber in SubscriberApi().stream():
+        ...     print(subscriber.subscriber_id)
+
+    Args:
+        api: The api used to call
+        item_class: The Dto to parse each items return by API.
+        url: The URL to query during fetch.
+        payload: Payload to query during fetch.
+        page_size: The number of items to fetch per request, up to the server maximum (``MAX_PAGE_SIZE``).
+        resume_from: A cursor returned by :meth:`checkpoint`, to resume the iteration where it was saved.
+        raw: If ``True``, the items are the JSON objects returned by the API, without building the Dto.
+        view: If ``True``, the items are read-only views on the JSON objects returned by the API
+            (see :class:`~novu.dto.base.DtoView`).
+        fields: The only fields of the Dto to parse (see :func:`~novu.dto.base.get_decoder`).
+        exclude: The fields of the Dto to skip (see :func:`~novu.dto.base.get_decoder`).
+
+    Raises:
+        ValueError: If the page size is not between 1 and the server maximum, or if a field to parse or to skip
+            is not defined by the Dto.
+    """
+
+    def __init__(
+        self,
+        api: "Api",
+        item_class: Type[_C_co],
+        url: str,
+        payload: Optional[dict] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ):
+        self.__buffer = _PageBuffer(item_class, page_size, resume_from, raw, view, fields, exclude)
+        self.__api = api
+        self.__url = url
+        self.__payload = payload or {}
+
+        self.__has_more = True
+        self.__closed = False
+        self.__next_page: Optional[asyncio.Task] = None
+
+        self.__payload["limit"] = page_size
+
+    def __aiter__(self) -> "PaginationIterator[_C_co]":
+        return self
+
+    async def __anext__(self) -> _C_co:
+        return await self.next()
+
+    async def __aenter__(self) -> "PaginationIterator[_C_co]":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.aclose()
+
+    async def next(self) -> _C_co:
+        """Implementation of the next behavior for the iterator."""
+        if not await self.__fill():
+            raise StopAsyncIteration()
+
+        return self.__buffer.pop()
+
+    async def pages(self) -> AsyncIterator[List[_C_co]]:
+        """Iterate over the remaining items page by page, instead of one item at a time.
+
+        Each fetched page is yielded as is (without its items already returned by the iterator) and released
+        by the iterator, to avoid the overhead of a call per item.
+
+        Example:
+            >>> async with SubscriberApi().stream(page_size=100) as subscribers:
+            ...     async for page in subscribers.pages():
+            ...         print(len(page))
+
+        Returns:
+            An asynchronous iterator on the lists of items of each page.
+        """
+        while await self.__fill():
+            yield self.__buffer.take(self.__buffer.remaining)
+
+    def batches(self, size: int) -> AsyncIterator[List[_C_co]]:
+        """Iterate over the remaining items by lists of the given size, whatever the page size.
+
+        Only the last batch can be smaller than the requested size. A checkpoint taken after a batch is
+        yielded points to the first item of the next batch.
+
+        Args:
+            size: The number of items in each batch.
+
+        Returns:
+            An asynchronous iterator on the lists of items.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        if size < 1:
+            raise ValueError(f"The batch size must be positive, got {size}.")
+
+        return self.__batches(size)
+
+    def columns(
+        self, size: int, fields: Optional[Iterable[str]] = None, categorical: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[Columns]:
+        """Iterate over the remaining items by batches of the given size, in columnar representation.
+
+        Args:
+            size: The number of items in each batch.
+            fields: The fields to store (see :meth:`~novu.dto.columns.Columns.from_items`). Defaults to all fields.
+            categorical: The fields to encode (see :meth:`~novu.dto.columns.Columns.from_items`). Defaults to the
+                ``categorical_fields`` of the Dto.
+
+        Returns:
+            An asynchronous iterator on the columns of each batch.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        return self.__columns(self.batches(size), fields, categorical)
+
+    def checkpoint(self) -> Dict[str, int]:
+        """Save the position of the iterator, to resume the iteration later (e.g. after a restart).
+
+        The returned cursor is a JSON serializable dictionary, pointing to the next item to return. It can be
+        given as ``resume_from`` to a new iterator on the same resource, even with another page size.
+
+        Returns:
+            The cursor on the next item to return.
+        """
+        return self.__buffer.checkpoint()
+
+    async def aclose(self) -> None:
+        """Stop the iteration and cancel the page fetched in background, if any."""
+        self.__has_more = False
+        self.__closed = True
+
+        task, self.__next_page = self.__next_page, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def __columns(
+        self,
+        batches: AsyncIterator[List[_C_co]],
+        fields: Optional[Iterable[str]],
+        categorical: Optional[Iterable[str]],
+    ) -> AsyncIterator[Columns]:
+        async for batch in batches:
+            yield Columns.from_items(self.__buffer.item_class, batch, fields, categorical)
+
+    async def __batches(self, size: int) -> AsyncIterator[List[_C_co]]:
+        # pylint: disable=duplicate-code
+        batch: List[_C_co] = []
+        while await self.__fill():
+            if self.__buffer.fill(batch, size):
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    async def __fill(self) -> bool:
+        """Load the next page if the current one is consumed, and tell if there are items left to return."""
+        if self.__closed:
+            return False
+
+        if not self.__buffer.remaining and self.__has_more:
+            await self.__load_next_page()
+
+        return self.__buffer.remaining > 0
+
+    async def __load_next_page(self) -> None:
+        task, self.__next_page = self.__next_page, None
+        data = await (task if task is not None else self.__fetch_data(self.__buffer.page))
+
+        self.__has_more = self.__buffer.load(data)
+        if self.__has_more:
+            self.__next_page = asyncio.ensure_future(self.__fetch_data(self.__buffer.page))
+
+    async def __fetch_data(self, page: int) -> dict:
+        return await self.__api.handle_request(
+            method="GET",
+            url=self.__url,
+            payload={**self.__payload, "page": page},
+        )
+
+
+class Api:  # pylint: disable=R0903
+    """Base class for all asynchronous API in the Novu client"""
+
+    requests_timeout: int = 5
+    """This field allow you to change the timeout which is used during API calls."""
+
+    session: Optional[httpx.AsyncClient] = None
+    """This field allow you to use a :class:`~httpx.AsyncClient` during API calls.
+
+    If not provided, a keep-alive client shared through the :class:`~novu.aio.base.ClientPool` is used."""
+
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY
+    """This field allow you to change the :class:`~novu.retry.RetryPolicy` of the requests failed with a transient
+    error, or to disable the retries using ``None``."""
+
+    rate_limiter: Optional[RateLimiter] = None
+    """This field allow you to set a :class:`~novu.rate_limit.RateLimiter`, to share between all the API instances
+    calling the same Novu account, which delays the requests to stay within its rate limits."""
+
+    concurrency_limiter: Optional[AsyncAdaptiveConcurrencyLimiter] = None
+    """This field allow you to set a :class:`~novu.concurrency.AsyncAdaptiveConcurrencyLimiter`, to share between the
+    API instances, which adapts the number of requests in flight to the load of the server."""
+
+    circuit_breaker: Optional[CircuitBreaker] = None
+    """This field allow you to set a :class:`~novu.circuit_breaker.CircuitBreaker`, to share between the API
+    instances, which fails the requests at once while their endpoint is failing."""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        # pylint: disable=duplicate-code
+        self._url, self._api_key, self._headers, self.requests_timeout = _client_settings(
+            url, api_key, requests_timeout
+        )
+        self.session = session
+
+    async def handle_request(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Union[dict, list]] = None,
+        payload: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ) -> dict:
+        """Handle a request to the API.
+
+        This method can handle all cases of request and is used to authenticate the request, wait for the rate limit
+        (see :attr:`rate_limiter`), retry it on transient errors (see :attr:`retry_policy`) and raise an error on bad
+        status.
+
+        Args:
+            method: The HTTP method used during the request (e.g. "POST")
+            url: The URL to reach during the request
+            json: The body to send, in json format. Defaults to None.
+            payload: Params to send, in json format. Defaults to None.
+            headers: Headers to send, in json format. Defaults to None.
+            idempotent: Whether the request can be retried. Defaults to whether the method is safe to retry.
+
+        Returns:
+            Return parsed response.
+
+        Raises:
+            ~novu.rate_limit.RateLimitExceeded: If the request would wait longer than allowed for its rate limit.
+            ~novu.circuit_breaker.CircuitOpenError: If the circuit of the endpoint is open.
+        """
+        session = self.session or ClientPool().get(self._url, self._api_key)
+        kwargs.update(
+            headers=_merge_headers(self._headers, headers),
+            json=json,
+            params=_build_params(payload),
+            timeout=self.requests_timeout,
+        )
+
+        res = await self.__send_with_retry(session, method, url, kwargs, self.retry_policy, idempotent)
+        return _parse_response(res, res.is_error)
+
+    async def __send_with_retry(
+        self,
+        session: httpx.AsyncClient,
+        method: str,
+        url: str,
+        kwargs: dict,
+        policy: Optional[RetryPolicy],
+        idempotent: Optional[bool],
+    ) -> httpx.Response:
+        """Send a request, waiting for the rate limit before each attempt and retrying it as long as the policy
+        allows, and return its last response."""
+        # pylint: disable=duplicate-code
+        if policy:
+            policy.start()
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                await asyncio.sleep(self.rate_limiter.reserve(method, url))
+            try:
+                res = await self.__send(session, method=method, url=url, **kwargs)
+            except httpx.TransportError:
+                delay = policy.next_delay(attempt, method, idempotent) if policy else None
+                if delay is None:
+                    raise
+            else:
+                if not res.is_error or not policy:
+                    return res
+                delay = policy.response_delay(attempt, method, idempotent, res.status_code, res.headers)
+                if delay is None:
+                    return res
+                await res.aclose()
+
+            LOGGER.debug("Retrying %s %s in %.2f seconds (attempt %d failed).", method, url, delay, attempt + 1)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __send(self, session: httpx.AsyncClient, **kwargs) -> httpx.Response:
+        breaker, limiter = self.circuit_breaker, self.concurrency_limiter
+        if not breaker and not limiter:
+            return await session.request(**kwargs)
+
+        token: Optional[CircuitToken] = None
+        lease: Optional[Lease] = None
+        status: Optional[int] = None
+        try:
+            lease = await limiter.acquire(kwargs["url"]) if limiter else None
+            token = breaker.acquire(kwargs["url"]) if breaker else None
+            res = await session.request(**kwargs)
+            status = res.status_code
+            return res
+        finally:
+            _release_guards(breaker, token, limiter, lease, status)
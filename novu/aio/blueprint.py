@@ -0,0 +1,37 @@
+"""This module is used to define the ``BlueprintApi``,
+an asynchronous python wrapper to interact with ``Blueprint`` in Novu."""
+
+from typing import Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.constants import BLUEPRINTS_ENDPOINT
+from novu.dto.blueprint import BlueprintDto, GroupedBlueprintDto
+
+
+class BlueprintApi(Api):
+    """This class aims to handle all API methods around blueprints in Novu"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._blueprint_url = f"{self._url}{BLUEPRINTS_ENDPOINT}"
+
+    async def get_by_id(self, template_id: str) -> BlueprintDto:
+        """Asynchronous counterpart of :meth:`novu.api.BlueprintApi.get_by_id`."""
+        return BlueprintDto.from_camel_case(
+            (await self.handle_request("GET", f"{self._blueprint_url}/{template_id}"))["data"]
+        )
+
+    async def get_grouped_by_category(self) -> GroupedBlueprintDto:
+        """Asynchronous counterpart of :meth:`novu.api.BlueprintApi.get_grouped_by_category`."""
+        return GroupedBlueprintDto.from_camel_case(
+            (await self.handle_request("GET", f"{self._blueprint_url}/group-by-category"))["data"]
+        )
@@ -0,0 +1,51 @@
+"""
+This module is used to define the ``ChangeApi``, an asynchronous python wrapper to interact with ``Changes`` in Novu.
+"""
+
+from typing import AsyncGenerator, List, Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.api.base import _page_params
+from novu.constants import CHANGES_ENDPOINT
+from novu.dto.change import ChangeDto, PaginatedChangeDto
+
+
+class ChangeApi(Api):
+    """This class aims to handle all API methods around changes in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._change_url = f"{self._url}{CHANGES_ENDPOINT}"
+
+    async def list(
+        self, page: Optional[int] = None, limit: Optional[int] = None, promoted: str = "false"
+    ) -> PaginatedChangeDto:
+        """Asynchronous counterpart of :meth:`novu.api.ChangeApi.list`."""
+        payload = {"promoted": promoted, **_page_params(page, limit)}
+        return PaginatedChangeDto.from_camel_case(await self.handle_request("GET", self._change_url, payload=payload))
+
+    async def count(self) -> int:
+        """Asynchronous counterpart of :meth:`novu.api.ChangeApi.count`."""
+        return (await self.handle_request("GET", f"{self._change_url}/count"))["data"]
+
+    async def apply(self, change_id: str) -> PaginatedChangeDto:
+        """Asynchronous counterpart of :meth:`novu.api.ChangeApi.apply`."""
+        return PaginatedChangeDto.from_camel_case(
+            await self.handle_request("POST", f"{self._change_url}/{change_id}/apply")
+        )
+
+    async def bulk_apply(self, change_ids: List[str]) -> AsyncGenerator[ChangeDto, None]:
+        """Asynchronous counterpart of :meth:`novu.api.ChangeApi.bulk_apply`."""
+        response = await self.handle_request("POST", f"{self._change_url}/bulk/apply", {"changeIds": change_ids})
+        for result in response["data"]:
+            for sub_result in result:
+                yield ChangeDto.from_camel_case(sub_result)
@@ -0,0 +1,55 @@
+"""
+This module is used to define the ``EnvironmentApi``, an asynchronous python wrapper
+to interact with ``Environments`` in Novu.
+"""
+
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.api.environment import _create_payload
+from novu.constants import ENVIRONMENTS_ENDPOINT
+from novu.dto import EnvironmentApiKeyDto, EnvironmentDto
+
+
+class EnvironmentApi(Api):
+    """This class aims to handle all API methods around environments in Novu"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._environment_url = f"{self._url}{ENVIRONMENTS_ENDPOINT}"
+
+    async def list(self) -> AsyncIterator[EnvironmentDto]:
+        """Asynchronous counterpart of :meth:`novu.api.EnvironmentApi.list`."""
+        results = (await self.handle_request("GET", self._environment_url))["data"]
+        for result in results:
+            yield EnvironmentDto.from_camel_case(result)
+
+    async def create(self, name: str, parent_id: Optional[str] = None) -> EnvironmentDto:
+        """Asynchronous counterpart of :meth:`novu.api.EnvironmentApi.create`."""
+        body = _create_payload(name, parent_id)
+        return EnvironmentDto.from_camel_case((await self.handle_request("POST", self._environment_url, body))["data"])
+
+    async def current(self) -> EnvironmentDto:
+        """Asynchronous counterpart of :meth:`novu.api.EnvironmentApi.current`."""
+        return EnvironmentDto.from_camel_case((await self.handle_request("GET", f"{self._environment_url}/me"))["data"])
+
+    async def api_keys(self) -> AsyncIterator[EnvironmentApiKeyDto]:
+        """Asynchronous counterpart of :meth:`novu.api.EnvironmentApi.api_keys`."""
+        results = (await self.handle_request("GET", f"{self._environment_url}/api-keys"))["data"]
+        for result in results:
+            yield EnvironmentApiKeyDto.from_camel_case(result)
+
+    async def regenerate_api_key(self) -> AsyncIterator[EnvironmentApiKeyDto]:
+        """Asynchronous counterpart of :meth:`novu.api.EnvironmentApi.regenerate_api_key`."""
+        results = (await self.handle_request("POST", f"{self._environment_url}/api-keys/regenerate"))["data"]
+        for result in results:
+            yield EnvironmentApiKeyDto.from_camel_case(result)
@@ -0,0 +1,257 @@
+"""
+This module is used to define the ``EventApi``, an asynchronous python wrapper to interact with ``Events`` in Novu.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any, Iterable as _Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from novu.aio.base import Api
+from novu.api.event import (
+    _FLUSH,
+    _STOP,
+    _batch_error,
+    _batch_ready,
+    _batcher_limits,
+    _bulk_chunks,
+    _bulk_event_payload,
+    _bulk_results,
+    _event_payload,
+)
+from novu.constants import (
+    BULK_TRIGGER_MAX_EVENTS,
+    DEFAULT_BATCHER_MAX_DELAY_MS,
+    DEFAULT_BULK_TRIGGER_CONCURRENCY,
+    EVENTS_ENDPOINT,
+)
+from novu.dto.event import EventDto, InputEventDto
+from novu.dto.topic import TriggerTopicDto
+
+
+class TriggerBatcher:
+    """A background task grouping the events submitted from any coroutine into bulk trigger requests.
+
+    A batch is sent as soon as it holds ``max_batch`` events, or ``max_delay_ms`` milliseconds after its first event
+    was submitted. The batches are sent one at a time, and the remaining events are sent when the batcher is closed,
+    which must be awaited before the event loop stops.
+
+    Example:
+        >>> async with EventApi().batcher() as batcher:
+        ...     future = batcher.submit(InputEventDto("welcome", "subscriber-id", {}))
+        >>> await future
+        EventDto(acknowledged=True, status='processed', transaction_id='...')
+    """
+
+    def __init__(self, api: "EventApi", max_batch: int, max_delay_ms: float) -> None:
+        _batcher_limits(max_batch, max_delay_ms)
+
+        self.__loop = asyncio.get_running_loop()
+        self.__api = api
+        self.__max_batch = max_batch
+        self.__max_delay = max_delay_ms / 1000
+        self.__queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self.__closed = False
+        self.__task = self.__loop.create_task(self.__run())
+
+    def submit(self, event: InputEventDto) -> "asyncio.Future[EventDto]":
+        """Queue an event to trigger in the next batch.
+
+        Args:
+            event: The event to trigger.
+
+        Returns:
+            A future resolved with the created Novu event, or with the error raised while sending its batch.
+
+        Raises:
+            RuntimeError: If the batcher is closed.
+        """
+        if self.__closed:
+            raise RuntimeError("Cannot submit an event to a closed batcher.")
+
+        future: "asyncio.Future[EventDto]" = self.__loop.create_future()
+        self.__queue.put_nowait((event, future))
+        return future
+
+    async def flush(self) -> None:
+        """Send the queued events without waiting for the delay, and wait until their futures are resolved."""
+        if not self.__closed:
+            self.__queue.put_nowait(_FLUSH)
+        await self.__queue.join()
+
+    async def close(self) -> None:
+        """Send the queued events, then stop the dispatcher. Closing a batcher more than once has no effect."""
+        if not self.__closed:
+            self.__closed = True
+            self.__queue.put_nowait(_STOP)
+        await asyncio.shield(self.__task)
+
+    async def __aenter__(self) -> "TriggerBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def __run(self) -> None:
+        item = None
+        while item is not _STOP:
+            item = await self.__queue.get()
+            deadline = self.__loop.time() + self.__max_delay
+            batch: List[Tuple[InputEventDto, "asyncio.Future[EventDto]"]] = []
+            taken = 1
+            while not _batch_ready(batch, item, self.__max_batch):
+                try:
+                    item = await asyncio.wait_for(self.__queue.get(), max(deadline - self.__loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+                taken += 1
+
+            await self.__send(batch)
+            for _ in range(taken):
+                self.__queue.task_done()
+
+    async def __send(self, batch: List[Tuple[InputEventDto, "asyncio.Future[EventDto]"]]) -> None:
+        batch = [(event, future) for event, future in batch if not future.cancelled()]
+        if not batch:
+            return
+
+        try:
+            results = await self.__api.trigger_bulk([event for event, _ in batch])
+        except Exception as error:  # pylint: disable=W0703
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(_batch_error(error))
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class EventApi(Api):
+    """This class aims to handle all API methods around events in Novu"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._event_url = f"{self._url}{EVENTS_ENDPOINT}"
+
+    async def trigger(
+        self,
+        name: str,
+        recipients: Union[str, List[str]],
+        payload: dict,
+        overrides: Optional[dict] = None,
+        transaction_id: Optional[str] = None,
+        actor: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> EventDto:
+        """Asynchronous counterpart of :meth:`novu.api.EventApi.trigger`."""
+        payload = _event_payload(name, recipients, payload, overrides, transaction_id, actor, tenant)
+        res = await self.handle_request("POST", self._event_url, payload, idempotent=bool(transaction_id))
+        return EventDto.from_camel_case(res["data"])
+
+    async def trigger_bulk(
+        self,
+        events: List[InputEventDto],
+        chunk_size: int = BULK_TRIGGER_MAX_EVENTS,
+        concurrency: int = DEFAULT_BULK_TRIGGER_CONCURRENCY,
+    ) -> List[EventDto]:
+        """Trigger events in a bulk action to reduce the amount of api calls. Using this endpoint you can trigger
+        multiple events at once, to avoid multiple calls to the API. The bulk API is limited to 100 events per request.
+
+        The events are split into chunks of at most ``chunk_size`` events, sent concurrently on the shared client
+        with at most ``concurrency`` requests in flight.
+
+        Args:
+            events (List[InputEventDto]): List of input events that should be sent.
+            chunk_size: The number of events sent per request, up to the server maximum (100). Defaults to 100.
+            concurrency: The maximum number of requests in flight. Defaults to 4.
+
+        Returns:
+            List[EventDto]: List of created Novu events, in the order of the input events.
+
+        Raises:
+            ValueError: If the chunk size is not between 1 and the server maximum, or if the concurrency is not
+                positive.
+            ~novu.api.event.BulkTriggerError: If some chunks of events failed, even if the events fit in a single
+                chunk. The error raised while sending each failed chunk is in its ``failures``.
+        """
+        chunks = _bulk_chunks(events, chunk_size, concurrency)
+        slots = asyncio.Semaphore(concurrency)
+        responses: List[Union[list, BaseException]] = await asyncio.gather(
+            *(self.__trigger_chunk(events, chunk, slots) for chunk in chunks), return_exceptions=True
+        )
+
+        return _bulk_results(chunks, responses, len(events))  # type: ignore[return-value]
+
+    async def __trigger_chunk(self, events: List[InputEventDto], chunk: range, slots: asyncio.Semaphore) -> list:
+        payload = {"events": [_bulk_event_payload(events[index]) for index in chunk]}
+        idempotent = all(events[index].transaction_id for index in chunk)
+        async with slots:
+            res = await self.handle_request("POST", f"{self._event_url}/bulk", payload, idempotent=idempotent)
+        return res["data"]
+
+    def batcher(
+        self, max_batch: int = BULK_TRIGGER_MAX_EVENTS, max_delay_ms: float = DEFAULT_BATCHER_MAX_DELAY_MS
+    ) -> TriggerBatcher:
+        """Start a background task grouping the events triggered one by one into bulk trigger requests.
+
+        It is meant for callers triggering a few events at a time from many coroutines (e.g. a web server handling one
+        event per request), trading a short delay for far fewer API calls. It must be called from a coroutine, as the
+        task runs on the current event loop.
+
+        Args:
+            max_batch: The maximum number of events sent per request, up to the server maximum (100). Defaults to 100.
+            max_delay_ms: The maximum time an event waits for its batch to fill, in milliseconds. Defaults to 20.
+
+        Returns:
+            The started dispatcher, to close (or to use as an asynchronous context manager) once done.
+
+        Raises:
+            ValueError: If the batch size is not between 1 and the server maximum, or if the delay is negative.
+            RuntimeError: If there is no running event loop.
+        """
+        return TriggerBatcher(self, max_batch, max_delay_ms)
+
+    async def trigger_topic(
+        self,
+        name: str,
+        topics: Union[TriggerTopicDto, _Iterable[TriggerTopicDto]],
+        payload: dict,
+        overrides: Optional[dict] = None,
+        transaction_id: Optional[str] = None,
+        actor: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> EventDto:
+        """Asynchronous counterpart of :meth:`novu.api.EventApi.trigger_topic`."""
+        _recipients = [topic.to_camel_case() for topic in (topics if isinstance(topics, Iterable) else [topics])]
+        payload = _event_payload(name, _recipients, payload, overrides, transaction_id, actor, tenant)
+        res = await self.handle_request("POST", self._event_url, payload, idempotent=bool(transaction_id))
+        return EventDto.from_camel_case(res["data"])
+
+    async def broadcast(
+        self,
+        name: str,
+        payload: dict,
+        overrides: Optional[dict] = None,
+        transaction_id: Optional[str] = None,
+        actor: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ):
+        """Asynchronous counterpart of :meth:`novu.api.EventApi.broadcast`."""
+        payload = _event_payload(name, None, payload, overrides, transaction_id, actor, tenant)
+        res = await self.handle_request(
+            "POST", f"{self._event_url}/broadcast", payload, idempotent=bool(transaction_id)
+        )
+        return EventDto.from_camel_case(res["data"])
+
+    async def delete(self, transaction_id: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.EventApi.delete`."""
+        await self.handle_request("DELETE", f"{self._event_url}/{transaction_id}")
@@ -0,0 +1,39 @@
+"""
+This module is used to define the ``ExecutionDetailApi``, an asynchronous python wrapper
+to interact with ``ExecutionDetails`` in Novu.
+"""
+
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.constants import EXECUTION_DETAILS_ENDPOINT
+from novu.dto import ExecutionDetailDto
+
+
+class ExecutionDetailApi(Api):
+    """This class aims to handle all API methods around execution details in Novu"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._execution_detail_url = f"{self._url}{EXECUTION_DETAILS_ENDPOINT}"
+
+    async def list(self, notification_id: str, subscriber_id: str) -> AsyncIterator[ExecutionDetailDto]:
+        """Asynchronous counterpart of :meth:`novu.api.ExecutionDetailApi.list`."""
+        results = (
+            await self.handle_request(
+                "GET",
+                self._execution_detail_url,
+                payload={"notificationId": notification_id, "subscriberId": subscriber_id},
+            )
+        )["data"]
+        for result in results:
+            yield ExecutionDetailDto.from_camel_case(result)
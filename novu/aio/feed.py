@@ -0,0 +1,40 @@
+"""
+This module is used to define the ``FeedApi``, an asynchronous python wrapper to interact with ``Feeds`` in Novu.
+"""
+
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.constants import FEEDS_ENDPOINT
+from novu.dto.feed import FeedDto
+
+
+class FeedApi(Api):
+    """This class aims to handle all API methods around feeds in Novu"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._feed_url = f"{self._url}{FEEDS_ENDPOINT}"
+
+    async def list(self) -> AsyncIterator[FeedDto]:
+        """Asynchronous counterpart of :meth:`novu.api.FeedApi.list`."""
+        results = (await self.handle_request("GET", self._feed_url))["data"]
+        for result in results:
+            yield FeedDto.from_camel_case(result)
+
+    async def create(self, name: str) -> FeedDto:
+        """Asynchronous counterpart of :meth:`novu.api.FeedApi.create`."""
+        return FeedDto.from_camel_case((await self.handle_request("POST", self._feed_url, {"name": name}))["data"])
+
+    async def delete(self, feed_id: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.FeedApi.delete`."""
+        await self.handle_request("DELETE", f"{self._feed_url}/{feed_id}")
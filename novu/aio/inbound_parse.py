@@ -0,0 +1,31 @@
+"""
+This module is used to define the ``InboundParseApi``, an asynchronous python wrapper
+to interact with ``InboundParse`` in Novu.
+"""
+
+from typing import Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.constants import INBOUND_PARSE_ENDPOINT
+
+
+class InboundParseApi(Api):
+    """This class aims to handle all API methods around inbound-parse functionality in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._inbound_parse_url = f"{self._url}{INBOUND_PARSE_ENDPOINT}"
+
+    async def validate_mx_record_setup(self) -> bool:
+        """Asynchronous counterpart of :meth:`novu.api.InboundParseApi.validate_mx_record_setup`."""
+        result = await self.handle_request("GET", f"{self._inbound_parse_url}/mx/status")
+        return result.get("data", {}).get("mxRecordConfigured", False)
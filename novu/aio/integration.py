@@ -0,0 +1,70 @@
+"""
+This module is used to define the ``IntregrationApi``, an asynchronous python wrapper
+to interact with ``Integrations`` in Novu.
+"""
+
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.api.integration import _integration_payload, _list_url
+from novu.constants import INTEGRATIONS_ENDPOINT
+from novu.dto.integration import IntegrationChannelUsageDto, IntegrationDto
+from novu.enums import Channel, ProviderIdEnum
+
+
+class IntegrationApi(Api):
+    """This class aims to handle all API methods around integrations in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._integration_url = f"{self._url}{INTEGRATIONS_ENDPOINT}"
+
+    async def list(self, only_active: bool = False) -> AsyncIterator[IntegrationDto]:
+        """Asynchronous counterpart of :meth:`novu.api.IntegrationApi.list`."""
+        response = await self.handle_request("GET", _list_url(self._integration_url, only_active))
+        for result in response["data"]:
+            yield IntegrationDto.from_camel_case(result)
+
+    async def create(self, integration: IntegrationDto, check: bool = True) -> IntegrationDto:
+        """Asynchronous counterpart of :meth:`novu.api.IntegrationApi.create`."""
+        payload = _integration_payload(integration, check)
+        return IntegrationDto.from_camel_case(
+            (await self.handle_request("POST", self._integration_url, payload))["data"]
+        )
+
+    async def status(self, provider_id: ProviderIdEnum) -> bool:
+        """Asynchronous counterpart of :meth:`novu.api.IntegrationApi.status`."""
+        result = await self.handle_request("GET", f"{self._integration_url}/webhooks/provider/{provider_id}/status")
+        return result["data"]
+
+    async def update(self, integration: IntegrationDto, check: bool = True) -> IntegrationDto:
+        """Asynchronous counterpart of :meth:`novu.api.IntegrationApi.update`."""
+        payload = _integration_payload(integration, check)
+        return IntegrationDto.from_camel_case(
+            (await self.handle_request("PUT", f"{self._integration_url}/{integration._id}", payload))["data"]
+        )
+
+    async def delete(self, integration_id: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.IntegrationApi.delete`."""
+        await self.handle_request("DELETE", f"{self._integration_url}/{integration_id}")
+
+    async def limit(self, channel: Channel) -> IntegrationChannelUsageDto:
+        """Asynchronous counterpart of :meth:`novu.api.IntegrationApi.limit`."""
+        return IntegrationChannelUsageDto.from_camel_case(
+            (await self.handle_request("GET", f"{self._integration_url}/{channel}/limit"))["data"]
+        )
+
+    async def set_primary(self, integration_id: str) -> IntegrationDto:
+        """Asynchronous counterpart of :meth:`novu.api.IntegrationApi.set_primary`."""
+        return IntegrationDto.from_camel_case(
+            (await self.handle_request("POST", f"{self._integration_url}/{integration_id}/set-primary"))["data"]
+        )
@@ -0,0 +1,56 @@
+"""
+This module is used to define the ``LayoutApi``, an asynchronous python wrapper to interact with ``Layouts`` in Novu.
+"""
+
+from typing import Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.api.layout import _list_payload
+from novu.constants import LAYOUTS_ENDPOINT
+from novu.dto.layout import LayoutDto, PaginatedLayoutDto
+
+
+class LayoutApi(Api):
+    """This class aims to handle all API methods around layout in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._layout_url = f"{self._url}{LAYOUTS_ENDPOINT}"
+
+    async def list(self, page: Optional[int] = None, limit: Optional[int] = None) -> PaginatedLayoutDto:
+        """Asynchronous counterpart of :meth:`novu.api.LayoutApi.list`."""
+        payload = _list_payload(page, limit)
+        return PaginatedLayoutDto.from_camel_case(await self.handle_request("GET", self._layout_url, payload=payload))
+
+    async def create(self, layout: LayoutDto) -> LayoutDto:
+        """Asynchronous counterpart of :meth:`novu.api.LayoutApi.create`."""
+        return LayoutDto.from_camel_case(
+            (await self.handle_request("POST", self._layout_url, layout.to_camel_case()))["data"]
+        )
+
+    async def get(self, layout_id: str) -> LayoutDto:
+        """Asynchronous counterpart of :meth:`novu.api.LayoutApi.get`."""
+        return LayoutDto.from_camel_case((await self.handle_request("GET", f"{self._layout_url}/{layout_id}"))["data"])
+
+    async def patch(self, layout: LayoutDto) -> LayoutDto:
+        """Asynchronous counterpart of :meth:`novu.api.LayoutApi.patch`."""
+        return LayoutDto.from_camel_case(
+            (await self.handle_request("PATCH", f"{self._layout_url}/{layout._id}", layout.to_camel_case()))["data"]
+        )
+
+    async def delete(self, layout_id: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.LayoutApi.delete`."""
+        await self.handle_request("DELETE", f"{self._layout_url}/{layout_id}")
+
+    async def set_default(self, layout_id: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.LayoutApi.set_default`."""
+        await self.handle_request("POST", f"{self._layout_url}/{layout_id}/default")
@@ -0,0 +1,162 @@
+"""
+This module is used to define the ``MessageApi``, an asynchronous python wrapper to interact with ``Messages`` in Novu.
+"""
+
+from typing import Any, Dict, Iterable, Literal, Optional, Union, overload
+
+import httpx
+
+from novu.aio.base import Api, PaginationIterator
+from novu.api.base import _decode_page
+from novu.api.message import _filters_payload
+from novu.constants import DEFAULT_PAGE_SIZE, MESSAGES_ENDPOINT
+from novu.dto.message import MessageDto, PaginatedMessageDto
+
+
+class MessageApi(Api):
+    """This class aims to handle all API methods around messages in Novu"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._message_url = f"{self._url}{MESSAGES_ENDPOINT}"
+
+    # pylint: disable=duplicate-code
+    @overload
+    async def list(
+        self,
+        limit: int = 10,
+        page: int = 0,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedMessageDto: ...
+
+    @overload
+    async def list(
+        self,
+        limit: int = 10,
+        page: int = 0,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    async def list(
+        self,
+        limit: int = 10,
+        page: int = 0,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedMessageDto, dict]: ...
+
+    # pylint: enable=duplicate-code
+    async def list(
+        self,
+        limit: int = 10,
+        page: int = 0,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedMessageDto, dict]:
+        """Asynchronous counterpart of :meth:`novu.api.MessageApi.list`."""
+        payload = {"limit": limit, "page": page, **_filters_payload(channel, subscriber_id, transaction_id)}
+        data = await self.handle_request("GET", self._message_url, payload=payload)
+        return _decode_page(data, PaginatedMessageDto, MessageDto, raw, fields, exclude)
+
+    # pylint: disable=duplicate-code
+    @overload
+    def stream(
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[MessageDto]: ...
+
+    @overload
+    def stream(
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    # pylint: enable=duplicate-code
+    def stream(
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[MessageDto]:
+        """Stream all existing messages into an asynchronous iterator.
+
+        See :meth:`novu.api.MessageApi.stream` for the arguments (the pages are never read ahead).
+        """
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            MessageDto,
+            self._message_url,
+            payload=_filters_payload(channel, subscriber_id),
+            page_size=page_size,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
+
+    async def delete(self, message_id: str) -> bool:
+        """Asynchronous counterpart of :meth:`novu.api.MessageApi.delete`."""
+        result = await self.handle_request("DELETE", f"{self._message_url}/{message_id}")
+        return result["data"].get("acknowledged", False)
@@ -0,0 +1,221 @@
+"""This module is used to define the ``NotificationAPI`, an asynchronous python wrapper
+to interact with ``Notifications`` in Novu.
+"""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
+
+import httpx
+
+from novu.aio.base import Api, PaginationIterator
+from novu.api.base import _decode_page
+from novu.api.notification import _filters_payload
+from novu.constants import DEFAULT_PAGE_SIZE, NOTIFICATION_ENDPOINT
+from novu.dto.notification import (
+    ActivityGraphStatesDto,
+    ActivityNotificationDto,
+    PaginatedActivityNotificationDto,
+)
+
+
+class NotificationApi(Api):
+    """This class aims to handle all API methods around notifications in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._notification_url = f"{self._url}{NOTIFICATION_ENDPOINT}"
+
+    # pylint: disable=duplicate-code
+    @overload
+    async def list(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        page: Optional[int] = 0,
+        transaction_id: Optional[str] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedActivityNotificationDto: ...
+
+    @overload
+    async def list(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        page: Optional[int] = 0,
+        transaction_id: Optional[str] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    async def list(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        page: Optional[int] = 0,
+        transaction_id: Optional[str] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedActivityNotificationDto, dict]: ...
+
+    # pylint: enable=duplicate-code
+    async def list(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        page: Optional[int] = 0,
+        transaction_id: Optional[str] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedActivityNotificationDto, dict]:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationApi.list`."""
+        filters = _filters_payload(channels, templates, emails, subscriber_ids, search, transaction_id)
+        data = await self.handle_request("GET", f"{self._notification_url}", payload={**filters, "page": page})
+        return _decode_page(data, PaginatedActivityNotificationDto, ActivityNotificationDto, raw, fields, exclude)
+
+    # pylint: disable=duplicate-code
+    @overload
+    def stream(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[ActivityNotificationDto]: ...
+
+    @overload
+    def stream(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    # pylint: enable=duplicate-code
+    def stream(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[ActivityNotificationDto]:
+        """Stream all existing notifications into an asynchronous iterator.
+
+        See :meth:`novu.api.NotificationApi.stream` for the arguments (the pages are never read ahead).
+        """
+        # pylint: disable=duplicate-code
+        payload = _filters_payload(channels, templates, emails, subscriber_ids, search, transaction_id)
+        return PaginationIterator(
+            self,
+            ActivityNotificationDto,
+            self._notification_url,
+            payload=payload,
+            page_size=page_size,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
+
+    async def stats(self) -> Tuple[int, int]:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationApi.stats`."""
+        data = (await self.handle_request("GET", f"{self._notification_url}/stats"))["data"]
+        return data["weeklySent"], data["monthlySent"]
+
+    async def graph_stats(
+        self,
+        id: Optional[str] = None,  # pylint: disable=C0103,W0622
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        days: Optional[int] = None,
+    ) -> AsyncIterator[ActivityGraphStatesDto]:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationApi.graph_stats`."""
+        payload = {"id": id, "start_date": start_date, "end_date": end_date, "days": days}
+        response = await self.handle_request("GET", f"{self._notification_url}/graph/stats", payload=payload)
+        for data in response["data"]:
+            yield ActivityGraphStatesDto.from_camel_case(data)
+
+    async def get(self, notification_id: str) -> ActivityNotificationDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationApi.get`."""
+        url = f"{self._notification_url}/{notification_id}"
+        response = await self.handle_request("GET", url)
+        return ActivityNotificationDto.from_camel_case(response["data"])
@@ -0,0 +1,58 @@
+"""
+This module is used to define the ``NotificationGroupApi``, an asynchronous python wrapper
+to interact with ``NotificationGroup`` in Novu.
+"""
+
+from typing import Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.constants import NOTIFICATION_GROUPS_ENDPOINT
+from novu.dto.notification_group import (
+    NotificationGroupDto,
+    PaginatedNotificationGroupDto,
+)
+
+
+class NotificationGroupApi(Api):
+    """This class aims to handle all API methods around notification groups in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._notification_group_url = f"{self._url}{NOTIFICATION_GROUPS_ENDPOINT}"
+
+    async def list(self) -> PaginatedNotificationGroupDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationGroupApi.list`."""
+        return PaginatedNotificationGroupDto.from_camel_case(
+            await self.handle_request("GET", self._notification_group_url)
+        )
+
+    async def create(self, name: str) -> NotificationGroupDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationGroupApi.create`."""
+        return NotificationGroupDto.from_camel_case(
+            (await self.handle_request("POST", self._notification_group_url, {"name": name}))["data"]
+        )
+
+    async def get(self, _id: str) -> NotificationGroupDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationGroupApi.get`."""
+        return NotificationGroupDto.from_camel_case(
+            (await self.handle_request("GET", f"{self._notification_group_url}/{_id}"))["data"]
+        )
+
+    async def patch(self, _id: str, name: str) -> NotificationGroupDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationGroupApi.patch`."""
+        return NotificationGroupDto.from_camel_case(
+            (await self.handle_request("PATCH", f"{self._notification_group_url}/{_id}", {"name": name}))["data"]
+        )
+
+    async def delete(self, _id: str) -> NotificationGroupDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationGroupApi.delete`."""
+        return (await self.handle_request("DELETE", f"{self._notification_group_url}/{_id}"))["data"]
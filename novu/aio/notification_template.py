@@ -0,0 +1,176 @@
+"""
+This module is used to define the ``NotificationTemplateApi``, an asynchronous python wrapper
+to interact with ``NotificationTemplate`` in Novu.
+"""
+
+from typing import Any, Dict, Iterable, Literal, Optional, Union, overload
+
+import httpx
+
+from novu.aio.base import Api, PaginationIterator
+from novu.api.base import _decode_page
+from novu.api.notification_template import _list_payload
+from novu.constants import DEFAULT_PAGE_SIZE, NOTIFICATION_TEMPLATES_ENDPOINT
+from novu.dto.notification_template import (
+    NotificationTemplateDto,
+    NotificationTemplateFormDto,
+    PaginatedNotificationTemplateDto,
+)
+
+
+class NotificationTemplateApi(Api):
+    """This class aims to handle all API methods around notification templates in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._notification_template_url = f"{self._url}{NOTIFICATION_TEMPLATES_ENDPOINT}"
+
+    # pylint: disable=duplicate-code
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedNotificationTemplateDto: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedNotificationTemplateDto, dict]: ...
+
+    # pylint: enable=duplicate-code
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedNotificationTemplateDto, dict]:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationTemplateApi.list`."""
+        payload = _list_payload(page, limit)
+        data = await self.handle_request("GET", self._notification_template_url, payload=payload)
+        return _decode_page(data, PaginatedNotificationTemplateDto, NotificationTemplateDto, raw, fields, exclude)
+
+    # pylint: disable=duplicate-code
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[NotificationTemplateDto]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    # pylint: enable=duplicate-code
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[NotificationTemplateDto]:
+        """Stream all existing workflows into an asynchronous iterator.
+
+        See :meth:`novu.api.NotificationTemplateApi.stream` for the arguments (the pages are never read ahead).
+        """
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            NotificationTemplateDto,
+            self._notification_template_url,
+            page_size=page_size,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
+
+    async def create(self, notification_template: NotificationTemplateFormDto) -> NotificationTemplateDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationTemplateApi.create`."""
+        result = await self.handle_request(
+            "POST", self._notification_template_url, notification_template.to_camel_case()
+        )
+        return NotificationTemplateDto.from_camel_case(result["data"])
+
+    async def get(self, notification_template_id: str) -> NotificationTemplateDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationTemplateApi.get`."""
+        return NotificationTemplateDto.from_camel_case(
+            (await self.handle_request("GET", f"{self._notification_template_url}/{notification_template_id}"))["data"]
+        )
+
+    async def update(
+        self, notification_template_id: str, notification_template: NotificationTemplateFormDto
+    ) -> NotificationTemplateDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationTemplateApi.update`."""
+        result = await self.handle_request(
+            "PUT",
+            f"{self._notification_template_url}/{notification_template_id}",
+            notification_template.to_camel_case(),
+        )
+        return NotificationTemplateDto.from_camel_case(result["data"])
+
+    async def delete(self, notification_template_id: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationTemplateApi.delete`."""
+        await self.handle_request("DELETE", f"{self._notification_template_url}/{notification_template_id}")
+
+    async def update_status(self, notification_template_id: str, status: bool) -> NotificationTemplateDto:
+        """Asynchronous counterpart of :meth:`novu.api.NotificationTemplateApi.update_status`."""
+        result = await self.handle_request(
+            "PUT", f"{self._notification_template_url}/{notification_template_id}/status", {"active": status}
+        )
+        return NotificationTemplateDto.from_camel_case(result["data"])
@@ -0,0 +1,69 @@
+"""
+This module is used to define the ``OrganizationApi``, an asynchronous python wrapper
+to interact with ``Organizations`` in Novu.
+"""
+
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from novu.aio.base import Api
+from novu.api.organization import _create_payload
+from novu.constants import ORGANIZATION_ENDPOINT
+from novu.dto.member import MemberDto
+from novu.dto.organization import OrganizationBrandingDto, OrganizationDto
+
+
+class OrganizationApi(Api):
+    """This class aims to handle all API methods around organization in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._organization_url = f"{self._url}{ORGANIZATION_ENDPOINT}"
+
+    async def list(self) -> AsyncIterator[OrganizationDto]:
+        """Asynchronous counterpart of :meth:`novu.api.OrganizationApi.list`."""
+        results = (await self.handle_request("GET", self._organization_url))["data"]
+        for result in results:
+            yield OrganizationDto.from_camel_case(result)
+
+    async def create(self, name: str, logo: Optional[str] = None) -> OrganizationDto:
+        """Asynchronous counterpart of :meth:`novu.api.OrganizationApi.create`."""
+        payload = _create_payload(name, logo)
+        return OrganizationDto.from_camel_case(
+            (await self.handle_request("POST", self._organization_url, payload))["data"]
+        )
+
+    async def current(self) -> OrganizationDto:
+        """Asynchronous counterpart of :meth:`novu.api.OrganizationApi.current`."""
+        return OrganizationDto.from_camel_case(
+            (await self.handle_request("GET", f"{self._organization_url}/me"))["data"]
+        )
+
+    async def rename(self, name: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.OrganizationApi.rename`."""
+        await self.handle_request("PATCH", self._organization_url, {"name": name})
+
+    async def list_members(self) -> AsyncIterator[MemberDto]:
+        """Asynchronous counterpart of :meth:`novu.api.OrganizationApi.list_members`."""
+        results = (await self.handle_request("GET", f"{self._organization_url}/members"))["data"]
+        for result in results:
+            yield MemberDto.from_camel_case(result)
+
+    async def remove_member(self, member_id: str) -> MemberDto:
+        """Asynchronous counterpart of :meth:`novu.api.OrganizationApi.remove_member`."""
+        return MemberDto.from_camel_case(
+            (await self.handle_request("DELETE", f"{self._organization_url}/members/{member_id}"))["data"]
+        )
+
+    async def update_branding(self, branding: OrganizationBrandingDto) -> OrganizationBrandingDto:
+        """Asynchronous counterpart of :meth:`novu.api.OrganizationApi.update_branding`."""
+        result = await self.handle_request("PUT", f"{self._organization_url}/branding", json=branding.to_camel_case())
+        return OrganizationBrandingDto.from_camel_case(result["data"])
@@ -0,0 +1,267 @@
+"""
+This module is used to define the ``SubscriberApi``, an asynchronous python wrapper
+to interact with ``Subscribers`` in Novu.
+"""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
+
+import httpx
+
+from novu.aio.base import Api, PaginationIterator
+from novu.api.base import _decode_page, _page_params
+from novu.api.subscriber import (
+    _credentials_payload,
+    _mark_all_as_payload,
+    _mark_as_payload,
+    _message_action_payload,
+)
+from novu.constants import DEFAULT_PAGE_SIZE, SUBSCRIBERS_ENDPOINT
+from novu.dto.message import MessageDto
+from novu.dto.subscriber import (
+    BulkResultSubscriberDto,
+    PaginatedSubscriberDto,
+    SubscriberDto,
+    SubscriberPreferenceDto,
+)
+from novu.enums import Channel, MarkAsEnum, MessageActionStatus, ProviderIdEnum
+
+
+class SubscriberApi(Api):
+    """This class aims to handle all API methods around subscribers in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._subscriber_url = f"{self._url}{SUBSCRIBERS_ENDPOINT}"
+
+    # pylint: disable=duplicate-code
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedSubscriberDto: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedSubscriberDto, dict]: ...
+
+    # pylint: enable=duplicate-code
+    async def list(
+        self,
+        page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedSubscriberDto, dict]:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.list`."""
+        data = await self.handle_request("GET", self._subscriber_url, payload=_page_params(page, None))
+        return _decode_page(data, PaginatedSubscriberDto, SubscriberDto, raw, fields, exclude)
+
+    # pylint: disable=duplicate-code
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[SubscriberDto]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    # pylint: enable=duplicate-code
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[SubscriberDto]:
+        """Stream all existing subscribers into an asynchronous iterator.
+
+        See :meth:`novu.api.SubscriberApi.stream` for the arguments (the pages are never read ahead).
+        """
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            SubscriberDto,
+            self._subscriber_url,
+            page_size=page_size,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
+
+    async def create(self, subscriber: SubscriberDto) -> SubscriberDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.create`."""
+        result = await self.handle_request("POST", self._subscriber_url, subscriber.to_camel_case())
+        return SubscriberDto.from_camel_case(result.get("data", {}))
+
+    async def bulk_create(self, subscribers: Iterator[SubscriberDto]) -> BulkResultSubscriberDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.bulk_create`."""
+        payload = {"subscribers": [subscriber.to_camel_case() for subscriber in subscribers]}
+        result = await self.handle_request("POST", f"{self._subscriber_url}/bulk", payload)
+        return BulkResultSubscriberDto.from_camel_case(result.get("data", {}))
+
+    async def get(self, subscriber_id: str) -> SubscriberDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.get`."""
+        result = await self.handle_request("GET", f"{self._subscriber_url}/{subscriber_id}")
+        return SubscriberDto.from_camel_case(result.get("data", {}))
+
+    async def put(self, subscriber: SubscriberDto) -> SubscriberDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.put`."""
+        url = f"{self._subscriber_url}/{subscriber.subscriber_id}"
+        result = await self.handle_request("PUT", url, subscriber.to_camel_case())
+        return SubscriberDto.from_camel_case(result.get("data", {}))
+
+    async def delete(self, subscriber_id: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.delete`."""
+        await self.handle_request("DELETE", f"{self._subscriber_url}/{subscriber_id}")
+
+    async def credentials(
+        self,
+        subscriber_id: str,
+        provider_id: str,
+        webhook_url: Optional[str] = None,
+        device_tokens: Optional[List[str]] = None,
+    ) -> SubscriberDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.credentials`."""
+        payload = _credentials_payload(provider_id, webhook_url, device_tokens)
+        result = await self.handle_request("PUT", f"{self._subscriber_url}/{subscriber_id}/credentials", payload)
+        return SubscriberDto.from_camel_case(result.get("data", {}))
+
+    async def delete_credentials(
+        self,
+        subscriber_id: str,
+        provider_id: ProviderIdEnum,
+    ) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.delete_credentials`."""
+        await self.handle_request("DELETE", f"{self._subscriber_url}/{subscriber_id}/credentials/{provider_id}")
+
+    async def online_status(self, subscriber_id: str, status: bool) -> SubscriberDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.online_status`."""
+        url = f"{self._subscriber_url}/{subscriber_id}/online-status"
+        result = await self.handle_request("PATCH", url, {"isOnline": status})
+        return SubscriberDto.from_camel_case(result.get("data", {}))
+
+    async def preferences(self, subscriber_id: str) -> AsyncIterator[SubscriberPreferenceDto]:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.preferences`."""
+        result = await self.handle_request("GET", f"{self._subscriber_url}/{subscriber_id}/preferences")
+        for preference in result.get("data", []):
+            yield SubscriberPreferenceDto.from_camel_case(preference)
+
+    async def change_channel_preference(
+        self, subscriber_id: str, template_id: str, channel: Channel, channel_enabled: bool
+    ) -> SubscriberPreferenceDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.change_channel_preference`."""
+        url = f"{self._subscriber_url}/{subscriber_id}/preferences/{template_id}"
+        result = await self.handle_request("PATCH", url, {"channel": {"type": channel, "enabled": channel_enabled}})
+        return SubscriberPreferenceDto.from_camel_case(result.get("data", {}))
+
+    async def change_preference_state(
+        self, subscriber_id: str, template_id: str, state: bool
+    ) -> SubscriberPreferenceDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.change_preference_state`."""
+        url = f"{self._subscriber_url}/{subscriber_id}/preferences/{template_id}"
+        result = await self.handle_request("PATCH", url, {"enabled": state})
+        return SubscriberPreferenceDto.from_camel_case(result.get("data", {}))
+
+    async def unseen_notifications(self, subscriber_id: str) -> int:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.unseen_notifications`."""
+        res = await self.handle_request("GET", f"{self._subscriber_url}/{subscriber_id}/notifications/unseen")
+        return res.get("data", {}).get("count", 0)
+
+    async def mark_as(
+        self, subscriber_id: str, message_id: str, seen: Optional[bool] = None, read: Optional[bool] = None
+    ) -> MessageDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.mark_as`."""
+        payload = _mark_as_payload(message_id, seen, read)
+        result = await self.handle_request(
+            "POST", f"{self._subscriber_url}/{subscriber_id}/messages/markAs", json=payload
+        )
+        return MessageDto.from_camel_case(result["data"][0])
+
+    async def mark_all_as(
+        self, subscriber_id: str, mark_as: MarkAsEnum, feed_identifiers: Optional[List[str]] = None
+    ) -> int:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.mark_all_as`."""
+        payload = _mark_all_as_payload(mark_as, feed_identifiers)
+        result = await self.handle_request(
+            "POST", f"{self._subscriber_url}/{subscriber_id}/messages/mark-all", json=payload
+        )
+        return result.get("data", 0)
+
+    async def mark_message_action(
+        self,
+        subscriber_id: str,
+        message_id: str,
+        action_type: str,
+        status: MessageActionStatus,
+        payload: Optional[dict] = None,
+    ) -> MessageDto:
+        """Asynchronous counterpart of :meth:`novu.api.SubscriberApi.mark_message_action`."""
+        url = f"{self._subscriber_url}/{subscriber_id}/messages/{message_id}/actions/{action_type}"
+        result = await self.handle_request("POST", url, json=_message_action_payload(status, payload))
+        return MessageDto.from_camel_case(result.get("data", {}))
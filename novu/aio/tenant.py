@@ -0,0 +1,159 @@
+"""
+This module is used to define the ``TenantApi``, an asynchronous python wrapper to interact with ``Tenants`` in Novu.
+"""
+
+from typing import Any, Dict, Iterable, Literal, Optional, Union, overload
+
+import httpx
+
+from novu.aio.base import Api, PaginationIterator
+from novu.api.base import _decode_page, _page_params
+from novu.api.tenant import _patch_payload
+from novu.constants import DEFAULT_PAGE_SIZE, TENANTS_ENDPOINT
+from novu.dto.tenant import PaginatedTenantDto, TenantDto
+
+
+class TenantApi(Api):
+    """This class aims to handle all API methods around tenants in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._tenant_url = f"{self._url}{TENANTS_ENDPOINT}"
+
+    # pylint: disable=duplicate-code
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedTenantDto: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedTenantDto, dict]: ...
+
+    # pylint: enable=duplicate-code
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedTenantDto, dict]:
+        """Asynchronous counterpart of :meth:`novu.api.TenantApi.list`."""
+        data = await self.handle_request("GET", self._tenant_url, payload=_page_params(page, limit))
+        return _decode_page(data, PaginatedTenantDto, TenantDto, raw, fields, exclude)
+
+    # pylint: disable=duplicate-code
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[TenantDto]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    # pylint: enable=duplicate-code
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[TenantDto]:
+        """Stream all existing tenants into an asynchronous iterator.
+
+        See :meth:`novu.api.TenantApi.stream` for the arguments (the pages are never read ahead).
+        """
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            TenantDto,
+            self._tenant_url,
+            page_size=page_size,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
+
+    async def create(self, identifier: str, name: str, data: Optional[dict] = None) -> TenantDto:
+        """Asynchronous counterpart of :meth:`novu.api.TenantApi.create`."""
+        result = await self.handle_request(
+            "POST", self._tenant_url, {"identifier": identifier, "name": name, "data": data or {}}
+        )
+        return TenantDto.from_camel_case(result["data"])
+
+    async def get(self, identifier: str) -> TenantDto:
+        """Asynchronous counterpart of :meth:`novu.api.TenantApi.get`."""
+        return TenantDto.from_camel_case((await self.handle_request("GET", f"{self._tenant_url}/{identifier}"))["data"])
+
+    async def patch(
+        self, reference: str, identifier: Optional[str] = None, name: Optional[str] = None, data: Optional[dict] = None
+    ) -> TenantDto:
+        """Asynchronous counterpart of :meth:`novu.api.TenantApi.patch`."""
+        payload = _patch_payload(identifier, name, data)
+        return TenantDto.from_camel_case(
+            (await self.handle_request("PATCH", f"{self._tenant_url}/{reference}", payload))["data"]
+        )
+
+    async def delete(self, identifier: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.TenantApi.delete`."""
+        await self.handle_request("DELETE", f"{self._tenant_url}/{identifier}")
@@ -0,0 +1,77 @@
+"""
+This module is used to define the ``TopicApi``, an asynchronous python wrapper to interact with ``Topics`` in Novu.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from novu.aio.base import Api
+from novu.api.topic import _list_payload, _subscribers_payload
+from novu.constants import TOPICS_ENDPOINT
+from novu.dto.topic import PaginatedTopicDto, TopicDto
+
+
+class TopicApi(Api):
+    """This class aims to handle all API methods around topics in API"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        requests_timeout: Optional[int] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(url, api_key, requests_timeout, session)
+
+        self._topic_url = f"{self._url}{TOPICS_ENDPOINT}"
+
+    async def list(
+        self, page: Optional[int] = None, limit: Optional[int] = None, key: Optional[str] = None
+    ) -> PaginatedTopicDto:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.list`."""
+        payload = _list_payload(page, limit, key)
+        return PaginatedTopicDto.from_camel_case(await self.handle_request("GET", self._topic_url, payload=payload))
+
+    async def create(self, key: str, name: str) -> TopicDto:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.create`."""
+        return TopicDto.from_camel_case(
+            (await self.handle_request("POST", self._topic_url, TopicDto(key, name).to_camel_case()))["data"]
+        )
+
+    async def get(self, key: str) -> TopicDto:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.get`."""
+        return TopicDto.from_camel_case((await self.handle_request("GET", f"{self._topic_url}/{key}"))["data"])
+
+    # FIXME: In documentation, doesn't return anything. But in real life ?
+    async def subscribe(self, key: str, subscribers: Union[List[str], str]) -> Tuple[List[str], Dict[str, List[str]]]:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.subscribe`."""
+        payload = _subscribers_payload(subscribers)
+        result = await self.handle_request("POST", f"{self._topic_url}/{key}/subscribers", payload)
+        return result["data"].get("succeeded", []), result["data"].get("failed", {})
+
+    async def unsubscribe(self, key: str, subscribers: Union[List[str], str]) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.unsubscribe`."""
+        payload = _subscribers_payload(subscribers)
+        await self.handle_request("POST", f"{self._topic_url}/{key}/subscribers/removal", payload)
+
+    async def rename(self, key: str, name: str) -> TopicDto:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.rename`."""
+        return TopicDto.from_camel_case(
+            (await self.handle_request("PATCH", f"{self._topic_url}/{key}", {"name": name}))["data"]
+        )
+
+    async def delete(self, key: str) -> None:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.delete`."""
+
+        await self.handle_request("DELETE", f"{self._topic_url}/{key}")
+
+    async def subscribed(self, key: str, subscriber_id: str) -> bool:
+        """Asynchronous counterpart of :meth:`novu.api.TopicApi.subscribed`."""
+        try:
+            await self.handle_request("GET", f"{self._topic_url}/{key}/subscribers/{subscriber_id}")
+            return True
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return False
+            raise exc
@@ -2,49 +2,399 @@
 
 import copy
 import logging
+import math
 import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from json.decoder import JSONDecodeError
-from typing import Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import pkg_resources
 import requests
-
+from requests.adapters import HTTPAdapter
+
+from novu.circuit_breaker import CircuitBreaker, CircuitToken
+from novu.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    AsyncAdaptiveConcurrencyLimiter,
+    Lease,
+)
 from novu.config import NovuConfig
-from novu.dto.base import CamelCaseDto
-from novu.helpers import SentryProxy
+from novu.constants import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    MAX_PAGE_SIZE,
+)
+from novu.dto.base import CamelCaseDto, get_decoder
+from novu.dto.columns import Columns
+from novu.helpers import SentryProxy, Singleton
+from novu.rate_limit import RateLimiter
+from novu.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from novu.transport import RequestsTransport, Transport
 
 LOGGER = logging.getLogger(__name__)
 
 __version__ = pkg_resources.get_distribution("novu").version
 _C_co = TypeVar("_C_co", bound=CamelCaseDto, covariant=True)
+_P = TypeVar("_P", bound=CamelCaseDto)
+
+
+class _Response(Protocol):
+    """The part of the responses of :mod:`requests` and :mod:`httpx` read to parse them."""
+
+    status_code: int
+
+    def json(self, **kwargs: Any) -> Any:  # pylint: disable=C0116
+        ...
+
+    def raise_for_status(self) -> Any:  # pylint: disable=C0116
+        ...
+
+
+def _has_more(data: dict, pages: int, limit: int) -> bool:
+    """Check if there are remaining pages after a paginated response, knowing the number of pages already fetched.
+
+    The pages are counted with the page size of the response (if any), as the server can cap the requested one.
+    """
+    return data.get("hasMore", data.get("totalCount", 0) > pages * (data.get("pageSize") or limit))
+
+
+def _cursor(page: int, index: int, limit: int) -> Dict[str, int]:
+    """Build a serializable cursor on the item at the given index of the given page."""
+    return {"page": page, "index": index, "page_size": limit}
+
+
+def _resume_position(cursor: Dict[str, int], limit: int) -> Tuple[int, int]:
+    """Compute the page to fetch first and the number of its items to skip to resume at the given cursor.
+
+    The cursor can have been built with another page size, as the position is computed from the items offset.
+    """
+    return divmod(cursor["page"] * cursor["page_size"] + cursor["index"], limit)
+
+
+def _project_items(
+    data: dict, item_class: Type[CamelCaseDto], fields: Optional[Iterable[str]], exclude: Optional[Iterable[str]]
+) -> dict:
+    """Parse the items of a paginated response with the given projection of their fields (if any), before the
+    response is parsed into its paginated Dto."""
+    if fields is None and not exclude:
+        return data
+
+    decode = get_decoder(item_class, fields, exclude)
+    return {**data, "data": [decode(item) if isinstance(item, dict) else item for item in data.get("data") or []]}
+
+
+def _page_params(page: Optional[int], limit: Optional[int]) -> Dict[str, int]:
+    """Build the query params selecting a page of a listing, skipping the page and the limit left unset (or zero)."""
+    params: Dict[str, int] = {}
+    if page:
+        params["page"] = page
+    if limit:
+        params["limit"] = limit
+    return params
+
+
+def _decode_page(
+    data: dict,
+    page_class: Type[_P],
+    item_class: Type[CamelCaseDto],
+    raw: bool,
+    fields: Optional[Iterable[str]],
+    exclude: Optional[Iterable[str]],
+) -> Union[_P, dict]:
+    """Parse a paginated response into its paginated Dto, with the given projection of the fields of its items,
+    unless the JSON response is requested as is."""
+    if raw:
+        return data
+    return page_class.from_camel_case(_project_items(data, item_class, fields, exclude))
+
+
+def _client_settings(
+    url: Optional[str], api_key: Optional[str], requests_timeout: Optional[int]
+) -> Tuple[str, str, Dict[str, str], int]:
+    """Resolve the base URL, the API key and the timeout of an API class (falling back on the configuration and the
+    ``NOVU_PYTHON_REQUESTS_TIMEOUT`` environment variable), along with the headers authenticating its requests."""
+    config = NovuConfig()
+
+    url = url or config.url
+    api_key = api_key or config.api_key
+    headers = {
+        "Authorization": f"ApiKey {api_key}",
+        "User-Agent": f"novu/python@{__version__}",
+    }
+    return url, api_key, headers, requests_timeout or int(os.getenv("NOVU_PYTHON_REQUESTS_TIMEOUT", "5"))
+
+
+def _merge_headers(defaults: Dict[str, str], headers: Optional[dict]) -> Dict[str, str]:
+    """Merge the headers given to a request over the default headers of the API class, without altering them."""
+    if not headers:
+        return defaults
+    return {**copy.deepcopy(defaults), **copy.deepcopy(headers)}
+
+
+def _parse_response(res: "_Response", failed: bool) -> dict:
+    """Raise the error of a failed response (reporting its details to Sentry), or parse its JSON body."""
+    if failed:
+        try:
+            detail = res.json()
+            SentryProxy().set_extra("error_details", detail)
+        except JSONDecodeError:
+            pass
+        res.raise_for_status()
+
+    if res.status_code == 204:
+        return {}
+
+    return res.json()
+
+
+def _release_guards(
+    breaker: Optional[CircuitBreaker],
+    token: Optional[CircuitToken],
+    limiter: Optional[Union[AdaptiveConcurrencyLimiter, AsyncAdaptiveConcurrencyLimiter]],
+    lease: Optional[Lease],
+    status: Optional[int],
+) -> None:
+    """Record the outcome of a request in its circuit breaker and concurrency limiter, given its status code (or
+    ``None`` if no response was received).
+
+    The token of the circuit breaker is acquired after the lease of the limiter, right before sending the request:
+    without token, the request was not sent and its lease is freed without adapting the limit."""
+    failed = status is None or status >= 500
+    if limiter and lease:
+        limiter.release(lease, failed or status == 429, sent=token is not None or breaker is None)
+    if breaker and token:
+        breaker.release(token, failed)
+
+
+def _read_ahead(
+    fetch: Callable[[int], dict],
+    page: int,
+    limit: int,
+    pages: "queue.Queue[Tuple[dict, Optional[Exception]]]",
+    slots: threading.Semaphore,
+    stop: threading.Event,
+) -> None:
+    """Fetch pages from the given one into the queue, until the last page or a stop request.
+
+    A slot must be acquired before each fetch and is released by the consumer once the page is taken from the
+    queue, which bounds the number of pages read ahead. Each item put in the queue is a couple of the page data
+    and the error raised during the fetch (if any).
+
+    This function does not hold any reference on the iterator, so the iterator can be garbage collected
+    (and then stop this function) even if the consumer forgot to close it.
+    """
+    while not stop.is_set():
+        if not slots.acquire(timeout=0.1):
+            continue
+
+        try:
+            data, error = fetch(page), None
+        except Exception as exc:  # pylint: disable=W0703
+            data, error = {}, exc
+
+        page += 1
+        pages.put((data, error))
+
+        if error is not None or not _has_more(data, page, limit):
+            return
+
+
+def _fan_out(fetch: Callable[[int], dict], pages: range, parallel: int, ordered: bool) -> Iterator[dict]:
+    """Fetch the given pages on a pool of threads, with at most ``parallel`` pages in flight or not yet consumed.
+
+    Pages are yielded in the order of the given range if ``ordered``, otherwise as soon as they are fetched. An
+    error raised by a fetch is raised to the consumer, once the requests in flight are over.
+    """
+    remaining = iter(pages)
+    pending: Deque["Future[dict]"] = deque()
+
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="novu-pagination-fan-out") as executor:
+        try:
+            for page in islice(remaining, parallel):
+                pending.append(executor.submit(fetch, page))
+
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+
+                data = future.result()
+                for page in islice(remaining, 1):
+                    pending.append(executor.submit(fetch, page))
+                yield data
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class _PageBuffer(Generic[_C_co]):
+    """The decoded items of the page consumed by a pagination iterator, along with the position of the iterator.
+
+    It holds the state shared by the synchronous and asynchronous iterators, which only differ by the way they
+    fetch the pages.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        item_class: Type[_C_co],
+        page_size: int,
+        resume_from: Optional[Dict[str, int]],
+        raw: bool,
+        view: bool,
+        fields: Optional[Iterable[str]],
+        exclude: Optional[Iterable[str]],
+    ):
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"The page size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}.")
+
+        self.item_class = item_class
+        self.limit = page_size
+        self.page, self.skip = _resume_position(resume_from, page_size) if resume_from else (0, 0)
+        self.items: List[_C_co] = []
+        self.index = 0
+
+        self.__decoder = None if raw else item_class.view() if view else get_decoder(item_class, fields, exclude)
+
+    @property
+    def remaining(self) -> int:
+        """The number of items of the page not returned yet."""
+        return len(self.items) - self.index
+
+    def load(self, data: dict) -> bool:
+        """Replace the consumed page by the given response (skipping the items before the resumed position, if
+        any), and tell if there are pages left to fetch after it."""
+        self.page += 1
+        self.items = self.decode(data.get("data", []))
+        self.index, self.skip = self.skip, 0
+        return _has_more(data, self.page, self.limit)
+
+    def decode(self, items: list) -> list:
+        """Build the Dto (or views) of the given items of a response, unless the raw items are requested."""
+        return items if self.__decoder is None else list(map(self.__decoder, items))
+
+    def pop(self) -> _C_co:
+        """Return the next item of the page, releasing the page once fully consumed."""
+        result, self.index = self.items[self.index], self.index + 1
+        if self.index == len(self.items):
+            self.items, self.index = [], 0
+        return result
+
+    def take(self, count: int) -> List[_C_co]:
+        """Return the given number of items from the page, releasing the page once fully consumed."""
+        start, self.index = self.index, self.index + count
+        if self.index < len(self.items):
+            return self.items[start : self.index]
+
+        items = self.items if start == 0 else self.items[start:]
+        self.items, self.index = [], 0
+        return items
+
+    def fill(self, batch: List[_C_co], size: int) -> bool:
+        """Move items of the page to the given batch until it holds ``size`` items, and tell if it is full."""
+        batch.extend(self.take(min(size - len(batch), self.remaining)))
+        return len(batch) == size
+
+    def checkpoint(self) -> Dict[str, int]:
+        """Build the cursor on the next item to return."""
+        if self.remaining > 0:
+            return _cursor(self.page - 1, self.index, self.limit)
+        return _cursor(self.page, self.skip, self.limit)
 
 
 class PaginationIterator(Generic[_C_co]):  # pylint: disable=R0902
     """The class is a generic iterator which allow to iterate directly on result without
     looking for pagination during handling.
 
+    When ``prefetch`` is set, the next pages are fetched on a background thread while the current one is
+    consumed. At most ``prefetch`` pages are kept in memory ahead of the consumer, and the background thread
+    stops as soon as the iterator is closed (explicitly, using a ``with`` statement or when garbage collected).
+
+    No request is sent until the first item is requested. The position of the iterator can be saved at any time
+    using :meth:`checkpoint`, and restored in a new iterator using ``resume_from``.
+
+    Example:
+        >>> with SubscriberApi().stream(prefetch=2) as subscribers:
+        ...     for subscriber in subscribers:
+        ...         print(subscriber.subscriber_id)
+
     Args:
         api: The api used to call
         item_class: The Dto to parse each items return by API.
         url: The URL to query during fetch.
         payload: Payload to query during fetch.
+        page_size: The number of items to fetch per request, up to the server maximum (``MAX_PAGE_SIZE``).
+        prefetch: The number of pages to read ahead in background. Defaults to 0 (disabled).
+        resume_from: A cursor returned by :meth:`checkpoint`, to resume the iteration where it was saved.
+        raw: If ``True``, the items are the JSON objects returned by the API, without building the Dto.
+        view: If ``True``, the items are read-only views on the JSON objects returned by the API
+            (see :class:`~novu.dto.base.DtoView`).
+        fields: The only fields of the Dto to parse (see :func:`~novu.dto.base.get_decoder`).
+        exclude: The fields of the Dto to skip (see :func:`~novu.dto.base.get_decoder`).
+
+    Raises:
+        ValueError: If the page size is not between 1 and the server maximum, if prefetch is negative, or if a
+            field to parse or to skip is not defined by the Dto.
     """
 
-    def __init__(self, api: "Api", item_class: Type[_C_co], url: str, payload: Optional[dict] = None):
-        self.__item_class = item_class
+    def __init__(
+        self,
+        api: "Api",
+        item_class: Type[_C_co],
+        url: str,
+        payload: Optional[dict] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ):
+        self.__stop = threading.Event()
+
+        self.__buffer = _PageBuffer(item_class, page_size, resume_from, raw, view, fields, exclude)
+        if prefetch < 0:
+            raise ValueError(f"The number of pages to prefetch must be positive, got {prefetch}.")
+
         self.__api = api
         self.__url = url
         self.__payload = payload or {}
 
-        self.__has_more = False
-        self.__page = 0
-        self.__limit = 10
-        self.__index = 0
-        self.__buffer: List[_C_co] = []
+        self.__has_more = True
+        self.__started = False
+        self.__total_count: Optional[int] = None
+        self.__server_page_size = page_size
+
+        self.__prefetch = prefetch
+        self.__pages: "queue.Queue[Tuple[dict, Optional[Exception]]]" = queue.Queue()
+        self.__slots = threading.Semaphore(prefetch)
+        self.__thread: Optional[threading.Thread] = None
 
-        self.__payload["limit"] = self.__limit
-        self.__payload["page"] = self.__page
-        self.__fetch_data()
+        self.__payload["limit"] = page_size
 
     def __iter__(self) -> "PaginationIterator[_C_co]":
         return self
@@ -52,33 +402,300 @@ class PaginationIterator(Generic[_C_co]):  # pylint: disable=R0902
     def __next__(self) -> _C_co:
         return self.next()
 
+    def __enter__(self) -> "PaginationIterator[_C_co]":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
     def next(self) -> _C_co:
         """Implementation of the next behavior for the iterator."""
-        if self.__index < len(self.__buffer):
-            result, self.__index = self.__buffer[self.__index], self.__index + 1
-            return result
+        if not self.__fill():
+            raise StopIteration()
 
-        if self.__has_more:
-            self.__fetch_data()
+        return self.__buffer.pop()
 
-            result, self.__index = self.__buffer[self.__index], self.__index + 1
-            return result
+    def pages(self) -> Iterator[List[_C_co]]:
+        """Iterate over the remaining items page by page, instead of one item at a time.
 
-        raise StopIteration()
+        Each fetched page is yielded as is (without its items already returned by the iterator) and released
+        by the iterator, to avoid the overhead of a call per item.
 
-    def __fetch_data(self):
-        self.__payload["page"] = self.__page
-        self.__page += 1
+        Example:
+            >>> with SubscriberApi().stream(page_size=100) as subscribers:
+            ...     for page in subscribers.pages():
+            ...         print(len(page))
 
-        data = self.__api.handle_request(
-            method="GET",
-            url=self.__url,
-            payload=self.__payload,
-        )
+        Returns:
+            An iterator on the lists of items of each page.
+        """
+        while self.__fill():
+            yield self.__buffer.take(self.__buffer.remaining)
+
+    def batches(self, size: int) -> Iterator[List[_C_co]]:
+        """Iterate over the remaining items by lists of the given size, whatever the page size.
+
+        Only the last batch can be smaller than the requested size. A checkpoint taken after a batch is
+        yielded points to the first item of the next batch.
+
+        Example:
+            >>> with SubscriberApi().stream(page_size=100) as subscribers:
+            ...     for batch in subscribers.batches(500):
+            ...         insert_into_database(batch)
+
+        Args:
+            size: The number of items in each batch.
+
+        Returns:
+            An iterator on the lists of items.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        if size < 1:
+            raise ValueError(f"The batch size must be positive, got {size}.")
+
+        return self.__batches(size)
+
+    def columns(
+        self, size: int, fields: Optional[Iterable[str]] = None, categorical: Optional[Iterable[str]] = None
+    ) -> Iterator[Columns]:
+        """Iterate over the remaining items by batches of the given size, in columnar representation.
+
+        Example:
+            >>> with MessageApi().stream(page_size=100) as messages:
+            ...     for columns in messages.columns(10000):
+            ...         print(collections.Counter(columns["channel"]))
+
+        Args:
+            size: The number of items in each batch.
+            fields: The fields to store (see :meth:`~novu.dto.columns.Columns.from_items`). Defaults to all fields.
+            categorical: The fields to encode (see :meth:`~novu.dto.columns.Columns.from_items`). Defaults to the
+                ``categorical_fields`` of the Dto.
 
-        self.__has_more = data.get("hasMore", data.get("totalCount", 0) > (self.__page + 1 * self.__limit))
-        self.__buffer = list(map(self.__item_class.from_camel_case, data.get("data", [])))
-        self.__index = 0
+        Returns:
+            An iterator on the columns of each batch.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        item_class = self.__buffer.item_class
+        return (Columns.from_items(item_class, batch, fields, categorical) for batch in self.batches(size))
+
+    def fetch_all(self, parallel: int = 4, ordered: bool = True) -> Iterator[_C_co]:
+        """Fetch all the remaining pages in parallel, instead of one after another.
+
+        The total count and the page size returned with the first page are used to schedule the requests of all
+        the remaining pages on a pool of threads. At most ``parallel`` requests are in flight (or fetched but
+        not yet consumed) at once.
+
+        If the API does not return the total count of items, or if the background read-ahead has already
+        started, the remaining items are yielded sequentially.
+
+        Example:
+            >>> with SubscriberApi().stream(page_size=100) as subscribers:
+            ...     for subscriber in subscribers.fetch_all(parallel=8):
+            ...         print(subscriber.subscriber_id)
+
+        Args:
+            parallel: The maximum number of pages to fetch concurrently. Defaults to 4.
+            ordered: If ``True`` (the default), the items are yielded in the order of the pages. Otherwise, the
+                items of each page are yielded as soon as the page is fetched.
+
+        Returns:
+            An iterator on all the remaining items.
+
+        Raises:
+            ValueError: If the number of parallel requests is not positive.
+        """
+        if parallel < 1:
+            raise ValueError(f"The number of parallel requests must be positive, got {parallel}.")
+
+        return self.__fetch_all(parallel, ordered)
+
+    def checkpoint(self) -> Dict[str, int]:
+        """Save the position of the iterator, to resume the iteration later (e.g. after a restart).
+
+        The returned cursor is a JSON serializable dictionary, pointing to the next item to return. It can be
+        given as ``resume_from`` to a new iterator on the same resource, even with another page size.
+
+        Items returned by :meth:`fetch_all` are not tracked by the cursor.
+
+        Example:
+            >>> subscribers = SubscriberApi().stream()
+            >>> ...
+            >>> cursor = subscribers.checkpoint()  # Saved in a file, a database...
+            >>> subscribers = SubscriberApi().stream(resume_from=cursor)
+
+        Returns:
+            The cursor on the next item to return.
+        """
+        return self.__buffer.checkpoint()
+
+    def close(self) -> None:
+        """Stop the iteration and the background read-ahead, if any.
+
+        The background thread ends after its in-flight request, without waiting for it.
+        """
+        self.__has_more = False
+        self.__stop.set()
+
+    def __batches(self, size: int) -> Iterator[List[_C_co]]:
+        batch: List[_C_co] = []
+        while self.__fill():
+            if self.__buffer.fill(batch, size):
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def __fill(self) -> bool:
+        """Load the next page if the current one is consumed, and tell if there are items left to return."""
+        if self.__stop.is_set():
+            return False
+
+        if not self.__buffer.remaining and self.__has_more:
+            self.__load_page(self.__next_page_data())
+
+        return self.__buffer.remaining > 0
+
+    def __fetch_all(self, parallel: int, ordered: bool) -> Iterator[_C_co]:
+        if not self.__started and self.__has_more:
+            self.__load_page(self.__next_page_data())
+
+        if self.__total_count is None or self.__thread is not None:
+            yield from self
+            return
+
+        buffer = self.__buffer
+        yield from buffer.take(buffer.remaining)
+
+        if not self.__has_more:
+            return
+
+        # The server can cap the page size below the requested one, its pages are then counted with its own size
+        last_page = math.ceil(self.__total_count / self.__server_page_size)
+        pages, buffer.page, self.__has_more = range(buffer.page, last_page), last_page, False
+        for data in _fan_out(self.__fetcher(), pages, parallel, ordered):
+            yield from buffer.decode(data.get("data", []))
+
+    def __next_page_data(self) -> dict:
+        if self.__thread is None:
+            return self.__fetch_data(self.__buffer.page)
+
+        data, error = self.__pages.get()
+        self.__slots.release()
+        if error is not None:
+            self.close()
+            raise error
+        return data
+
+    def __load_page(self, data: dict) -> None:
+        self.__has_more = self.__buffer.load(data)
+        self.__total_count = data.get("totalCount")
+        self.__server_page_size = data.get("pageSize") or self.__buffer.limit
+        self.__started = True
+
+        if self.__has_more and self.__prefetch and self.__thread is None:
+            self.__thread = threading.Thread(
+                target=_read_ahead,
+                args=(
+                    self.__fetcher(),
+                    self.__buffer.page,
+                    self.__buffer.limit,
+                    self.__pages,
+                    self.__slots,
+                    self.__stop,
+                ),
+                name="novu-pagination-read-ahead",
+                daemon=True,
+            )
+            self.__thread.start()
+
+    def __fetcher(self) -> Callable[[int], dict]:
+        api, url, payload = self.__api, self.__url, dict(self.__payload)
+
+        def fetch(page: int) -> dict:
+            return api.handle_request(method="GET", url=url, payload={**payload, "page": page})
+
+        return fetch
+
+    def __fetch_data(self, page: int) -> dict:
+        return self.__fetcher()(page)
+
+
+class SessionPool(metaclass=Singleton):
+    """Process-wide registry of keep-alive :class:`~requests.Session` shared by all API classes.
+
+    A session is created on first use for each couple of base URL and API key, then reused by every API
+    instance targeting the same Novu server with the same credentials. This avoids a new TCP/TLS handshake
+    on each request.
+
+    The size of the connection pools can be tuned using :meth:`configure` or the environment variables
+    ``NOVU_PYTHON_POOL_CONNECTIONS`` and ``NOVU_PYTHON_POOL_MAXSIZE``.
+    """
+
+    pool_connections: int
+    """The number of host connection pools to cache in each session (see :class:`~requests.adapters.HTTPAdapter`)"""
+
+    pool_maxsize: int
+    """The maximum number of connections to keep alive per host in each session"""
+
+    def __init__(self) -> None:
+        self.pool_connections = int(os.getenv("NOVU_PYTHON_POOL_CONNECTIONS", str(DEFAULT_POOL_CONNECTIONS)))
+        self.pool_maxsize = int(os.getenv("NOVU_PYTHON_POOL_MAXSIZE", str(DEFAULT_POOL_MAXSIZE)))
+
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[str, str], requests.Session] = {}
+
+    @classmethod
+    def configure(cls, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None) -> None:
+        """Class method provided to change the size of the connection pools.
+
+        Already opened sessions are closed, so the new sizes apply to all the next requests.
+
+        Args:
+            pool_connections: The number of host connection pools to cache in each session.
+            pool_maxsize: The maximum number of connections to keep alive per host.
+        """
+        pool = cls()
+        if pool_connections is not None:
+            pool.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            pool.pool_maxsize = pool_maxsize
+        pool.close()
+
+    def get(self, url: str, api_key: str) -> requests.Session:
+        """Retrieve (or create) the shared session for the given base URL and API key.
+
+        Args:
+            url: The base URL of the Novu API.
+            api_key: The API key used to authenticate on the Novu API.
+
+        Returns:
+            The session to use to reach the Novu API.
+        """
+        key = (url, api_key)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[key] = session
+            return session
+
+    def close(self) -> None:
+        """Close all the shared sessions and release their connections."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
 
 
 class Api:  # pylint: disable=R0903
@@ -88,7 +705,30 @@ class Api:  # pylint: disable=R0903
     """This field allow you to change the :param:`~requests.request.timeout` params which is used during API calls."""
 
     session: Optional[requests.Session] = None
-    """This field allow you to use a :class:`~requests.Session` during API calls."""
+    """This field allow you to use a :class:`~requests.Session` during API calls.
+
+    If not provided, a keep-alive session shared through the :class:`~novu.api.base.SessionPool` is used."""
+
+    transport: Optional[Transport] = None
+    """This field allow you to send the requests with another :class:`~novu.transport.Transport` (e.g. the leaner
+    :class:`~novu.transport.Urllib3Transport`), instead of a :class:`~novu.transport.RequestsTransport` wrapping the
+    :attr:`session`."""
+
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY
+    """This field allow you to change the :class:`~novu.retry.RetryPolicy` of the requests failed with a transient
+    error, or to disable the retries using ``None``."""
+
+    rate_limiter: Optional[RateLimiter] = None
+    """This field allow you to set a :class:`~novu.rate_limit.RateLimiter`, to share between all the API instances
+    calling the same Novu account, which delays the requests to stay within its rate limits."""
+
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    """This field allow you to set a :class:`~novu.concurrency.AdaptiveConcurrencyLimiter`, to share between the
+    API instances, which adapts the number of requests in flight to the load of the server."""
+
+    circuit_breaker: Optional[CircuitBreaker] = None
+    """This field allow you to set a :class:`~novu.circuit_breaker.CircuitBreaker`, to share between the API
+    instances, which fails the requests at once while their endpoint is failing."""
 
     def __init__(
         self,
@@ -97,18 +737,9 @@ class Api:  # pylint: disable=R0903
         requests_timeout: Optional[int] = None,
         session: Optional[requests.Session] = None,
     ) -> None:
-        config = NovuConfig()
-
-        url = url or config.url
-        api_key = api_key or config.api_key
-
-        self._url = url
-        self._headers = {
-            "Authorization": f"ApiKey {api_key}",
-            "User-Agent": f"novu/python@{__version__}",
-        }
-
-        self.requests_timeout = requests_timeout or int(os.getenv("NOVU_PYTHON_REQUESTS_TIMEOUT", "5"))
+        self._url, self._api_key, self._headers, self.requests_timeout = _client_settings(
+            url, api_key, requests_timeout
+        )
         self.session = session
 
     def handle_request(
@@ -118,12 +749,14 @@ class Api:  # pylint: disable=R0903
         json: Optional[Union[dict, list]] = None,
         payload: Optional[dict] = None,
         headers: Optional[dict] = None,
+        idempotent: Optional[bool] = None,
         **kwargs,
     ) -> dict:
         """Handle a request to the API.
 
-        This method can handle all cases of request and is used to authenticate the request and raise
-        an error on bad status.
+        This method can handle all cases of request and is used to authenticate the request, wait for the rate limit
+        (see :attr:`rate_limiter`), send it through the :attr:`transport`, retry it on transient errors (see
+        :attr:`retry_policy`) and raise an error on bad status.
 
         Args:
             method: The HTTP method used during the request (e.g. "POST")
@@ -131,35 +764,72 @@ class Api:  # pylint: disable=R0903
             json: The body to send, in json format. Defaults to None.
             payload: Params to send, in json format. Defaults to None.
             headers: Headers to send, in json format. Defaults to None.
+            idempotent: Whether the request can be retried. Defaults to whether the method is safe to retry.
 
         Returns:
             Return parsed response.
+
+        Raises:
+            ~novu.rate_limit.RateLimitExceeded: If the request would wait longer than allowed for its rate limit.
+            ~novu.circuit_breaker.CircuitOpenError: If the circuit of the endpoint is open.
         """
-        if headers:
-            _headers = copy.deepcopy(self._headers)
-            _headers.update(copy.deepcopy(headers))
-        else:
-            _headers = self._headers
-
-        res = (self.session.request if self.session else requests.request)(
-            method=method,
-            url=url,
-            headers=_headers,
-            json=json,
-            params=payload,
-            timeout=self.requests_timeout,
-            **kwargs,
+        transport = self.transport or RequestsTransport(self.session or SessionPool().get(self._url, self._api_key))
+        kwargs.update(
+            headers=_merge_headers(self._headers, headers), json=json, params=payload, timeout=self.requests_timeout
         )
 
-        if not res.ok:
-            try:
-                detail = res.json()
-                SentryProxy().set_extra("error_details", detail)
-            except JSONDecodeError:
-                pass
-            res.raise_for_status()
-
-        if res.status_code == 204:
-            return {}
+        res = self.__send_with_retry(transport, method, url, kwargs, self.retry_policy, idempotent)
+        return _parse_response(res, not res.ok)
 
-        return res.json()
+    def __send_with_retry(
+        self,
+        transport: Transport,
+        method: str,
+        url: str,
+        kwargs: dict,
+        policy: Optional[RetryPolicy],
+        idempotent: Optional[bool],
+    ) -> requests.Response:
+        """Send a request, waiting for the rate limit before each attempt and retrying it as long as the policy
+        allows, and return its last response."""
+        if policy:
+            policy.start()
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(method, url)
+            try:
+                res = self.__send(transport, method=method, url=url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = policy.next_delay(attempt, method, idempotent) if policy else None
+                if delay is None:
+                    raise
+            else:
+                if res.ok or not policy:
+                    return res
+                delay = policy.response_delay(attempt, method, idempotent, res.status_code, res.headers)
+                if delay is None:
+                    return res
+                res.close()
+
+            LOGGER.debug("Retrying %s %s in %.2f seconds (attempt %d failed).", method, url, delay, attempt + 1)
+            time.sleep(delay)
+            attempt += 1
+
+    def __send(self, transport: Transport, **kwargs) -> requests.Response:
+        breaker, limiter = self.circuit_breaker, self.concurrency_limiter
+        if not breaker and not limiter:
+            return transport.request(**kwargs)
+
+        token: Optional[CircuitToken] = None
+        lease: Optional[Lease] = None
+        status: Optional[int] = None
+        try:
+            lease = limiter.acquire(kwargs["url"]) if limiter else None
+            token = breaker.acquire(kwargs["url"]) if breaker else None
+            res = transport.request(**kwargs)
+            status = res.status_code
+            return res
+        finally:
+            _release_guards(breaker, token, limiter, lease, status)
@@ -2,11 +2,11 @@
 This module is used to define the ``ChangeApi``, a python wrapper to interact with ``Changes`` in Novu.
 """
 
-from typing import Dict, Generator, List, Optional, Union
+from typing import Generator, List, Optional
 
 import requests
 
-from novu.api.base import Api
+from novu.api.base import Api, _page_params
 from novu.constants import CHANGES_ENDPOINT
 from novu.dto.change import ChangeDto, PaginatedChangeDto
 
@@ -38,12 +38,7 @@ class ChangeApi(Api):
         Returns:
             Paginated list of change
         """
-        payload: Dict[str, Union[int, str]] = {"promoted": promoted}
-        if page:
-            payload["page"] = page
-        if limit:
-            payload["limit"] = limit
-
+        payload = {"promoted": promoted, **_page_params(page, limit)}
         return PaginatedChangeDto.from_camel_case(self.handle_request("GET", self._change_url, payload=payload))
 
     def count(self) -> int:
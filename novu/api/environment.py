@@ -11,6 +11,14 @@ from novu.constants import ENVIRONMENTS_ENDPOINT
 from novu.dto import EnvironmentApiKeyDto, EnvironmentDto
 
 
+def _create_payload(name: str, parent_id: Optional[str]) -> Dict[str, str]:
+    """Build the body used to create an environment."""
+    body: Dict[str, str] = {"name": name}
+    if parent_id:
+        body["parentId"] = parent_id
+    return body
+
+
 class EnvironmentApi(Api):
     """This class aims to handle all API methods around environments in Novu"""
 
@@ -45,10 +53,7 @@ class EnvironmentApi(Api):
         Returns:
             Mapped created environment
         """
-        body: Dict[str, str] = {"name": name}
-        if parent_id:
-            body["parentId"] = parent_id
-
+        body = _create_payload(name, parent_id)
         return EnvironmentDto.from_camel_case(self.handle_request("POST", self._environment_url, body)["data"])
 
     def current(self) -> EnvironmentDto:
@@ -2,17 +2,261 @@
 This module is used to define the ``EventApi``, a python wrapper to interact with ``Events`` in Novu.
 """
 
+import atexit
+import queue
+import threading
+import time
 from collections.abc import Iterable
-from typing import Dict, Iterable as _Iterable, List, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterable as _Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import requests
 
 from novu.api.base import Api
-from novu.constants import EVENTS_ENDPOINT
+from novu.constants import (
+    BULK_TRIGGER_MAX_EVENTS,
+    DEFAULT_BATCHER_MAX_DELAY_MS,
+    DEFAULT_BULK_TRIGGER_CONCURRENCY,
+    EVENTS_ENDPOINT,
+)
 from novu.dto.event import EventDto, InputEventDto
 from novu.dto.topic import TriggerTopicDto
 
 
+class BulkTriggerError(requests.RequestException):
+    """Raised by :meth:`EventApi.trigger_bulk` when some chunks of events could not be triggered.
+
+    The other chunks have been triggered: their events are in :attr:`results`. When a single chunk failed with a
+    :mod:`requests` error, its ``response`` and ``request`` are kept on this error.
+    """
+
+    def __init__(self, results: List[Optional[EventDto]], failures: List[Tuple[range, BaseException]]):
+        self.results = results
+        """The triggered events, in the order of the input events (``None`` for the events of the failed chunks)"""
+
+        self.failures = failures
+        """The indexes of the input events of each failed chunk, with the error raised while sending it"""
+
+        chunks = ", ".join(f"events {chunk.start} to {chunk.stop - 1}" for chunk, _ in failures)
+        error = failures[0][1] if len(failures) == 1 else None
+        super().__init__(
+            f"{len(failures)} chunk(s) of events failed to be triggered ({chunks}).",
+            response=error.response if isinstance(error, requests.RequestException) else None,
+        )
+
+
+def _event_payload(
+    name: str,
+    recipients: Optional[Union[str, List[str], List[dict]]],
+    payload: dict,
+    overrides: Optional[dict],
+    transaction_id: Optional[str],
+    actor: Optional[str],
+    tenant: Optional[str],
+) -> Dict[str, Any]:
+    """Build the body of an event to trigger (without recipients for a broadcast), skipping its unset options."""
+    event_payload: Dict[str, Any] = {"name": name}
+    if recipients is not None:
+        event_payload["to"] = recipients
+    event_payload["payload"] = payload
+    if overrides:
+        event_payload["overrides"] = overrides
+    if actor:
+        event_payload["actor"] = actor
+    if transaction_id:
+        event_payload["transactionId"] = transaction_id
+    if tenant:
+        event_payload["tenant"] = tenant
+
+    return event_payload
+
+
+def _bulk_event_payload(event: InputEventDto) -> Dict[str, Any]:
+    """Build the payload of an event sent to the bulk trigger endpoint."""
+    return _event_payload(
+        event.name, event.recipients, event.payload, event.overrides, event.transaction_id, event.actor, event.tenant
+    )
+
+
+def _bulk_chunks(events: Sequence[InputEventDto], chunk_size: int, concurrency: int) -> List[range]:
+    """Split the indexes of the events into the chunks sent to the bulk trigger endpoint.
+
+    Raises:
+        ValueError: If the chunk size is not between 1 and the server maximum, or if the concurrency is not positive.
+    """
+    if not 1 <= chunk_size <= BULK_TRIGGER_MAX_EVENTS:
+        raise ValueError(f"The chunk size must be between 1 and {BULK_TRIGGER_MAX_EVENTS}, got {chunk_size}.")
+    if concurrency < 1:
+        raise ValueError(f"The concurrency must be positive, got {concurrency}.")
+
+    return [range(start, min(start + chunk_size, len(events))) for start in range(0, len(events), chunk_size)] or [
+        range(0)
+    ]
+
+
+def _batch_error(error: Exception) -> BaseException:
+    """Unwrap the error raised by the request of a batch sent by a batcher, which always fits in a single chunk."""
+    return error.failures[0][1] if isinstance(error, BulkTriggerError) else error
+
+
+def _bulk_results(
+    chunks: List[range], responses: List[Union[list, BaseException]], count: int
+) -> List[Optional[EventDto]]:
+    """Merge the responses of each chunk into the triggered events, in the order of the input events.
+
+    Raises:
+        BulkTriggerError: If some chunks failed.
+    """
+    results: List[Optional[EventDto]] = [None] * count
+    failures: List[Tuple[range, BaseException]] = []
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, BaseException):
+            failures.append((chunk, response))
+            continue
+        for index, triggered_event in zip(chunk, response):
+            results[index] = EventDto.from_camel_case(triggered_event)
+
+    if failures:
+        raise BulkTriggerError(results, failures) from (failures[0][1] if len(failures) == 1 else None)
+    return results
+
+
+def _batcher_limits(max_batch: int, max_delay_ms: float) -> None:
+    """Check the limits of a trigger batcher.
+
+    Raises:
+        ValueError: If the batch size is not between 1 and the server maximum, or if the delay is negative.
+    """
+    if not 1 <= max_batch <= BULK_TRIGGER_MAX_EVENTS:
+        raise ValueError(f"The batch size must be between 1 and {BULK_TRIGGER_MAX_EVENTS}, got {max_batch}.")
+    if max_delay_ms < 0:
+        raise ValueError(f"The delay must not be negative, got {max_delay_ms}.")
+
+
+_FLUSH = object()
+_STOP = object()
+
+
+def _batch_ready(batch: list, item: Any, max_batch: int) -> bool:
+    """Add an item taken from the queue of a trigger batcher to the batch being gathered, and check if the batch must
+    be sent (on a flush or stop request, or once it is full)."""
+    if item is _FLUSH or item is _STOP:
+        return True
+    batch.append(item)
+    return len(batch) >= max_batch
+
+
+class TriggerBatcher:
+    """A background dispatcher grouping the events submitted from any thread into bulk trigger requests.
+
+    A batch is sent as soon as it holds ``max_batch`` events, or ``max_delay_ms`` milliseconds after its first event
+    was submitted. The batches are sent one at a time by a daemon thread, and the remaining events are sent when the
+    batcher is closed, which happens at the latest when the interpreter exits.
+
+    Example:
+        >>> with EventApi().batcher() as batcher:
+        ...     future = batcher.submit(InputEventDto("welcome", "subscriber-id", {}))
+        >>> future.result()
+        EventDto(acknowledged=True, status='processed', transaction_id='...')
+    """
+
+    def __init__(self, api: "EventApi", max_batch: int, max_delay_ms: float) -> None:
+        _batcher_limits(max_batch, max_delay_ms)
+
+        self.__api = api
+        self.__max_batch = max_batch
+        self.__max_delay = max_delay_ms / 1000
+        self.__queue: "queue.Queue[Any]" = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.__thread = threading.Thread(target=self.__run, name="novu-trigger-batcher", daemon=True)
+        self.__thread.start()
+        atexit.register(self.close)
+
+    def submit(self, event: InputEventDto) -> "Future[EventDto]":
+        """Queue an event to trigger in the next batch.
+
+        Args:
+            event: The event to trigger.
+
+        Returns:
+            A future resolved with the created Novu event, or with the error raised while sending its batch.
+
+        Raises:
+            RuntimeError: If the batcher is closed.
+        """
+        future: "Future[EventDto]" = Future()
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError("Cannot submit an event to a closed batcher.")
+            self.__queue.put((event, future))
+
+        return future
+
+    def flush(self) -> None:
+        """Send the queued events without waiting for the delay, and wait until their futures are resolved."""
+        with self.__lock:
+            if not self.__closed:
+                self.__queue.put(_FLUSH)
+        self.__queue.join()
+
+    def close(self) -> None:
+        """Send the queued events, then stop the dispatcher. Closing a batcher more than once has no effect."""
+        with self.__lock:
+            if not self.__closed:
+                self.__closed = True
+                self.__queue.put(_STOP)
+        self.__thread.join()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "TriggerBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __run(self) -> None:
+        item = None
+        while item is not _STOP:
+            item = self.__queue.get()
+            deadline = time.monotonic() + self.__max_delay
+            batch: List[Tuple[InputEventDto, "Future[EventDto]"]] = []
+            taken = 1
+            while not _batch_ready(batch, item, self.__max_batch):
+                try:
+                    item = self.__queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                taken += 1
+
+            self.__send(batch)
+            for _ in range(taken):
+                self.__queue.task_done()
+
+    def __send(self, batch: List[Tuple[InputEventDto, "Future[EventDto]"]]) -> None:
+        batch = [(event, future) for event, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        try:
+            results = self.__api.trigger_bulk([event for event, _ in batch])
+        except Exception as error:  # pylint: disable=W0703
+            for _, future in batch:
+                future.set_exception(_batch_error(error))
+        else:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
 class EventApi(Api):
     """This class aims to handle all API methods around events in Novu"""
 
@@ -73,53 +317,79 @@ class EventApi(Api):
         Returns:
             Create Event definition in Novu
         """
-        payload = {"name": name, "to": recipients, "payload": payload}
-        if overrides:
-            payload["overrides"] = overrides
-        if actor:
-            payload["actor"] = actor
-        if transaction_id:
-            payload["transactionId"] = transaction_id
-        if tenant:
-            payload["tenant"] = tenant
-
-        return EventDto.from_camel_case(self.handle_request("POST", self._event_url, payload)["data"])
+        payload = _event_payload(name, recipients, payload, overrides, transaction_id, actor, tenant)
+
+        res = self.handle_request("POST", self._event_url, payload, idempotent=bool(transaction_id))
+        return EventDto.from_camel_case(res["data"])
 
     def trigger_bulk(
         self,
         events: List[InputEventDto],
+        chunk_size: int = BULK_TRIGGER_MAX_EVENTS,
+        concurrency: int = DEFAULT_BULK_TRIGGER_CONCURRENCY,
     ) -> List[EventDto]:
         """Trigger events in a bulk action to reduce the amount of api calls. Using this endpoint you can trigger
         multiple events at once, to avoid multiple calls to the API. The bulk API is limited to 100 events per request.
 
+        The events are split into chunks of at most ``chunk_size`` events, sent in parallel on the shared connection
+        pool with at most ``concurrency`` requests in flight.
+
         Args:
             events (List[InputEventDto]): List of input events that should be sent.
+            chunk_size: The number of events sent per request, up to the server maximum (100). Defaults to 100.
+            concurrency: The maximum number of requests in flight. Defaults to 4.
 
         Returns:
-            List[EventDto]: List of created Novu events.
-        """
-        payload: Dict[str, List[Dict[str, Union[str, List[str], dict]]]] = {"events": []}
-        for event in events:
-            event_payload = {"name": event.name, "to": event.recipients, "payload": event.payload}
-            if event.overrides:
-                event_payload["overrides"] = event.overrides
-            if event.actor:
-                event_payload["actor"] = event.actor
-            if event.transaction_id:
-                event_payload["transactionId"] = event.transaction_id
-            if event.tenant:
-                event_payload["tenant"] = event.tenant
+            List[EventDto]: List of created Novu events, in the order of the input events.
 
-            payload["events"].append(event_payload)
+        Raises:
+            ValueError: If the chunk size is not between 1 and the server maximum, or if the concurrency is not
+                positive.
+            BulkTriggerError: If some chunks of events failed, even if the events fit in a single chunk. The error
+                raised while sending each failed chunk is in :attr:`~BulkTriggerError.failures`.
+        """
+        chunks = _bulk_chunks(events, chunk_size, concurrency)
+        responses: List[Union[list, BaseException]]
+        if len(chunks) == 1:
+            try:
+                responses = [self.__trigger_chunk(events, chunks[0])]
+            except Exception as error:  # pylint: disable=W0703
+                responses = [error]
+        else:
+            # A pool per call, like the pagination fan-out: it bounds the requests of this call to its own
+            # concurrency, and its threads are only alive while the call is.
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(chunks)), thread_name_prefix="novu-trigger-bulk"
+            ) as executor:
+                futures = [executor.submit(self.__trigger_chunk, events, chunk) for chunk in chunks]
+            responses = [future.exception() or future.result() for future in futures]
+
+        return _bulk_results(chunks, responses, len(events))  # type: ignore[return-value]
+
+    def __trigger_chunk(self, events: List[InputEventDto], chunk: range) -> list:
+        payload = {"events": [_bulk_event_payload(events[index]) for index in chunk]}
+        idempotent = all(events[index].transaction_id for index in chunk)
+        return self.handle_request("POST", f"{self._event_url}/bulk", payload, idempotent=idempotent)["data"]
+
+    def batcher(
+        self, max_batch: int = BULK_TRIGGER_MAX_EVENTS, max_delay_ms: float = DEFAULT_BATCHER_MAX_DELAY_MS
+    ) -> TriggerBatcher:
+        """Start a background dispatcher grouping the events triggered one by one into bulk trigger requests.
+
+        It is meant for callers triggering a few events at a time from many threads (e.g. a web server handling one
+        event per request), trading a short delay for far fewer API calls.
 
-        # send trigger bulk events
-        response = self.handle_request("POST", f"{self._event_url}/bulk", payload)["data"]
+        Args:
+            max_batch: The maximum number of events sent per request, up to the server maximum (100). Defaults to 100.
+            max_delay_ms: The maximum time an event waits for its batch to fill, in milliseconds. Defaults to 20.
 
-        triggered_events = []
-        for triggered_event in response:
-            triggered_events.append(EventDto.from_camel_case(triggered_event))
+        Returns:
+            The started dispatcher, to close (or to use as a context manager) once done.
 
-        return triggered_events
+        Raises:
+            ValueError: If the batch size is not between 1 and the server maximum, or if the delay is negative.
+        """
+        return TriggerBatcher(self, max_batch, max_delay_ms)
 
     def trigger_topic(
         self,
@@ -160,19 +430,11 @@ class EventApi(Api):
         Returns:
             Create Event definition in Novu
         """
-        _recipients = topics if isinstance(topics, Iterable) else [topics]
+        _recipients = [topic.to_camel_case() for topic in (topics if isinstance(topics, Iterable) else [topics])]
+        payload = _event_payload(name, _recipients, payload, overrides, transaction_id, actor, tenant)
 
-        payload = {"name": name, "to": [r.to_camel_case() for r in _recipients], "payload": payload}
-        if overrides:
-            payload["overrides"] = overrides
-        if actor:
-            payload["actor"] = actor
-        if transaction_id:
-            payload["transactionId"] = transaction_id
-        if tenant:
-            payload["tenant"] = tenant
-
-        return EventDto.from_camel_case(self.handle_request("POST", self._event_url, payload)["data"])
+        res = self.handle_request("POST", self._event_url, payload, idempotent=bool(transaction_id))
+        return EventDto.from_camel_case(res["data"])
 
     def broadcast(
         self,
@@ -207,17 +469,10 @@ class EventApi(Api):
         Returns:
             Create Event definition in Novu
         """
-        payload = {"name": name, "payload": payload}
-        if overrides:
-            payload["overrides"] = overrides
-        if actor:
-            payload["actor"] = actor
-        if transaction_id:
-            payload["transactionId"] = transaction_id
-        if tenant:
-            payload["tenant"] = tenant
-
-        return EventDto.from_camel_case(self.handle_request("POST", f"{self._event_url}/broadcast", payload)["data"])
+        payload = _event_payload(name, None, payload, overrides, transaction_id, actor, tenant)
+
+        res = self.handle_request("POST", f"{self._event_url}/broadcast", payload, idempotent=bool(transaction_id))
+        return EventDto.from_camel_case(res["data"])
 
     def delete(self, transaction_id: str) -> None:
         """Using a previously generated transaction ID during the event trigger, will cancel any active or pending
@@ -12,6 +12,18 @@ from novu.dto.integration import IntegrationChannelUsageDto, IntegrationDto
 from novu.enums import Channel, ProviderIdEnum
 
 
+def _list_url(integration_url: str, only_active: bool) -> str:
+    """Build the URL used to list the integrations."""
+    return f"{integration_url}/active" if only_active else integration_url
+
+
+def _integration_payload(integration: IntegrationDto, check: bool) -> dict:
+    """Build the body used to create or update an integration."""
+    payload = integration.to_camel_case()
+    payload["check"] = check if check is not None else True
+    return payload
+
+
 class IntegrationApi(Api):
     """This class aims to handle all API methods around integrations in API"""
 
@@ -35,11 +47,7 @@ class IntegrationApi(Api):
         Yields:
             Instance of integrations
         """
-        url = self._integration_url
-        if only_active:
-            url += "/active"
-
-        results = self.handle_request("GET", url)["data"]
+        results = self.handle_request("GET", _list_url(self._integration_url, only_active))["data"]
         for result in results:
             yield IntegrationDto.from_camel_case(result)
 
@@ -55,9 +63,7 @@ class IntegrationApi(Api):
         Returns:
             The instance of the created integration
         """
-        payload = integration.to_camel_case()
-        payload["check"] = check if check is not None else True
-
+        payload = _integration_payload(integration, check)
         return IntegrationDto.from_camel_case(self.handle_request("POST", self._integration_url, payload)["data"])
 
     def status(self, provider_id: ProviderIdEnum) -> bool:
@@ -83,9 +89,7 @@ class IntegrationApi(Api):
         Returns:
             The instance of the updated integration
         """
-        payload = integration.to_camel_case()
-        payload["check"] = check if check is not None else True
-
+        payload = _integration_payload(integration, check)
         return IntegrationDto.from_camel_case(
             self.handle_request("PUT", f"{self._integration_url}/{integration._id}", payload)["data"]
         )
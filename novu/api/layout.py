@@ -2,7 +2,7 @@
 This module is used to define the ``LayoutApi``, a python wrapper to interact with ``Layouts`` in Novu.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 import requests
 
@@ -11,6 +11,11 @@ from novu.constants import LAYOUTS_ENDPOINT
 from novu.dto.layout import LayoutDto, PaginatedLayoutDto
 
 
+def _list_payload(page: Optional[int], limit: Optional[int]) -> Dict[str, int]:
+    """Build the query params used to list the layouts."""
+    return {"page": page if page is not None else 0, "pageSize": limit if limit is not None else 100}
+
+
 class LayoutApi(Api):
     """This class aims to handle all API methods around layout in API"""
 
@@ -35,8 +40,7 @@ class LayoutApi(Api):
         Returns:
             Paginated list of layout
         """
-        payload = {"page": page if page is not None else 0, "pageSize": limit if limit is not None else 100}
-
+        payload = _list_payload(page, limit)
         return PaginatedLayoutDto.from_camel_case(self.handle_request("GET", self._layout_url, payload=payload))
 
     def create(self, layout: LayoutDto) -> LayoutDto:
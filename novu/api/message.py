@@ -2,15 +2,29 @@
 This module is used to define the ``MessageApi``, a python wrapper to interact with ``Messages`` in Novu.
 """
 
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Iterable, Literal, Optional, Union, overload
 
 import requests
 
-from novu.api.base import Api, PaginationIterator
-from novu.constants import MESSAGES_ENDPOINT
+from novu.api.base import Api, PaginationIterator, _decode_page
+from novu.constants import DEFAULT_PAGE_SIZE, MESSAGES_ENDPOINT
 from novu.dto.message import MessageDto, PaginatedMessageDto
 
 
+def _filters_payload(
+    channel: Optional[str], subscriber_id: Optional[str], transaction_id: Optional[str] = None
+) -> Dict[str, str]:
+    """Build the query params filtering the listed messages, skipping the filters left unset."""
+    payload: Dict[str, str] = {}
+    if channel:
+        payload["channel"] = channel
+    if subscriber_id:
+        payload["subscriberId"] = subscriber_id
+    if transaction_id:
+        payload["transactionId"] = transaction_id
+    return payload
+
+
 class MessageApi(Api):
     """This class aims to handle all API methods around messages in Novu"""
 
@@ -25,6 +39,46 @@ class MessageApi(Api):
 
         self._message_url = f"{self._url}{MESSAGES_ENDPOINT}"
 
+    @overload
+    def list(
+        self,
+        limit: int = 10,
+        page: int = 0,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedMessageDto: ...
+
+    @overload
+    def list(
+        self,
+        limit: int = 10,
+        page: int = 0,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    def list(
+        self,
+        limit: int = 10,
+        page: int = 0,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedMessageDto, dict]: ...
+
     def list(
         self,
         limit: int = 10,
@@ -32,7 +86,10 @@ class MessageApi(Api):
         channel: Optional[str] = None,
         subscriber_id: Optional[str] = None,
         transaction_id: Optional[str] = None,
-    ) -> PaginatedMessageDto:
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedMessageDto, dict]:
         """List messages
 
         Args:
@@ -41,41 +98,105 @@ class MessageApi(Api):
             channel: The channel for the messages you wish to list. Defaults to None.
             subscriber_id: The subscriberId for the subscriber you like to list messages for
             transaction_id: The transactionId for the messages you wish to list. Defaults to None.
+            raw: If True, return the JSON response of the API as is, without building the DTO. Defaults to False.
+            fields: The only fields of the listed items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the listed items to skip, when the DTO are built. Defaults to none.
 
         Returns:
             Returned a paginated struct containing retrieved messages
         """
-        payload: Dict[str, Union[str, int]] = {"limit": limit, "page": page}
-
-        if channel:
-            payload["channel"] = channel
-        if subscriber_id:
-            payload["subscriberId"] = subscriber_id
-        if transaction_id:
-            payload["transactionId"] = transaction_id
+        payload = {"limit": limit, "page": page, **_filters_payload(channel, subscriber_id, transaction_id)}
+        data = self.handle_request("GET", self._message_url, payload=payload)
+        return _decode_page(data, PaginatedMessageDto, MessageDto, raw, fields, exclude)
 
-        return PaginatedMessageDto.from_camel_case(self.handle_request("GET", self._message_url, payload=payload))
+    @overload
+    def stream(
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[MessageDto]: ...
+
+    @overload
+    def stream(
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
 
     def stream(
-        self, channel: Optional[str] = None, subscriber_id: Optional[str] = None
+        self,
+        channel: Optional[str] = None,
+        subscriber_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
     ) -> PaginationIterator[MessageDto]:
         """Stream all existing messages into an iterator.
 
         Args:
             channel: The channel for the messages you wish to list. Defaults to None.
             subscriber_id: The subscriberId for the subscriber you like to list messages for
+            page_size: The number of items fetched per request to the API. Defaults to 10.
+            prefetch: The number of pages to read ahead in background. Defaults to 0 (disabled).
+            resume_from: A cursor returned by the ``checkpoint()`` method of a previous stream, to resume
+                the iteration where it was saved. Defaults to None.
+            raw: If True, iterate over the JSON items returned by the API as is, without building the DTO.
+                Defaults to False.
+            view: If True, iterate over read-only views on the JSON items returned by the API, without copying
+                them (see :class:`~novu.dto.base.DtoView`). Defaults to False.
+            fields: The only fields of the items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the items to skip, when the DTO are built. Defaults to none.
 
         Returns:
             An iterator on all messages available.
         """
-        payload = {}
-
-        if channel:
-            payload["channel"] = channel
-        if subscriber_id:
-            payload["subscriberId"] = subscriber_id
-
-        return PaginationIterator(self, MessageDto, self._message_url, payload=payload)
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            MessageDto,
+            self._message_url,
+            payload=_filters_payload(channel, subscriber_id),
+            page_size=page_size,
+            prefetch=prefetch,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
 
     def delete(self, message_id: str) -> bool:
         """Deletes a message entity from the Novu platform
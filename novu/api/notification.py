@@ -2,12 +2,23 @@
 to interact with ``Notifications`` in Novu.
 """
 
-from typing import Iterator, List, Optional, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 import requests
 
-from novu.api.base import Api, PaginationIterator
-from novu.constants import NOTIFICATION_ENDPOINT
+from novu.api.base import Api, PaginationIterator, _decode_page
+from novu.constants import DEFAULT_PAGE_SIZE, NOTIFICATION_ENDPOINT
 from novu.dto.notification import (
     ActivityGraphStatesDto,
     ActivityNotificationDto,
@@ -15,6 +26,25 @@ from novu.dto.notification import (
 )
 
 
+def _filters_payload(
+    channels: Optional[List[str]],
+    templates: Optional[List[str]],
+    emails: Optional[List[str]],
+    subscriber_ids: Optional[List[str]],
+    search: Optional[str],
+    transaction_id: Optional[str],
+) -> Dict[str, Union[List[str], Optional[str]]]:
+    """Build the query params filtering the listed notifications."""
+    return {
+        "channels": channels or [],
+        "templates": templates or [],
+        "emails": emails or [],
+        "subscriberIds": subscriber_ids or [],
+        "search": search,
+        "transactionId": transaction_id,
+    }
+
+
 class NotificationApi(Api):
     """This class aims to handle all API methods around notifications in API"""
 
@@ -29,6 +59,38 @@ class NotificationApi(Api):
 
         self._notification_url = f"{self._url}{NOTIFICATION_ENDPOINT}"
 
+    @overload
+    def list(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        page: Optional[int] = 0,
+        transaction_id: Optional[str] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedActivityNotificationDto: ...
+
+    @overload
+    def list(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        page: Optional[int] = 0,
+        transaction_id: Optional[str] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
     def list(
         self,
         channels: Optional[List[str]] = None,
@@ -38,7 +100,24 @@ class NotificationApi(Api):
         search: Optional[str] = None,
         page: Optional[int] = 0,
         transaction_id: Optional[str] = None,
-    ) -> PaginatedActivityNotificationDto:
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedActivityNotificationDto, dict]: ...
+
+    def list(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        page: Optional[int] = 0,
+        transaction_id: Optional[str] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedActivityNotificationDto, dict]:
         """Trigger an event to get all notifications.
 
         Args:
@@ -63,23 +142,20 @@ class NotificationApi(Api):
             transaction_id: A required parameter, should be a string representing the
                             transaction ID associated with the notification.
 
+            raw: If True, return the JSON response of the API as is, without building
+                 the DTO. Defaults to False.
+            fields: The only fields of the listed items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the listed items to skip, when the DTO are built. Defaults to none.
+
         Returns:
             Gets notifications in Novu
 
         """
-        payload = {
-            "channels": channels or [],
-            "templates": templates or [],
-            "emails": emails or [],
-            "subscriberIds": subscriber_ids or [],
-            "search": search,
-            "page": page,
-            "transactionId": transaction_id,
-        }
-        return PaginatedActivityNotificationDto.from_camel_case(
-            self.handle_request("GET", f"{self._notification_url}", payload=payload)
-        )
+        filters = _filters_payload(channels, templates, emails, subscriber_ids, search, transaction_id)
+        data = self.handle_request("GET", f"{self._notification_url}", payload={**filters, "page": page})
+        return _decode_page(data, PaginatedActivityNotificationDto, ActivityNotificationDto, raw, fields, exclude)
 
+    @overload
     def stream(
         self,
         channels: Optional[List[str]] = None,
@@ -88,6 +164,67 @@ class NotificationApi(Api):
         subscriber_ids: Optional[List[str]] = None,
         search: Optional[str] = None,
         transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[ActivityNotificationDto]: ...
+
+    @overload
+    def stream(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    def stream(
+        self,
+        channels: Optional[List[str]] = None,
+        templates: Optional[List[str]] = None,
+        emails: Optional[List[str]] = None,
+        subscriber_ids: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
     ) -> PaginationIterator[ActivityNotificationDto]:
         """Stream all existing notifications into an iterator.
 
@@ -110,18 +247,38 @@ class NotificationApi(Api):
             transaction_id: A required parameter, should be a string representing the
                             transaction ID associated with the notification.
 
+            page_size: The number of items fetched per request to the API. Defaults to 10.
+
+            prefetch: The number of pages to read ahead in background. Defaults to 0 (disabled).
+
+            resume_from: A cursor returned by the ``checkpoint()`` method of a previous stream, to
+                         resume the iteration where it was saved. Defaults to None.
+
+            raw: If True, iterate over the JSON items returned by the API as is, without building
+                 the DTO. Defaults to False.
+            view: If True, iterate over read-only views on the JSON items returned by the API, without copying
+                them (see :class:`~novu.dto.base.DtoView`). Defaults to False.
+            fields: The only fields of the items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the items to skip, when the DTO are built. Defaults to none.
+
         Returns:
             An iterator on all notifications available.
         """
-        payload = {
-            "channels": channels or [],
-            "templates": templates or [],
-            "emails": emails or [],
-            "subscriberIds": subscriber_ids or [],
-            "search": search,
-            "transactionId": transaction_id,
-        }
-        return PaginationIterator(self, ActivityNotificationDto, self._notification_url, payload=payload)
+        payload = _filters_payload(channels, templates, emails, subscriber_ids, search, transaction_id)
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            ActivityNotificationDto,
+            self._notification_url,
+            payload=payload,
+            page_size=page_size,
+            prefetch=prefetch,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
 
     def stats(self) -> Tuple[int, int]:
         """Gets notifications stats
@@ -150,12 +307,7 @@ class NotificationApi(Api):
         Returns:
            An iterator on notifications graph stats in Novu
         """
-        payload = {
-            "id": id,
-            "start_date": start_date,
-            "end_date": end_date,
-            "days": days,
-        }
+        payload = {"id": id, "start_date": start_date, "end_date": end_date, "days": days}
         response = self.handle_request("GET", f"{self._notification_url}/graph/stats", payload=payload)
         for data in response["data"]:
             yield ActivityGraphStatesDto.from_camel_case(data)
@@ -3,12 +3,12 @@ This module is used to define the ``NotificationTemplateApi``, a python wrapper
 to interact with ``NotificationTemplate`` in Novu.
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterable, Literal, Optional, Union, overload
 
 import requests
 
-from novu.api.base import Api, PaginationIterator
-from novu.constants import NOTIFICATION_TEMPLATES_ENDPOINT
+from novu.api.base import Api, PaginationIterator, _decode_page
+from novu.constants import DEFAULT_PAGE_SIZE, NOTIFICATION_TEMPLATES_ENDPOINT
 from novu.dto.notification_template import (
     NotificationTemplateDto,
     NotificationTemplateFormDto,
@@ -16,6 +16,16 @@ from novu.dto.notification_template import (
 )
 
 
+def _list_payload(page: Optional[int], limit: Optional[int]) -> Dict[str, int]:
+    """Build the query params used to list the workflows, skipping the page and the limit left unset."""
+    payload = {}
+    if page is not None:
+        payload["page"] = page
+    if limit is not None:
+        payload["limit"] = limit
+    return payload
+
+
 class NotificationTemplateApi(Api):
     """This class aims to handle all API methods around notification templates in API"""
 
@@ -30,29 +40,134 @@ class NotificationTemplateApi(Api):
 
         self._notification_template_url = f"{self._url}{NOTIFICATION_TEMPLATES_ENDPOINT}"
 
-    def list(self, page: Optional[int] = None, limit: Optional[int] = None) -> PaginatedNotificationTemplateDto:
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedNotificationTemplateDto: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedNotificationTemplateDto, dict]: ...
+
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedNotificationTemplateDto, dict]:
         """Method to list notification templates
+            raw: If True, return the JSON response of the API as is, without building the DTO. Defaults to False.
+            fields: The only fields of the listed items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the listed items to skip, when the DTO are built. Defaults to none.
 
         Returns:
             Paginated notification templates
         """
-        payload = {}
-        if page is not None:
-            payload["page"] = page
-        if limit is not None:
-            payload["limit"] = limit
-
-        return PaginatedNotificationTemplateDto.from_camel_case(
-            self.handle_request("GET", self._notification_template_url, payload=payload)
-        )
+        payload = _list_payload(page, limit)
+        data = self.handle_request("GET", self._notification_template_url, payload=payload)
+        return _decode_page(data, PaginatedNotificationTemplateDto, NotificationTemplateDto, raw, fields, exclude)
 
-    def stream(self) -> PaginationIterator[NotificationTemplateDto]:
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[NotificationTemplateDto]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[NotificationTemplateDto]:
         """Stream all existing workflows into an iterator.
 
+        Args:
+            page_size: The number of items fetched per request to the API. Defaults to 10.
+            prefetch: The number of pages to read ahead in background. Defaults to 0 (disabled).
+            resume_from: A cursor returned by the ``checkpoint()`` method of a previous stream, to resume
+                the iteration where it was saved. Defaults to None.
+            raw: If True, iterate over the JSON items returned by the API as is, without building the DTO.
+                Defaults to False.
+            view: If True, iterate over read-only views on the JSON items returned by the API, without copying
+                them (see :class:`~novu.dto.base.DtoView`). Defaults to False.
+            fields: The only fields of the items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the items to skip, when the DTO are built. Defaults to none.
+
         Returns:
             An iterator on all workflows available.
         """
-        return PaginationIterator(self, NotificationTemplateDto, self._notification_template_url)
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            NotificationTemplateDto,
+            self._notification_template_url,
+            page_size=page_size,
+            prefetch=prefetch,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
 
     def create(self, notification_template: NotificationTemplateFormDto) -> NotificationTemplateDto:
         """Create a template using the notification template form definition
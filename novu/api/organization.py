@@ -2,7 +2,7 @@
 This module is used to define the ``OrganizationApi``, a python wrapper to interact with ``Organizations`` in Novu.
 """
 
-from typing import Iterator, Optional
+from typing import Dict, Iterator, Optional
 
 import requests
 
@@ -12,6 +12,14 @@ from novu.dto.member import MemberDto
 from novu.dto.organization import OrganizationBrandingDto, OrganizationDto
 
 
+def _create_payload(name: str, logo: Optional[str]) -> Dict[str, str]:
+    """Build the body used to create an organization."""
+    payload = {"name": name}
+    if logo:
+        payload["logo"] = logo
+    return payload
+
+
 class OrganizationApi(Api):
     """This class aims to handle all API methods around organization in API"""
 
@@ -45,10 +53,7 @@ class OrganizationApi(Api):
         Returns:
             The created organization instance
         """
-        payload = {"name": name}
-        if logo:
-            payload["logo"] = logo
-
+        payload = _create_payload(name, logo)
         return OrganizationDto.from_camel_case(self.handle_request("POST", self._organization_url, payload)["data"])
 
     def current(self) -> OrganizationDto:
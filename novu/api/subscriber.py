@@ -2,12 +2,22 @@
 This module is used to define the ``SubscriberApi``, a python wrapper to interact with ``Subscribers`` in Novu.
 """
 
-from typing import Dict, Iterator, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
 
 import requests
 
-from novu.api.base import Api, PaginationIterator
-from novu.constants import SUBSCRIBERS_ENDPOINT
+from novu.api.base import Api, PaginationIterator, _decode_page, _page_params
+from novu.constants import DEFAULT_PAGE_SIZE, SUBSCRIBERS_ENDPOINT
 from novu.dto.message import MessageDto
 from novu.dto.subscriber import (
     BulkResultSubscriberDto,
@@ -18,6 +28,48 @@ from novu.dto.subscriber import (
 from novu.enums import Channel, MarkAsEnum, MessageActionStatus, ProviderIdEnum
 
 
+def _credentials_payload(
+    provider_id: str, webhook_url: Optional[str], device_tokens: Optional[List[str]]
+) -> Dict[str, Union[str, dict]]:
+    """Build the body used to update the credentials of a subscriber."""
+    credentials: Dict[str, Union[str, List[str]]] = {}
+    if webhook_url:
+        credentials["webhookUrl"] = webhook_url
+    if device_tokens:
+        credentials["deviceTokens"] = device_tokens
+    return {"providerId": provider_id, "credentials": credentials}
+
+
+def _mark_as_payload(message_id: str, seen: Optional[bool], read: Optional[bool]) -> Dict[str, Union[str, dict]]:
+    """Build the body used to mark a message of the feed of a subscriber."""
+    mark: Dict[str, bool] = {}
+    if read is not None:
+        mark["read"] = read
+    if seen is not None:
+        mark["seen"] = seen
+    return {"messageId": message_id, "mark": mark}
+
+
+def _mark_all_as_payload(
+    mark_as: MarkAsEnum, feed_identifiers: Optional[List[str]]
+) -> Dict[str, Union[List[str], MarkAsEnum]]:
+    """Build the body used to mark all the messages of a subscriber."""
+    payload: Dict[str, Union[List[str], MarkAsEnum]] = {"markAs": mark_as}
+    if feed_identifiers:
+        payload["feedIdentifier"] = feed_identifiers
+    return payload
+
+
+def _message_action_payload(
+    status: MessageActionStatus, payload: Optional[dict]
+) -> Dict[str, Union[MessageActionStatus, dict]]:
+    """Build the body used to mark an action of a message."""
+    body: Dict[str, Union[MessageActionStatus, dict]] = {"status": status}
+    if payload is not None:
+        body["payload"] = payload
+    return body
+
+
 class SubscriberApi(Api):
     """This class aims to handle all API methods around subscribers in API"""
 
@@ -32,28 +84,132 @@ class SubscriberApi(Api):
 
         self._subscriber_url = f"{self._url}{SUBSCRIBERS_ENDPOINT}"
 
-    def list(self, page: Optional[int] = None) -> PaginatedSubscriberDto:
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedSubscriberDto: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedSubscriberDto, dict]: ...
+
+    def list(
+        self,
+        page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedSubscriberDto, dict]:
         """Method to list subscriber
 
         Args:
             page: The page number. Defaults to 0.
+            raw: If True, return the JSON response of the API as is, without building the DTO. Defaults to False.
+            fields: The only fields of the listed items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the listed items to skip, when the DTO are built. Defaults to none.
 
         Returns:
             Paginated subscriber
         """
-        payload: Dict[str, int] = {}
-        if page:
-            payload["page"] = page
-
-        return PaginatedSubscriberDto.from_camel_case(self.handle_request("GET", self._subscriber_url, payload=payload))
+        data = self.handle_request("GET", self._subscriber_url, payload=_page_params(page, None))
+        return _decode_page(data, PaginatedSubscriberDto, SubscriberDto, raw, fields, exclude)
 
-    def stream(self) -> PaginationIterator[SubscriberDto]:
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[SubscriberDto]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[SubscriberDto]:
         """Stream all existing subscribers into an iterator.
 
+        Args:
+            page_size: The number of items fetched per request to the API. Defaults to 10.
+            prefetch: The number of pages to read ahead in background. Defaults to 0 (disabled).
+            resume_from: A cursor returned by the ``checkpoint()`` method of a previous stream, to resume
+                the iteration where it was saved. Defaults to None.
+            raw: If True, iterate over the JSON items returned by the API as is, without building the DTO.
+                Defaults to False.
+            view: If True, iterate over read-only views on the JSON items returned by the API, without copying
+                them (see :class:`~novu.dto.base.DtoView`). Defaults to False.
+            fields: The only fields of the items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the items to skip, when the DTO are built. Defaults to none.
+
         Returns:
             An iterator on all subscribers available.
         """
-        return PaginationIterator(self, SubscriberDto, self._subscriber_url)
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            SubscriberDto,
+            self._subscriber_url,
+            page_size=page_size,
+            prefetch=prefetch,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
 
     def create(self, subscriber: SubscriberDto) -> SubscriberDto:
         """Method to push a given subscriber instance to Novu
@@ -141,14 +297,7 @@ class SubscriberApi(Api):
         Returns:
             Updated subscriber
         """
-        credentials: Dict[str, Union[str, List[str]]] = {}
-        payload = {"providerId": provider_id, "credentials": credentials}
-
-        if webhook_url:
-            credentials["webhookUrl"] = webhook_url
-        if device_tokens:
-            credentials["deviceTokens"] = device_tokens
-
+        payload = _credentials_payload(provider_id, webhook_url, device_tokens)
         return SubscriberDto.from_camel_case(
             self.handle_request("PUT", f"{self._subscriber_url}/{subscriber_id}/credentials", payload).get("data", {})
         )
@@ -261,13 +410,7 @@ class SubscriberApi(Api):
         Returns:
             Return the updated message
         """
-        mark: Dict[str, bool] = {}
-        if read is not None:
-            mark["read"] = read
-        if seen is not None:
-            mark["seen"] = seen
-        payload = {"messageId": message_id, "mark": mark}
-
+        payload = _mark_as_payload(message_id, seen, read)
         return MessageDto.from_camel_case(
             self.handle_request("POST", f"{self._subscriber_url}/{subscriber_id}/messages/markAs", json=payload)[
                 "data"
@@ -285,10 +428,7 @@ class SubscriberApi(Api):
         Returns:
             Number of updated messages.
         """
-        payload: Dict[str, Union[List[str], MarkAsEnum]] = {"markAs": mark_as}
-        if feed_identifiers:
-            payload["feedIdentifier"] = feed_identifiers
-
+        payload = _mark_all_as_payload(mark_as, feed_identifiers)
         return self.handle_request(
             "POST", f"{self._subscriber_url}/{subscriber_id}/messages/mark-all", json=payload
         ).get("data", 0)
@@ -313,10 +453,7 @@ class SubscriberApi(Api):
         Returns:
             Return the updated message
         """
-        body: Dict[str, Union[MessageActionStatus, dict]] = {"status": status}
-        if payload is not None:
-            body["payload"] = payload
-
+        body = _message_action_payload(status, payload)
         return MessageDto.from_camel_case(
             self.handle_request(
                 "POST", f"{self._subscriber_url}/{subscriber_id}/messages/{message_id}/actions/{action_type}", json=body
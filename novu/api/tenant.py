@@ -2,15 +2,21 @@
 This module is used to define the ``TenantApi``, a python wrapper to interact with ``Tenants`` in Novu.
 """
 
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Iterable, Literal, Optional, Union, overload
 
 import requests
 
-from novu.api.base import Api, PaginationIterator
-from novu.constants import TENANTS_ENDPOINT
+from novu.api.base import Api, PaginationIterator, _decode_page, _page_params
+from novu.constants import DEFAULT_PAGE_SIZE, TENANTS_ENDPOINT
 from novu.dto.tenant import PaginatedTenantDto, TenantDto
 
 
+def _patch_payload(identifier: Optional[str], name: Optional[str], data: Optional[dict]) -> dict:
+    """Build the body used to patch a tenant, without the fields left unset."""
+    payload = {"identifier": identifier, "name": name, "data": data}
+    return {k: v for k, v in payload.items() if v}
+
+
 class TenantApi(Api):
     """This class aims to handle all API methods around tenants in API"""
 
@@ -25,31 +31,137 @@ class TenantApi(Api):
 
         self._tenant_url = f"{self._url}{TENANTS_ENDPOINT}"
 
-    def list(self, page: Optional[int] = None, limit: Optional[int] = None) -> PaginatedTenantDto:
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: Literal[False] = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginatedTenantDto: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        *,
+        raw: Literal[True],
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> dict: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedTenantDto, dict]: ...
+
+    def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Union[PaginatedTenantDto, dict]:
         """List existing tenants
 
         Args:
             page: Page to retrieve. Defaults to None.
             limit: Size of the page to retrieve. Defaults to None.
+            raw: If True, return the JSON response of the API as is, without building the DTO. Defaults to False.
+            fields: The only fields of the listed items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the listed items to skip, when the DTO are built. Defaults to none.
 
         Returns:
             Paginated list of tenant
         """
-        payload: Dict[str, Union[int, str]] = {}
-        if page:
-            payload["page"] = page
-        if limit:
-            payload["limit"] = limit
-
-        return PaginatedTenantDto.from_camel_case(self.handle_request("GET", self._tenant_url, payload=payload))
+        data = self.handle_request("GET", self._tenant_url, payload=_page_params(page, limit))
+        return _decode_page(data, PaginatedTenantDto, TenantDto, raw, fields, exclude)
 
-    def stream(self) -> PaginationIterator[TenantDto]:
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: Literal[False] = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[TenantDto]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        *,
+        raw: Literal[True],
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    @overload
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[Any]: ...
+
+    def stream(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        resume_from: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+        view: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PaginationIterator[TenantDto]:
         """Stream all existing tenants into an iterator.
 
+        Args:
+            page_size: The number of items fetched per request to the API. Defaults to 10.
+            prefetch: The number of pages to read ahead in background. Defaults to 0 (disabled).
+            resume_from: A cursor returned by the ``checkpoint()`` method of a previous stream, to resume
+                the iteration where it was saved. Defaults to None.
+            raw: If True, iterate over the JSON items returned by the API as is, without building the DTO.
+                Defaults to False.
+            view: If True, iterate over read-only views on the JSON items returned by the API, without copying
+                them (see :class:`~novu.dto.base.DtoView`). Defaults to False.
+            fields: The only fields of the items to parse, when the DTO are built. Defaults to all fields.
+            exclude: The fields of the items to skip, when the DTO are built. Defaults to none.
+
         Returns:
             An iterator on all tenants available.
         """
-        return PaginationIterator(self, TenantDto, self._tenant_url)
+        # pylint: disable=duplicate-code
+        return PaginationIterator(
+            self,
+            TenantDto,
+            self._tenant_url,
+            page_size=page_size,
+            prefetch=prefetch,
+            resume_from=resume_from,
+            raw=raw,
+            view=view,
+            fields=fields,
+            exclude=exclude,
+        )
 
     def create(self, identifier: str, name: str, data: Optional[dict] = None) -> TenantDto:
         """Create a tenant
@@ -95,8 +207,7 @@ class TenantApi(Api):
         Returns:
             TenantDto
         """
-        payload = {"identifier": identifier, "name": name, "data": data}
-        payload = {k: v for k, v in payload.items() if v}
+        payload = _patch_payload(identifier, name, data)
         return TenantDto.from_camel_case(
             self.handle_request("PATCH", f"{self._tenant_url}/{reference}", payload)["data"]
         )
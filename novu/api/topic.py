@@ -6,11 +6,24 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import requests
 
-from novu.api.base import Api
+from novu.api.base import Api, _page_params
 from novu.constants import TOPICS_ENDPOINT
 from novu.dto.topic import PaginatedTopicDto, TopicDto
 
 
+def _list_payload(page: Optional[int], limit: Optional[int], key: Optional[str]) -> Dict[str, Union[int, str]]:
+    """Build the query params used to list the topics."""
+    payload: Dict[str, Union[int, str]] = {**_page_params(page, limit)}
+    if key:
+        payload["key"] = key
+    return payload
+
+
+def _subscribers_payload(subscribers: Union[List[str], str]) -> Dict[str, List[str]]:
+    """Build the body used to subscribe or unsubscribe subscribers to a topic."""
+    return {"subscribers": subscribers if isinstance(subscribers, list) else [subscribers]}
+
+
 class TopicApi(Api):
     """This class aims to handle all API methods around topics in API"""
 
@@ -38,14 +51,7 @@ class TopicApi(Api):
         Returns:
             Paginated list of topic
         """
-        payload: Dict[str, Union[int, str]] = {}
-        if page:
-            payload["page"] = page
-        if limit:
-            payload["limit"] = limit
-        if key:
-            payload["key"] = key
-
+        payload = _list_payload(page, limit, key)
         return PaginatedTopicDto.from_camel_case(self.handle_request("GET", self._topic_url, payload=payload))
 
     def create(self, key: str, name: str) -> TopicDto:
@@ -89,7 +95,7 @@ class TopicApi(Api):
             Second element returned is a dict of failed subscriptions
             (key the reason and value contains a list of reference which fail for the reason).
         """
-        payload = {"subscribers": subscribers if isinstance(subscribers, list) else [subscribers]}
+        payload = _subscribers_payload(subscribers)
         result = self.handle_request("POST", f"{self._topic_url}/{key}/subscribers", payload)
         return result["data"].get("succeeded", []), result["data"].get("failed", {})
 
@@ -100,7 +106,7 @@ class TopicApi(Api):
             key: The key of the topic to unsubscribe
             subscribers: The list of subscribers to unsubscribe
         """
-        payload = {"subscribers": subscribers if isinstance(subscribers, list) else [subscribers]}
+        payload = _subscribers_payload(subscribers)
         self.handle_request("POST", f"{self._topic_url}/{key}/subscribers/removal", payload)
 
     def rename(self, key: str, name: str) -> TopicDto:
@@ -0,0 +1,272 @@
+"""This module is used to define the ``CircuitBreaker`` applied by the API classes to each endpoint."""
+
+import itertools
+import logging
+import re
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+from novu.constants import (
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS,
+    DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+)
+from novu.enums.polyfill import StrEnum
+
+LOGGER = logging.getLogger(__name__)
+
+_VERSION = re.compile(r"v\d+")
+
+_STATIC_SEGMENTS = frozenset(
+    {
+        "actions",
+        "api-keys",
+        "apply",
+        "branding",
+        "broadcast",
+        "bulk",
+        "count",
+        "credentials",
+        "default",
+        "graph",
+        "group-by-category",
+        "limit",
+        "mark-all",
+        "markAs",
+        "me",
+        "members",
+        "messages",
+        "mx",
+        "notifications",
+        "online-status",
+        "preferences",
+        "provider",
+        "regenerate",
+        "removal",
+        "set-primary",
+        "stats",
+        "status",
+        "subscribers",
+        "trigger",
+        "unseen",
+        "webhooks",
+    }
+)
+"""The path segments of the Novu API which are not identifiers of resources"""
+
+
+def endpoint_template(url: str) -> str:
+    """Compute the template of the endpoint of a URL, replacing the identifiers of resources with ``{id}``.
+
+    Example:
+        >>> endpoint_template("https://api.novu.co/v1/subscribers/subscriber-id/preferences/template-id")
+        '/v1/subscribers/{id}/preferences/{id}'
+    """
+    if "://" in url:
+        path = urlsplit(url).path
+    else:
+        path = url[url.find("/") :] if "/" in url else ""  # noqa: E203
+
+    segments = [segment for segment in path.split("/") if segment]
+    version = next((index for index, segment in enumerate(segments) if _VERSION.fullmatch(segment)), None)
+    if version is not None:
+        for index in range(version + 2, len(segments)):
+            if segments[index] not in _STATIC_SEGMENTS:
+                segments[index] = "{id}"
+
+    return "/" + "/".join(segments)
+
+
+class CircuitState(StrEnum):
+    """This enumeration define the possible states of the circuit of an endpoint"""
+
+    CLOSED = "closed"
+    """The requests are sent"""
+
+    OPEN = "open"
+    """The requests fail at once, until the recovery timeout is over"""
+
+    HALF_OPEN = "half_open"
+    """A few trial requests are sent, to close the circuit if they succeed or to open it again otherwise"""
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an endpoint whose circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        """The template of the endpoint"""
+
+        self.retry_in = retry_in
+        """The time left before trial requests are sent to the endpoint, in seconds"""
+
+        super().__init__(f"The circuit of {endpoint} is open, retry in {retry_in:.1f} seconds.")
+
+
+class CircuitToken(NamedTuple):
+    """A request allowed by a circuit breaker, returned by ``acquire`` and passed back to ``release``."""
+
+    endpoint: str
+    """The template of the endpoint of the request"""
+
+    generation: int
+    """The generation of the circuit when the request was sent, which changes with each state of the circuit"""
+
+    trial: bool
+    """Whether the request is a trial request of a half-open circuit"""
+
+
+class _Circuit:  # pylint: disable=R0903
+    """The state of the circuit of an endpoint."""
+
+    def __init__(self, generation: int) -> None:
+        self.state: str = CircuitState.CLOSED
+        self.generation = generation
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """A thread-safe circuit breaker, tracking the health of each endpoint (see :func:`endpoint_template`).
+
+    The circuit of an endpoint opens after ``failure_threshold`` consecutive failures (HTTP 5xx, connection error or
+    timeout): the requests to this endpoint then fail at once with :class:`CircuitOpenError`, instead of waiting for
+    a degraded server. After ``recovery_timeout`` seconds, the circuit is half-open: at most ``half_open_max_calls``
+    trial requests are sent at once, and the circuit closes on the first success or opens again on a failure.
+
+    The outcome of a request only counts for the state of the circuit it was sent in: a request sent before the
+    circuit opened cannot close it by succeeding during the trials, nor open it again by failing after it closed.
+
+    Example:
+        >>> from novu.api.base import Api
+        >>> Api.circuit_breaker = CircuitBreaker(
+        ...     on_state_change=lambda endpoint, old, new: print(f"{endpoint}: {old} -> {new}")
+        ... )
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+        half_open_max_calls: int = DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS,
+        on_state_change: Optional[Callable[[str, str, str], None]] = None,
+    ):
+        """
+        Args:
+            failure_threshold: The number of consecutive failures opening the circuit. Defaults to 5.
+            recovery_timeout: The time before sending trial requests to an open circuit, in seconds. Defaults to 30.
+            half_open_max_calls: The number of trial requests sent at once to a half-open circuit. Defaults to 1.
+            on_state_change: A hook called with the endpoint template, the previous and the new
+                :class:`CircuitState` of its circuit on each change. Its errors are logged and ignored.
+
+        Raises:
+            ValueError: If the failure threshold or the number of trial requests is not positive.
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "The failure threshold and the number of trial requests must be positive, "
+                f"got {failure_threshold} and {half_open_max_calls}."
+            )
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+
+        self._circuits: Dict[str, _Circuit] = {}
+        self._generations = itertools.count()
+        self._lock = threading.Lock()
+
+    def state(self, url: str) -> str:
+        """Retrieve the :class:`CircuitState` of the circuit of the endpoint of a URL."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint_template(url))
+            return circuit.state if circuit else CircuitState.CLOSED
+
+    def acquire(self, url: str) -> CircuitToken:
+        """Check that a request can be sent to the endpoint of a URL.
+
+        Args:
+            url: The URL of the request.
+
+        Returns:
+            The token of the request, to pass to :meth:`release` once the request is over.
+
+        Raises:
+            CircuitOpenError: If the circuit of the endpoint is open, or if it is half-open with all the trial
+                requests in flight.
+        """
+        endpoint = endpoint_template(url)
+        changes: List[Tuple[str, str]] = []
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit(next(self._generations))
+            if circuit.state == CircuitState.OPEN:
+                retry_in = circuit.opened_at + self.recovery_timeout - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenError(endpoint, retry_in)
+                changes.append(self.__change(circuit, CircuitState.HALF_OPEN))
+
+            trial = circuit.state == CircuitState.HALF_OPEN
+            if trial:
+                if circuit.trials >= self.half_open_max_calls:
+                    raise CircuitOpenError(endpoint, 0)
+                circuit.trials += 1
+            token = CircuitToken(endpoint, circuit.generation, trial)
+
+        self.__notify(endpoint, changes)
+        return token
+
+    def release(self, token: CircuitToken, failed: bool) -> None:
+        """Record the outcome of a request, unless the circuit changed state since the request was sent.
+
+        Args:
+            token: The token returned by :meth:`acquire`.
+            failed: Whether the request failed with a server error, a connection error or a timeout.
+        """
+        changes: List[Tuple[str, str]] = []
+        with self._lock:
+            circuit = self._circuits.get(token.endpoint)
+            if circuit is None or circuit.generation != token.generation:
+                return
+
+            if token.trial:
+                circuit.trials -= 1
+
+            if not failed:
+                circuit.failures = 0
+                if token.trial:
+                    changes.append(self.__change(circuit, CircuitState.CLOSED))
+            else:
+                circuit.failures += 1
+                if token.trial or circuit.failures >= self.failure_threshold:
+                    changes.append(self.__change(circuit, CircuitState.OPEN))
+
+        self.__notify(token.endpoint, changes)
+
+    def reset(self) -> None:
+        """Close all the circuits."""
+        with self._lock:
+            self._circuits.clear()
+
+    def __change(self, circuit: _Circuit, state: str) -> Tuple[str, str]:
+        previous, circuit.state = circuit.state, state
+        circuit.generation = next(self._generations)
+        circuit.failures = circuit.trials = 0
+        if state == CircuitState.OPEN:
+            circuit.opened_at = time.monotonic()
+        return previous, state
+
+    def __notify(self, endpoint: str, changes: List[Tuple[str, str]]) -> None:
+        if not self.on_state_change:
+            return
+
+        for previous, state in changes:
+            try:
+                self.on_state_change(endpoint, previous, state)
+            except Exception:  # pylint: disable=W0703
+                LOGGER.exception("The hook of the circuit breaker failed.")
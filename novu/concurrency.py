@@ -0,0 +1,275 @@
+"""This module is used to define the adaptive concurrency limiters applied by the API classes to the requests."""
+
+import asyncio
+import dataclasses
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional
+
+from novu.circuit_breaker import endpoint_template
+from novu.constants import (
+    DEFAULT_CONCURRENCY_BACKOFF,
+    DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+    DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+    DEFAULT_CONCURRENCY_MAX_LIMIT,
+)
+
+_BASELINE_SMOOTHING = 0.01
+"""The weight of each sample in the no-load latency estimate, when it is above the estimate"""
+
+
+@dataclasses.dataclass(frozen=True)
+class ConcurrencySettings:
+    """Definition of the tuning of an adaptive concurrency limiter."""
+
+    initial_limit: int = DEFAULT_CONCURRENCY_INITIAL_LIMIT
+    """The number of requests allowed in flight at first."""
+
+    min_limit: int = 1
+    """The lowest limit."""
+
+    max_limit: int = DEFAULT_CONCURRENCY_MAX_LIMIT
+    """The highest limit."""
+
+    backoff: float = DEFAULT_CONCURRENCY_BACKOFF
+    """The factor applied to the limit when a request is overloaded."""
+
+    latency_tolerance: float = DEFAULT_CONCURRENCY_LATENCY_TOLERANCE
+    """The ratio to the no-load latency of its endpoint above which a request is overloaded."""
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                "The limits must be ordered from 1, "
+                f"got {self.min_limit}, {self.initial_limit} and {self.max_limit}."
+            )
+        if not 0 < self.backoff < 1:
+            raise ValueError(f"The backoff must be between 0 and 1, got {self.backoff}.")
+
+
+class Lease(NamedTuple):
+    """A slot of a concurrency limiter, returned by ``acquire`` and passed back to ``release``."""
+
+    endpoint: str
+    """The template of the endpoint of the request (see :func:`~novu.circuit_breaker.endpoint_template`)"""
+
+    start: float
+    """The start time of the request"""
+
+
+class _AimdLimit:
+    """The additive-increase/multiplicative-decrease (AIMD) algorithm shared by the concurrency limiters.
+
+    The limit grows by one request per window of ``limit`` successful requests while at least half of it is used,
+    and is multiplied by ``backoff`` when a request is overloaded: rejected with HTTP 429 or 5xx, timed out, or
+    slower than ``latency_tolerance`` times the no-load latency of its endpoint. The requests started before a
+    decrease cannot decrease the limit again, so a burst of failures of the same window only counts once.
+
+    The no-load latency is estimated per endpoint template, so that a slow endpoint (e.g. a bulk trigger) is not
+    mistaken for an overload of the fast ones.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_CONCURRENCY_MAX_LIMIT,
+        backoff: float = DEFAULT_CONCURRENCY_BACKOFF,
+        latency_tolerance: float = DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+    ):
+        """
+        Args:
+            initial_limit: The number of requests allowed in flight at first. Defaults to 4.
+            min_limit: The lowest limit. Defaults to 1.
+            max_limit: The highest limit. Defaults to 64.
+            backoff: The factor applied to the limit when a request is overloaded. Defaults to 0.5.
+            latency_tolerance: The ratio to the no-load latency above which a request is overloaded. Defaults to 3.
+
+        Raises:
+            ValueError: If the limits are not ordered, or if the backoff is not between 0 and 1.
+        """
+        self.settings = ConcurrencySettings(initial_limit, min_limit, max_limit, backoff, latency_tolerance)
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._baselines: Dict[str, float] = {}
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests in flight"""
+        return self._in_flight
+
+    def baseline(self, url: str = "") -> Optional[float]:
+        """Retrieve the estimate of the no-load latency of the endpoint of a URL.
+
+        Args:
+            url: The URL of a request. Defaults to the requests acquired without URL.
+
+        Returns:
+            The estimate, in seconds, or ``None`` before the first request to the endpoint.
+        """
+        return self._baselines.get(endpoint_template(url))
+
+    def _try_acquire(self, endpoint: str) -> Optional[Lease]:
+        """Take a slot if the limit allows it."""
+        if self._in_flight >= int(self._limit):
+            return None
+        self._in_flight += 1
+        return Lease(endpoint, time.monotonic())
+
+    def _update(self, lease: Lease, overloaded: bool, sent: bool) -> None:
+        """Release a slot, and adapt the limit to the outcome of its request (if it was sent)."""
+        now = time.monotonic()
+        latency = now - lease.start
+        saturated = 2 * self._in_flight >= self._limit
+        self._in_flight -= 1
+        if not sent:
+            return
+
+        baseline = self._baselines.get(lease.endpoint)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * _BASELINE_SMOOTHING
+        self._baselines[lease.endpoint] = baseline
+
+        settings = self.settings
+        if overloaded or latency > settings.latency_tolerance * baseline:
+            if lease.start >= self._last_decrease:
+                self._limit = max(self._limit * settings.backoff, settings.min_limit)
+                self._last_decrease = now
+        elif saturated:
+            self._limit = min(self._limit + 1 / self._limit, settings.max_limit)
+
+
+class AdaptiveConcurrencyLimiter(_AimdLimit):
+    """A thread-safe limiter of the requests in flight, adapting its limit to the load of the server (AIMD).
+
+    Any number of threads can share a limiter: the limit rises while the requests succeed with a flat latency, and
+    drops as soon as the server shows signs of overload. Setting it as ``Api.concurrency_limiter`` applies it to
+    all the requests, so the parallel operations (e.g. ``trigger_bulk`` or ``fetch_all``) can use a high number of
+    workers and let the limiter find the sustainable concurrency.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(max_limit=32)
+        >>> with limiter.slot() as slot:
+        ...     response = send_request()
+        ...     slot.overloaded = response.status_code == 429
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = threading.Condition(self._lock)
+
+    def acquire(self, url: str = "") -> Lease:
+        """Wait for a slot.
+
+        Args:
+            url: The URL of the request, whose endpoint template keys the latency estimate. Defaults to no URL.
+
+        Returns:
+            The lease of the slot, to pass to :meth:`release`.
+        """
+        endpoint = endpoint_template(url)
+        with self._condition:
+            lease = self._try_acquire(endpoint)
+            while lease is None:
+                self._condition.wait()
+                lease = self._try_acquire(endpoint)
+            return lease
+
+    def release(self, lease: Lease, overloaded: bool = False, sent: bool = True) -> None:
+        """Release a slot once its request is over.
+
+        Args:
+            lease: The lease returned by :meth:`acquire`.
+            overloaded: Whether the request showed an overload of the server (e.g. HTTP 429 or timeout).
+            sent: Whether the request was sent. Otherwise (e.g. its circuit is open), the slot is freed without
+                adapting the limit. Defaults to True.
+        """
+        with self._condition:
+            self._update(lease, overloaded, sent)
+            self._condition.notify_all()
+
+    def slot(self, url: str = "") -> "Slot":
+        """Hold a slot in a ``with`` block, released when the block exits (as overloaded, if it raised).
+
+        Args:
+            url: The URL of the request sent in the block. Defaults to no URL.
+        """
+        return Slot(self, url)
+
+
+class Slot:
+    """A slot of an :class:`AdaptiveConcurrencyLimiter` held in a ``with`` block."""
+
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter, url: str = ""):
+        self.limiter = limiter
+        self.url = url
+        self.overloaded = False
+        """Whether the request showed an overload of the server, to set before leaving the block"""
+
+        self.__lease = Lease("", 0.0)
+
+    def __enter__(self) -> "Slot":
+        self.__lease = self.limiter.acquire(self.url)
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        self.limiter.release(self.__lease, self.overloaded or exc_type is not None)
+
+
+class AsyncAdaptiveConcurrencyLimiter(_AimdLimit):
+    """The :mod:`asyncio` counterpart of :class:`AdaptiveConcurrencyLimiter`, used by ``novu.aio.base.Api``.
+
+    A limiter must only be shared by the coroutines of a single event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    async def acquire(self, url: str = "") -> Lease:
+        """Wait for a slot.
+
+        Args:
+            url: The URL of the request, whose endpoint template keys the latency estimate. Defaults to no URL.
+
+        Returns:
+            The lease of the slot, to pass to :meth:`release`.
+        """
+        endpoint = endpoint_template(url)
+        lease = self._try_acquire(endpoint)
+        while lease is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            lease = self._try_acquire(endpoint)
+        return lease
+
+    def release(self, lease: Lease, overloaded: bool = False, sent: bool = True) -> None:
+        """Release a slot once its request is over.
+
+        Args:
+            lease: The lease returned by :meth:`acquire`.
+            overloaded: Whether the request showed an overload of the server (e.g. HTTP 429 or timeout).
+            sent: Whether the request was sent. Otherwise (e.g. its circuit is open), the slot is freed without
+                adapting the limit. Defaults to True.
+        """
+        self._update(lease, overloaded, sent)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
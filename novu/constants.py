@@ -20,5 +20,43 @@ TOPICS_ENDPOINT = "/v1/topics"
 BLUEPRINTS_ENDPOINT = "/v1/blueprints"
 WORKFLOW_ENDPOINT = "/v1/workflows"
 
+# Pagination
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+# Bulk trigger
+BULK_TRIGGER_MAX_EVENTS = 100
+DEFAULT_BULK_TRIGGER_CONCURRENCY = 4
+DEFAULT_BATCHER_MAX_DELAY_MS = 20
+
+# Trigger outbox
+DEFAULT_OUTBOX_RETRY_INTERVAL = 5
+DEFAULT_OUTBOX_MAX_RETRY_INTERVAL = 5 * 60
+DEFAULT_OUTBOX_MAX_ATTEMPTS = 10
+DEFAULT_OUTBOX_RETENTION = 24 * 60 * 60
+
+# Retry
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_MAX_BACKOFF = 30
+DEFAULT_RETRY_MAX_RETRY_AFTER = 60
+DEFAULT_RETRY_BUDGET_RATIO = 0.2
+DEFAULT_RETRY_BUDGET_RESERVE = 10
+
+# Adaptive concurrency
+DEFAULT_CONCURRENCY_INITIAL_LIMIT = 4
+DEFAULT_CONCURRENCY_MAX_LIMIT = 64
+DEFAULT_CONCURRENCY_BACKOFF = 0.5
+DEFAULT_CONCURRENCY_LATENCY_TOLERANCE = 3
+
+# Circuit breaker
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RECOVERY_TIMEOUT = 30
+DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS = 1
+
+# Connection pool
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
 # Datetime Format
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
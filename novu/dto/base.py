@@ -1,8 +1,24 @@
 """This module is used to defined all helpers to parse and send well-formatted data to the Novu API"""
 
+import copy
 import dataclasses
+import functools
 import re
-from typing import ClassVar, Generic, Iterable, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 CAMELIZE_PATTERN = re.compile(r"(?:^|_)(.)")
 UNDERSCORE_PATTERN_1 = re.compile(r"([A-Z]+)([A-Z][a-z])")
@@ -45,12 +61,232 @@ def camel_case_to_snake_case(word: str) -> str:
 
 _T = TypeVar("_T")
 
+_FieldDecoder = Optional[Tuple[str, Optional[Callable[[Any], Any]]]]
+"""The field to set for a key of a camel case dict, with the function to parse its value (if any)"""
+
+_DECODERS: Dict[Tuple[type, Optional[FrozenSet[str]]], Callable[[dict], Any]] = {}
+"""Cache of the decoders built for each class (and each projection of its fields) by :func:`get_decoder`"""
+
+DECODER_CACHE_SIZE = 1024
+"""Maximum number of unexpected keys remembered by each decoder"""
+
+
+INTERN_POOL_SIZE = 65536
+"""Maximum number of distinct strings kept by the interning pool of the decoders"""
+
+_INTERN_POOL: Dict[str, str] = {}
+"""The strings shared by the decoders between the values of the interned fields (see :func:`set_interned_fields`)"""
+
+
+def intern_string(val: Any) -> Any:
+    """Retrieve the copy of a string kept in the interning pool, adding it if the pool is not full.
+
+    Values which are not strings are returned as is.
+
+    Example:
+        >>> intern_string("".join(["env", "-id"])) is intern_string("env-id")
+        True
+    """
+    if type(val) is not str:  # pylint: disable=C0123
+        return val
+
+    interned = _INTERN_POOL.get(val)
+    if interned is None:
+        if len(_INTERN_POOL) >= INTERN_POOL_SIZE:
+            return val
+        interned = _INTERN_POOL.setdefault(val, val)
+    return interned
+
+
+def clear_intern_pool() -> None:
+    """Forget all the strings kept in the interning pool"""
+    _INTERN_POOL.clear()
+
+
+def _field_keys(name: str) -> Tuple[str, ...]:
+    """List the usual spellings of a field in a camel case dict (the field name, in lower and upper camel case)"""
+    prefix, word = ("_", name[1:]) if name.startswith("_") and len(name) > 1 else ("", name)
+    keys = (name, prefix + snake_case_to_camel_case(word), prefix + snake_case_to_camel_case(word, True))
+    return tuple(dict.fromkeys(key for key in keys if camel_case_to_snake_case(key) == name))
+
+
+def _build_decoder(cls: type, projection: Optional[FrozenSet[str]] = None) -> Callable[[dict], Any]:
+    """Build the function parsing a camel case dict into the given dataclass.
+
+    The table of the camel case keys to the dataclass fields is computed once, with the function to parse the
+    value of each field. Keys which are not in the table (unusual spelling or unknown fields) are converted to
+    snake case on first encounter, then remembered in the table.
+
+    If a projection is given, the values of the other fields are never parsed: these fields keep their default value,
+    or ``None`` if they are required.
+
+    The string values of the fields listed in ``interned_fields`` are replaced by their copy in the interning pool.
+    """
+    interned = frozenset(getattr(cls, "interned_fields", None) or ())
+    fields: Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]] = {
+        f.name: (f.name, intern_string if f.name in interned else getattr(f.type, "from_camel_case", None))
+        for f in dataclasses.fields(cls)
+        if projection is None or f.name in projection
+    }
+    table: Dict[str, _FieldDecoder] = {
+        key: fields.get(f.name) for f in dataclasses.fields(cls) for key in _field_keys(f.name)
+    }
+    defaults = {
+        f.name: None
+        for f in dataclasses.fields(cls)
+        if f.name not in fields and f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+    }
+
+    def resolve(key: str) -> _FieldDecoder:
+        field = fields.get(camel_case_to_snake_case(key))
+        if len(table) < DECODER_CACHE_SIZE:
+            table[key] = field
+        return field
+
+    def decode(data: dict) -> Any:
+        kwargs = {**defaults}
+        for key, val in data.items():
+            field = table[key] if key in table else resolve(key)
+            if field is not None:
+                name, parse = field
+                kwargs[name] = parse(val) if parse is not None else val
+
+        return cls(**kwargs)
+
+    return decode
+
+
+def get_decoder(
+    cls: type, fields: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None
+) -> Callable[[dict], Any]:
+    """Retrieve (or build on first use) the function parsing a camel case dict into the given dataclass.
+
+    Example:
+        >>> get_decoder(SubscriberDto)({"subscriberId": "subscriber-id"})
+        SubscriberDto(subscriber_id='subscriber-id', ...)
+        >>> get_decoder(SubscriberDto, fields=["subscriber_id"])({"subscriberId": "subscriber-id", "email": "..."})
+        SubscriberDto(subscriber_id='subscriber-id', email=None, ...)
+
+    Args:
+        cls: The dataclass to parse.
+        fields: The only fields to parse (in snake case). Defaults to all fields.
+        exclude: The fields to skip (in snake case). Defaults to none.
+
+    Raises:
+        ValueError: If a field to parse or to skip is not defined by the dataclass.
+    """
+    projection: Optional[FrozenSet[str]] = None
+    if fields is not None or exclude:
+        names = {f.name for f in dataclasses.fields(cls)}
+        selected = frozenset(names if fields is None else fields)
+        excluded = frozenset(exclude or ())
+        unknown = (selected | excluded) - names
+        if unknown:
+            raise ValueError(f"Unknown fields for {cls.__name__}: {', '.join(sorted(unknown))}.")
+        projection = selected - excluded
+
+    decoder = _DECODERS.get((cls, projection))
+    if decoder is None:
+        decoder = _DECODERS[(cls, projection)] = _build_decoder(cls, projection)
+    return decoder
+
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+"""Types of the values which never hold a dataclass, skipped without further check by :func:`_encode_value`"""
+
+
+def _encode_sequence(val: Union[list, tuple]) -> Union[list, tuple]:
+    """Encode the items of a list or a tuple, rebuilding it only from its first item holding a dataclass."""
+    for i, item in enumerate(val):
+        if type(item) in _SCALAR_TYPES:
+            continue
+        encoded = _encode_value(item)
+        if encoded is not item:
+            items = [*val[:i], encoded, *(_encode_value(v) for v in val[i + 1 :])]
+            return items if isinstance(val, list) else tuple(items)
+    return val
+
+
+def _encode_mapping(val: dict) -> dict:
+    """Encode the values of a dict, rebuilding it only if one of its values holds a dataclass."""
+    for key, item in val.items():
+        if type(item) in _SCALAR_TYPES:
+            continue
+        encoded = _encode_value(item)
+        if encoded is not item:
+            return {k: encoded if k == key else _encode_value(v) for k, v in val.items()}
+    return val
+
+
+_CONTAINER_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    list: _encode_sequence,
+    tuple: _encode_sequence,
+    dict: _encode_mapping,
+}
+"""Functions encoding the containers which can hold a dataclass, by type of container (subclasses included)"""
+
+
+def _encode_value(val: Any) -> Any:
+    """Convert the dataclasses found in a value to dicts, as :func:`dataclasses.asdict` does.
+
+    Unlike :func:`dataclasses.asdict`, the lists, tuples and dicts without any dataclass inside are returned as is
+    instead of being deep-copied: only the containers holding a dataclass are rebuilt.
+    """
+    if type(val) in _SCALAR_TYPES:
+        return val
+    for container, encode in _CONTAINER_ENCODERS.items():
+        if isinstance(val, container):
+            return encode(val)
+    if dataclasses.is_dataclass(val) and not isinstance(val, type):
+        return dataclasses.asdict(val)
+    return val
+
+
+_ENCODERS: Dict[type, Callable[[Any], dict]] = {}
+"""Cache of the encoders built for each class by :func:`get_encoder`"""
+
+
+def _build_encoder(cls: type) -> Callable[[Any], dict]:
+    """Build the function converting an instance of the given dataclass to a camel case dict.
+
+    The fields to emit (see :attr:`CamelCaseDto.camel_case_fields`) and their camel case keys
+    (see :attr:`CamelCaseDto.snake_case_to_camel_case_ignored`) are computed once.
+    """
+    ignored = getattr(cls, "snake_case_to_camel_case_ignored", [])
+    only = getattr(cls, "camel_case_fields", None)
+    keys: List[Tuple[str, str]] = [
+        (f.name, f.name if f.name in ignored else snake_case_to_camel_case(f.name))
+        for f in dataclasses.fields(cls)
+        if not only or f.name in only
+    ]
+
+    def encode(obj: Any) -> dict:
+        return {key: _encode_value(getattr(obj, name)) for name, key in keys}
+
+    return encode
+
+
+def get_encoder(cls: type) -> Callable[[Any], dict]:
+    """Retrieve (or build on first use) the function converting an instance of the given dataclass to a camel case
+    dict.
+
+    Example:
+        >>> get_encoder(TopicDto)(TopicDto("key", "name"))
+        {'key': 'key', 'name': 'name'}
+    """
+    encoder = _ENCODERS.get(cls)
+    if encoder is None:
+        encoder = _ENCODERS[cls] = _build_encoder(cls)
+    return encoder
+
 
 @dataclasses.dataclass
 class CamelCaseDto(Generic[_T]):
     """A generic dataclass that allows to convert data from Novu API written in
     camel case to python (in snake_case) and back."""
 
+    __slots__ = ()
+
     snake_case_to_camel_case_ignored: ClassVar[List[str]] = []
     """List of fields which we don't want to camelize."""
 
@@ -59,41 +295,67 @@ class CamelCaseDto(Generic[_T]):
 
     If this list is not defined, we have taken all the fields from the data class."""
 
+    interned_fields: ClassVar[Optional[List[str]]] = None
+    """List of fields whose string values are interned during :meth:`from_camel_case`.
+
+    Set it using :func:`set_interned_fields`. Only fields with a few distinct values (like IDs of environments or
+    organizations) are worth it: each DTO then refers to the same string instead of its own copy."""
+
+    categorical_fields: ClassVar[Optional[List[str]]] = None
+    """List of fields with a few distinct values, encoded by default in the columnar representation of a batch of
+    DTO (see :class:`~novu.dto.columns.Columns`)."""
+
     @classmethod
-    def from_camel_case(cls: Type[_T], data: dict) -> _T:
-        """Helper to parse a camel case dict"""
-        fields = {f.name: f.type for f in dataclasses.fields(cls)}  # type: ignore[arg-type]
-        kwargs = {}
-        for key, val in data.items():
-            _key = camel_case_to_snake_case(key)
-            if _key in fields.keys():
-                kwargs[_key] = fields[_key].from_camel_case(val) if hasattr(fields[_key], "from_camel_case") else val
+    def from_camel_case(
+        cls: Type[_T], data: dict, fields: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None
+    ) -> _T:
+        """Helper to parse a camel case dict
+
+        Args:
+            data: The camel case dict to parse.
+            fields: The only fields to parse (see :func:`get_decoder`). Defaults to all fields.
+            exclude: The fields to skip (see :func:`get_decoder`). Defaults to none.
+        """
+        return get_decoder(cls, fields, exclude)(data)
 
-        return cls(**kwargs)
+    @classmethod
+    def compact(cls: Type[_T]) -> Type[_T]:
+        """Retrieve the memory-compact variant of this class (see :func:`get_compact_class`)"""
+        return get_compact_class(cls)  # type: ignore[arg-type,type-var]
+
+    @classmethod
+    def view(cls: Type[_T]) -> Type["DtoView"]:
+        """Retrieve the read-only view variant of this class (see :func:`get_view_class`)"""
+        return get_view_class(cls)  # type: ignore[arg-type,type-var]
 
     def to_camel_case(self) -> dict:
-        """Helper to build a camel case dict"""
-        if self.camel_case_fields:
-            # pylint: disable=E1135
-            return {
-                snake_case_to_camel_case(k) if k not in self.snake_case_to_camel_case_ignored else k: v
-                for k, v in dataclasses.asdict(self).items()
-                if k in self.camel_case_fields
-            }
-        return {
-            snake_case_to_camel_case(k) if k not in self.snake_case_to_camel_case_ignored else k: v
-            for k, v in dataclasses.asdict(self).items()
-        }
+        """Helper to build a camel case dict
+
+        Nested dataclasses are converted to dicts, but the other values (like ``data`` or ``payload`` dicts) are
+        shared with the instance rather than copied.
+        """
+        return get_encoder(type(self))(self)
 
 
 _C_co = TypeVar("_C_co", bound=CamelCaseDto, covariant=True)
 
 
+class _RawValue:  # pylint: disable=R0903
+    """Wrapper of a raw value set on a DTO descriptor, waiting to be decoded on first access"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
 class DtoDescriptor(Generic[_C_co]):
     """The Dto descriptor is used on :func:`dataclasses.dataclass` to help them parse sub-struct defined using
     the :class:`~novu.dto.base.CamelCaseDto` class during :meth:`~novu.dto.base.CamelCaseDto.from_camel_case` calls
     on Novu API response.
 
+    The dict set on the field is kept as is, and only parsed (once) on first access to the field.
+
     Example:
         >>> @dataclasses.dataclass
         ... class SubscriberPreferenceDto(CamelCaseDto["SubscriberPreferenceDto"]):
@@ -113,11 +375,18 @@ class DtoDescriptor(Generic[_C_co]):
         if obj is None:
             return None
 
-        return getattr(obj, self._name, None) if self._name else None
+        if not self._name:
+            return None
+
+        value = getattr(obj, self._name, None)
+        if isinstance(value, _RawValue):
+            value = self._item_cls.from_camel_case(value.value)
+            setattr(obj, self._name, value)
+        return value
 
     def __set__(self, obj, value: Union[_C_co, dict]) -> None:
         if self._name:  # pragma: no branch (ignore because should never append as descriptor, branch is just for mypy)
-            setattr(obj, self._name, self._item_cls.from_camel_case(value) if isinstance(value, dict) else value)
+            setattr(obj, self._name, _RawValue(value) if isinstance(value, dict) else value)
 
 
 class DtoIterableDescriptor(Generic[_C_co]):
@@ -125,6 +394,8 @@ class DtoIterableDescriptor(Generic[_C_co]):
     defined using the :class:`~novu.dto.base.CamelCaseDto` class during
     :meth:`~novu.dto.base.CamelCaseDto.from_camel_case` calls on Novu API response.
 
+    The list set on the field is kept as is, and only parsed (once) on first access to the field.
+
     Example:
         >>> @dataclasses.dataclass
         ... class PaginatedTopicDto(CamelCaseDto["PaginatedTopicDto"]):
@@ -145,8 +416,257 @@ class DtoIterableDescriptor(Generic[_C_co]):
         if obj is None:
             return None
 
-        return getattr(obj, self._name, None) if self._name else None
+        if not self._name:
+            return None
+
+        value = getattr(obj, self._name, None)
+        if isinstance(value, _RawValue):
+            value = [self._item_cls.from_camel_case(v) if isinstance(v, dict) else v for v in value.value]
+            setattr(obj, self._name, value)
+        return value
 
     def __set__(self, obj, value: Union[Iterable[_C_co], Iterable[dict]]) -> None:
         if self._name and value is not None:
-            setattr(obj, self._name, [self._item_cls.from_camel_case(v) if isinstance(v, dict) else v for v in value])
+            if not isinstance(value, (list, tuple)):
+                value = [self._item_cls.from_camel_case(v) if isinstance(v, dict) else v for v in value]
+            setattr(obj, self._name, _RawValue(value))
+
+
+_COMPACT_CLASSES: Dict[type, type] = {}
+"""Cache of the classes built for each DTO class by :func:`get_compact_class`"""
+
+
+def _build_compact_class(cls: Type[CamelCaseDto]) -> Type[CamelCaseDto]:
+    """Build a copy of the given dataclass storing its fields in ``__slots__`` instead of a per-instance ``__dict__``.
+
+    The fields defined using :class:`DtoDescriptor` or :class:`DtoIterableDescriptor` keep a descriptor, whose
+    value is stored in a slot, and the nested DTO are parsed into their compact variants too.
+    """
+    fields: Dict[str, dataclasses.Field] = {}
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in ("__dict__", "__weakref__", "__dataclass_fields__")}
+    slots = []
+    for name, field in cls.__dataclass_fields__.items():  # type: ignore[attr-defined]
+        field = fields[name] = copy.copy(field)
+        if field._field_type is not dataclasses._FIELD:  # type: ignore[attr-defined] # pylint: disable=W0212
+            continue
+
+        namespace.pop(name, None)
+        descriptor = next((klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__), None)
+        if isinstance(descriptor, DtoDescriptor):
+            namespace[name] = DtoDescriptor(get_compact_class(descriptor._item_cls))  # pylint: disable=W0212
+        elif isinstance(descriptor, DtoIterableDescriptor):
+            namespace[name] = DtoIterableDescriptor(  # pylint: disable=W0212
+                descriptor.default_factory, get_compact_class(descriptor._item_cls)
+            )
+        else:
+            slots.append(name)
+            if isinstance(field.type, type) and issubclass(field.type, CamelCaseDto):
+                field.type = get_compact_class(field.type)
+            continue
+        slots.append(f"_{name}")
+
+    def __reduce__(self: CamelCaseDto) -> tuple:
+        # The qualified name of the variant cannot be resolved by pickle, so it is rebuilt from the original class
+        return _new_compact, (cls,), (None, {name: getattr(self, name) for name in slots if hasattr(self, name)})
+
+    namespace["__slots__"] = tuple(slots)
+    namespace["__dataclass_fields__"] = fields
+    namespace["__qualname__"] = f"{cls.__qualname__}.Compact"
+    namespace["__reduce__"] = __reduce__
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def _new_compact(cls: Type[CamelCaseDto]) -> CamelCaseDto:
+    """Create an empty instance of the compact variant of the given DTO class, whose slots are then set by
+    :mod:`pickle` (or :mod:`copy`)."""
+    return object.__new__(get_compact_class(cls))
+
+
+def get_compact_class(cls: Type[_C_co]) -> Type[_C_co]:
+    """Retrieve (or build on first use) the memory-compact variant of the given DTO class.
+
+    The instances of this variant have no ``__dict__``: their fields are stored in ``__slots__``, which reduces the
+    memory used when millions of DTO are kept in memory. The variant has the same fields, methods
+    and camel case helpers as the given class, but is not a subclass of it.
+
+    Example:
+        >>> SubscriberDto.compact().from_camel_case({"subscriberId": "subscriber-id"})
+        SubscriberDto.Compact(subscriber_id='subscriber-id', ...)
+    """
+    if "__slots__" in cls.__dict__:
+        return cls
+
+    compact = _COMPACT_CLASSES.get(cls)
+    if compact is None:
+        compact = _COMPACT_CLASSES[cls] = _build_compact_class(cls)
+    return compact  # type: ignore[return-value]
+
+
+class DtoView(Generic[_C_co]):
+    """A read-only view on a camel case dict returned by Novu API, exposing the fields of a
+    :class:`~novu.dto.base.CamelCaseDto` class without copying the dict.
+
+    The subclasses are built by :func:`get_view_class`, with one property per field reading the camel case key in the
+    wrapped dict on each access. The nested DTO are returned as views too. Use :meth:`to_dto` to get the full DTO
+    (e.g. to update it).
+
+    Example:
+        >>> subscriber = SubscriberDto.view()({"subscriberId": "subscriber-id", "firstName": "Max"})
+        >>> subscriber.first_name
+        'Max'
+        >>> subscriber.to_dto()
+        SubscriberDto(subscriber_id='subscriber-id', email=None, first_name='Max', ...)
+    """
+
+    __slots__ = ("_data",)
+
+    _data: dict
+
+    dto_class: ClassVar[Type[CamelCaseDto]]
+    """The DTO class exposed by the view"""
+
+    def __init__(self, data: dict):
+        object.__setattr__(self, "_data", data)
+
+    @classmethod
+    def from_camel_case(cls, data: dict) -> "DtoView[_C_co]":
+        """Helper to wrap a camel case dict, like :meth:`~novu.dto.base.CamelCaseDto.from_camel_case`"""
+        return cls(data)
+
+    def to_dto(self) -> _C_co:
+        """Build the full DTO from the wrapped dict"""
+        return self.dto_class.from_camel_case(self._data)  # type: ignore[return-value]
+
+    def to_camel_case(self) -> dict:
+        """Helper to build a camel case dict, like :meth:`~novu.dto.base.CamelCaseDto.to_camel_case`"""
+        return self.to_dto().to_camel_case()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r} of a view, use to_dto() first")
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r} of a view, use to_dto() first")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._data == other._data  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}({self._data!r})"
+
+
+_VIEW_CLASSES: Dict[type, type] = {}
+"""Cache of the classes built for each DTO class by :func:`get_view_class`"""
+
+
+def _view_property(name: str, keys: Tuple[str, ...], parse: Optional[Callable[[Any], Any]], default: Callable[[], Any]):
+    """Build the property reading a field in the dict wrapped by a :class:`DtoView`"""
+
+    def getter(self: DtoView) -> Any:
+        data = self._data  # pylint: disable=W0212
+        for key in keys:
+            if key in data:
+                val = data[key]
+                return parse(val) if parse is not None and val is not None else val
+        return default()
+
+    getter.__name__ = name
+    return property(getter)
+
+
+def _build_view_class(cls: Type[CamelCaseDto]) -> Type[DtoView]:
+    """Build the :class:`DtoView` subclass exposing the fields of the given dataclass"""
+    namespace: Dict[str, Any] = {"__slots__": (), "__qualname__": f"{cls.__qualname__}.View", "dto_class": cls}
+    for field in dataclasses.fields(cls):
+        name = field.name
+        keys = _field_keys(name)
+
+        parse: Optional[Callable[[Any], Any]] = None
+        attr = next((klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__), None)
+        if isinstance(attr, DtoDescriptor):
+            parse = _view_parser(get_view_class(attr._item_cls))  # pylint: disable=W0212
+        elif isinstance(attr, DtoIterableDescriptor):
+            item_parser = _view_parser(get_view_class(attr._item_cls))  # pylint: disable=W0212
+            parse = functools.partial(_parse_items, item_parser)
+        elif isinstance(field.type, type) and issubclass(field.type, CamelCaseDto):
+            parse = _view_parser(get_view_class(field.type))
+
+        if isinstance(attr, (DtoDescriptor, DtoIterableDescriptor)):
+            default: Callable[[], Any] = functools.partial(_identity, None)
+        elif field.default is not dataclasses.MISSING:
+            default = functools.partial(_identity, field.default)
+        elif field.default_factory is not dataclasses.MISSING:
+            default = field.default_factory
+        else:
+            default = _missing_field(cls, name)
+        namespace[name] = _view_property(name, keys, parse, default)
+
+    return type(cls.__name__, (DtoView,), namespace)
+
+
+def _identity(val: Any) -> Any:
+    """Return the given value, used to build the default value getters of the views"""
+    return val
+
+
+def _parse_items(item_parser: Callable[[Any], Any], val: Iterable[Any]) -> List[Any]:
+    """Parse each item of the given value, used to build the parsers of the iterable fields of the views"""
+    return list(map(item_parser, val))
+
+
+def _view_parser(view_cls: Type[DtoView]) -> Callable[[Any], Any]:
+    """Build the function wrapping the dicts into the given view class, leaving the other values as is"""
+    return lambda val: view_cls(val) if isinstance(val, dict) else val
+
+
+def _missing_field(cls: type, name: str) -> Callable[[], Any]:
+    """Build the function raising the error of a required field missing from the dict wrapped by a view"""
+
+    def missing() -> Any:
+        raise AttributeError(f"{cls.__name__!r} view has no value for the required field {name!r}")
+
+    return missing
+
+
+def get_view_class(cls: Type[_C_co]) -> Type[DtoView[_C_co]]:
+    """Retrieve (or build on first use) the read-only view variant of the given DTO class.
+
+    Wrapping a dict returned by the API in a view only allocates one small object, while the fields are read from the
+    dict on each access. See :class:`DtoView`.
+
+    Example:
+        >>> PaginatedSubscriberDto.view()(response).data[0].subscriber_id
+        'subscriber-id'
+    """
+    view = _VIEW_CLASSES.get(cls)
+    if view is None:
+        view = _VIEW_CLASSES[cls] = _build_view_class(cls)
+    return view
+
+
+def set_interned_fields(cls: Type[CamelCaseDto], fields: Optional[Iterable[str]]) -> None:
+    """Set the fields whose string values are interned when parsing the given DTO class (and its compact variant).
+
+    Example:
+        >>> set_interned_fields(SubscriberDto, ["_environment_id", "_organization_id"])
+
+    Args:
+        cls: The DTO class to configure.
+        fields: The fields to intern, or ``None`` to disable interning.
+
+    Raises:
+        ValueError: If a field is not defined by the DTO class.
+    """
+    names = list(fields) if fields is not None else None
+    unknown = set(names or ()) - {f.name for f in dataclasses.fields(cls)}
+    if unknown:
+        raise ValueError(f"Unknown fields for {cls.__name__}: {', '.join(sorted(unknown))}.")
+
+    for klass in (cls, _COMPACT_CLASSES.get(cls)):
+        if klass is not None:
+            setattr(klass, "interned_fields", names)
+            for key in [key for key in _DECODERS if key[0] is klass]:
+                del _DECODERS[key]
@@ -0,0 +1,133 @@
+"""This module is used to define the columnar (struct-of-arrays) representation of a batch of DTO."""
+
+import dataclasses
+import importlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from novu.dto.base import CamelCaseDto, DtoView
+
+
+class Columns:
+    """A batch of DTO stored field by field: each field is a list holding its value for every item of the batch.
+
+    The fields listed in ``categorical`` (by default, the ``categorical_fields`` of the DTO class) are encoded:
+    their column holds the index of each value in :attr:`categories`, or ``-1`` for ``None``, which is the
+    convention of :meth:`pandas.Categorical.from_codes`.
+
+    Example:
+        >>> columns = MessageApi().list(limit=100).to_columns()
+        >>> columns["transaction_id"][:2]
+        ['transaction-1', 'transaction-2']
+        >>> columns.categories["channel"]
+        ['email', 'sms']
+        >>> columns.values("channel")[:2]
+        ['email', 'email']
+    """
+
+    def __init__(self, item_class: Type[CamelCaseDto], columns: Dict[str, list], categories: Dict[str, list]):
+        self.item_class = item_class
+        """The DTO class of the items"""
+
+        self.columns = columns
+        """The list of values (or of codes for the categorical fields) of each field"""
+
+        self.categories = categories
+        """The distinct values of each categorical field, in order of first appearance"""
+
+    @classmethod
+    def from_items(
+        cls,
+        item_class: Type[CamelCaseDto],
+        items: Iterable[Union[CamelCaseDto, DtoView, dict]],
+        fields: Optional[Iterable[str]] = None,
+        categorical: Optional[Iterable[str]] = None,
+    ) -> "Columns":
+        """Build the columns of the given items.
+
+        Args:
+            item_class: The DTO class of the items.
+            items: The DTO, views or camel case dicts (wrapped in views) to store.
+            fields: The fields to store. Defaults to all the fields of the DTO class.
+            categorical: The fields to encode. Defaults to the ``categorical_fields`` of the DTO class.
+
+        Raises:
+            ValueError: If a field to store or to encode is not defined by the DTO class.
+        """
+        names = [f.name for f in dataclasses.fields(item_class)]
+        selected = names if fields is None else list(fields)
+        encoded = set((item_class.categorical_fields or ()) if categorical is None else categorical)
+        unknown = (set(selected) | encoded) - set(names)
+        if unknown:
+            raise ValueError(f"Unknown fields for {item_class.__name__}: {', '.join(sorted(unknown))}.")
+
+        view = item_class.view()
+        rows = [view(item) if isinstance(item, dict) else item for item in items]
+        columns = {name: [getattr(row, name) for row in rows] for name in selected}
+
+        categories: Dict[str, list] = {}
+        for name in selected:
+            if name in encoded:
+                columns[name], categories[name] = _encode(columns[name])
+
+        return cls(item_class, columns, categories)
+
+    @property
+    def fields(self) -> List[str]:
+        """The names of the stored fields"""
+        return list(self.columns)
+
+    def values(self, name: str) -> list:
+        """Retrieve the values of a field, decoding the categorical fields."""
+        column = self.columns[name]
+        if name not in self.categories:
+            return column
+
+        categories = self.categories[name]
+        return [categories[code] if code >= 0 else None for code in column]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Convert each column to a NumPy array (the codes of the categorical fields are an array of ``int32``).
+
+        Raises:
+            ModuleNotFoundError: If NumPy is not installed.
+        """
+        numpy = importlib.import_module("numpy")
+        return {
+            name: numpy.asarray(column, dtype=numpy.int32 if name in self.categories else None)
+            for name, column in self.columns.items()
+        }
+
+    def __getitem__(self, name: str) -> list:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __repr__(self) -> str:
+        return f"Columns({self.item_class.__name__}, fields={self.fields!r}, length={len(self)})"
+
+
+def _encode(column: list) -> tuple:
+    """Encode the values of a column as their index in the list of distinct values (``-1`` for ``None``).
+
+    Lists are compared by their content, as other unhashable values are not supported.
+    """
+    index: Dict[Any, int] = {}
+    categories: List[Any] = []
+    codes: List[int] = []
+    for val in column:
+        if val is None:
+            codes.append(-1)
+            continue
+
+        key = tuple(val) if isinstance(val, list) else val
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(categories)
+            categories.append(val)
+        codes.append(code)
+
+    return codes, categories
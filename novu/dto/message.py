@@ -1,9 +1,10 @@
 """This module is used to gather all DTO definitions related to the Message resource in Novu"""
 
 import dataclasses
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from novu.dto.base import CamelCaseDto, DtoIterableDescriptor
+from novu.dto.columns import Columns
 from novu.enums import Channel, ProviderIdEnum
 
 
@@ -11,6 +12,16 @@ from novu.enums import Channel, ProviderIdEnum
 class MessageDto(CamelCaseDto["MessageDto"]):  # pylint: disable=R0902
     """Definition of an event"""
 
+    categorical_fields = [
+        "_environment_id",
+        "_organization_id",
+        "_template_id",
+        "template_identifier",
+        "channel",
+        "provider_id",
+        "status",
+    ]
+
     identifier: Optional[str] = None
     """The message identifier"""
 
@@ -107,3 +118,12 @@ class PaginatedMessageDto(CamelCaseDto["PaginatedMessageDto"]):
         default_factory=list, item_cls=MessageDto
     )
     """Data"""
+
+    def to_columns(
+        self, fields: Optional[Iterable[str]] = None, categorical: Optional[Iterable[str]] = None
+    ) -> Columns:
+        """Build the columnar representation of the messages of the page.
+
+        See :meth:`~novu.dto.columns.Columns.from_items` for the arguments.
+        """
+        return Columns.from_items(MessageDto, self.data or [], fields, categorical)
@@ -1,9 +1,10 @@
 """This module is used to gather all DTO definitions related to the Notifications resource in Novu"""
 
 import dataclasses
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from novu.dto.base import CamelCaseDto, DtoDescriptor, DtoIterableDescriptor
+from novu.dto.columns import Columns
 from novu.enums import Channel
 
 
@@ -147,6 +148,8 @@ class ActivityNotificationJobResponseDto(CamelCaseDto["ActivityNotificationJobRe
 class ActivityNotificationDto(CamelCaseDto["ActivityNotificationDto"]):  # pylint: disable=R0902
     """Definition of  the notification"""
 
+    categorical_fields = ["_environment_id", "_organization_id", "channels"]
+
     _environment_id: str
     """The environment ID of the notification"""
 
@@ -215,3 +218,12 @@ class PaginatedActivityNotificationDto(CamelCaseDto["PaginatedActivityNotificati
         default_factory=list, item_cls=ActivityNotificationDto
     )
     """Data"""
+
+    def to_columns(
+        self, fields: Optional[Iterable[str]] = None, categorical: Optional[Iterable[str]] = None
+    ) -> Columns:
+        """Build the columnar representation of the notifications of the page.
+
+        See :meth:`~novu.dto.columns.Columns.from_items` for the arguments.
+        """
+        return Columns.from_items(ActivityNotificationDto, self.data or [], fields, categorical)
@@ -0,0 +1,304 @@
+"""This module is used to define the ``TriggerOutbox``, a local journal of the events to trigger in Novu."""
+
+import dataclasses
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Collection, List, Optional, Sequence, Set, Tuple
+
+import requests
+
+from novu.api.event import BulkTriggerError, EventApi
+from novu.constants import (
+    BULK_TRIGGER_MAX_EVENTS,
+    DEFAULT_BULK_TRIGGER_CONCURRENCY,
+    DEFAULT_OUTBOX_MAX_ATTEMPTS,
+    DEFAULT_OUTBOX_MAX_RETRY_INTERVAL,
+    DEFAULT_OUTBOX_RETENTION,
+    DEFAULT_OUTBOX_RETRY_INTERVAL,
+)
+from novu.dto.event import EventDto, InputEventDto
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS novu_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    transaction_id TEXT NOT NULL UNIQUE,
+    event TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    status TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS novu_outbox_pending ON novu_outbox (status, id);
+"""
+
+FAILED = "failed"
+"""The status of the events given up after too many failed attempts"""
+
+_Results = List[Optional[EventDto]]
+
+
+@dataclasses.dataclass(frozen=True)
+class _DrainSettings:
+    """The way the drainer of a :class:`TriggerOutbox` sends the journaled events (see its arguments)."""
+
+    api: EventApi
+    batch_size: int
+    retry_interval: float
+    max_retry_interval: float
+    max_attempts: int
+    retention: float
+
+
+def _transient(error: BaseException) -> bool:
+    """Check if a request failed because Novu is unreachable or overloaded (connection error, timeout, HTTP 429 or
+    5xx), rather than because of its events (e.g. an invalid payload rejected by Novu)."""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = error.response if isinstance(error, requests.HTTPError) else None
+    return response is not None and (response.status_code == 429 or response.status_code >= 500)
+
+
+class TriggerOutbox:
+    """A journal of the events to trigger, stored in a SQLite database and sent in bulk by a background drainer.
+
+    Enqueuing an event only appends it to the journal, so it is neither slowed down nor lost when Novu is slow or
+    unreachable: the drainer keeps the events until Novu acknowledges them, and the journal survives a crash of the
+    process. Only the failures caused by the events themselves count toward ``max_attempts``: an outage of Novu,
+    however long, does not give up any event. Each event is identified by its transaction ID (a UUID is generated
+    if it has none):
+
+    * an event enqueued again with the transaction ID of a journaled event is ignored, so replaying the events of a
+      crashed job does not trigger them twice;
+    * an event whose acknowledgement was lost in a crash is sent again with the same transaction ID.
+
+    The acknowledged events are kept for ``retention`` seconds to deduplicate them, then purged. A single drainer
+    should send the events of a journal, but any number of threads can enqueue events.
+
+    Example:
+        >>> with TriggerOutbox("novu-outbox.sqlite3") as outbox:
+        ...     outbox.enqueue(InputEventDto("welcome", "subscriber-id", {}))
+        '0b1c7f9a-...'
+    """
+
+    def __init__(
+        self,
+        path: str,
+        api: Optional[EventApi] = None,
+        batch_size: int = BULK_TRIGGER_MAX_EVENTS * DEFAULT_BULK_TRIGGER_CONCURRENCY,
+        retry_interval: float = DEFAULT_OUTBOX_RETRY_INTERVAL,
+        max_retry_interval: float = DEFAULT_OUTBOX_MAX_RETRY_INTERVAL,
+        max_attempts: int = DEFAULT_OUTBOX_MAX_ATTEMPTS,
+        retention: float = DEFAULT_OUTBOX_RETENTION,
+        drain: bool = True,
+    ) -> None:
+        """
+        Args:
+            path: The path of the SQLite database, created if needed.
+            api: The API used to trigger the events. Defaults to an ``EventApi`` using the global configuration.
+            batch_size: The number of events sent per drained batch, split into concurrent bulk requests of at most
+                100 events. Defaults to 400.
+            retry_interval: The time to wait, in seconds, after a failed batch or between checks for events enqueued
+                by other processes. Defaults to 5.
+            max_retry_interval: The longest time to wait after a failed batch, in seconds, as the wait is doubled
+                after each consecutive failed drain. Defaults to 300.
+            max_attempts: The number of failed attempts after which an event is given up, only counting the
+                failures which are not transient (i.e. not a connection error, a timeout, HTTP 429 or 5xx).
+                Defaults to 10.
+            retention: The time to keep the sent events, in seconds, to deduplicate them. Defaults to one day.
+            drain: Whether to start the background drainer. Otherwise, call :meth:`drain` to send the events.
+
+        Raises:
+            ValueError: If the batch size or the maximum number of attempts is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError(f"The batch size must be positive, got {batch_size}.")
+        if max_attempts < 1:
+            raise ValueError(f"The maximum number of attempts must be positive, got {max_attempts}.")
+
+        self.__settings = _DrainSettings(
+            api or EventApi(), batch_size, retry_interval, max_retry_interval, max_attempts, retention
+        )
+
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.executescript(_SCHEMA)
+        self.__lock = threading.Lock()
+        self.__drain_lock = threading.Lock()
+
+        self.__wakeup = threading.Event()
+        self.__stopping = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        if drain:
+            self.__thread = threading.Thread(target=self.__run, name="novu-trigger-outbox", daemon=True)
+            self.__thread.start()
+
+    def enqueue(self, event: InputEventDto) -> str:
+        """Append an event to the journal, unless an event with the same transaction ID has already been journaled.
+
+        Args:
+            event: The event to trigger.
+
+        Returns:
+            The transaction ID of the event, generated if the event has none.
+        """
+        if not event.transaction_id:
+            event = dataclasses.replace(event, transaction_id=str(uuid.uuid4()))
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR IGNORE INTO novu_outbox (transaction_id, event, updated_at) VALUES (?, ?, ?)",
+                (event.transaction_id, json.dumps(event.to_camel_case()), time.time()),
+            )
+        self.__wakeup.set()
+
+        return event.transaction_id  # type: ignore[return-value]
+
+    def pending(self) -> int:
+        """Count the events waiting to be sent."""
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM novu_outbox WHERE status IS NULL").fetchone()[0]
+
+    def status(self, transaction_id: str) -> Optional[str]:
+        """Retrieve the status of a journaled event.
+
+        Returns:
+            The :class:`~novu.enums.EventStatus` returned by Novu, ``"failed"`` if the event has been given up, or
+            ``None`` if the event is waiting to be sent (or is unknown).
+        """
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT status FROM novu_outbox WHERE transaction_id = ?", (transaction_id,)
+            ).fetchone()
+        return row and row[0]
+
+    def drain(self) -> int:
+        """Send the events waiting in the journal, batch after batch, then purge the expired sent events.
+
+        Returns:
+            The number of events acknowledged by Novu.
+
+        When a request of a batch fails, its events are sent again one by one, so that an event rejected by Novu
+        does not charge a failed attempt to the other events of its request. This stops at the first event failed with
+        a transient error, as the next ones would most likely fail the same way. A failed attempt is only charged to
+        the events sent on their own and failed with an error which is not transient.
+
+        Raises:
+            Exception: The error raised by :meth:`~novu.api.event.EventApi.trigger_bulk` for a batch, once the failed
+                attempts of its events are recorded. The events of this batch acknowledged by Novu are not sent again.
+        """
+        sent = 0
+        with self.__drain_lock:
+            while not self.__stopping.is_set():
+                batch = self.__next_batch()
+                if not batch:
+                    break
+
+                transaction_ids = [transaction_id for transaction_id, _ in batch]
+                events = [event for _, event in batch]
+                error: Optional[Exception] = None
+                charged: Set[int] = set()
+                try:
+                    results: Sequence[Optional[EventDto]] = self.__settings.api.trigger_bulk(events)
+                except Exception as exc:  # pylint: disable=W0703
+                    error = exc
+                    results, charged = self.__isolate(
+                        events, exc.results if isinstance(exc, BulkTriggerError) else None
+                    )
+                sent += self.__record(transaction_ids, results, charged)
+                if error is not None and None in results:
+                    raise error
+
+            with self.__lock, self.__connection:
+                self.__connection.execute(
+                    "DELETE FROM novu_outbox WHERE status IS NOT NULL AND updated_at < ?",
+                    (time.time() - self.__settings.retention,),
+                )
+
+        return sent
+
+    def close(self) -> None:
+        """Stop the drainer, once its current batch is sent, and close the journal. The events waiting in the journal
+        are sent by the next outbox opened on it."""
+        self.__stopping.set()
+        self.__wakeup.set()
+        if self.__thread:
+            self.__thread.join()
+        with self.__lock:
+            self.__connection.close()
+
+    def __enter__(self) -> "TriggerOutbox":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __next_batch(self) -> List[Tuple[str, InputEventDto]]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT transaction_id, event FROM novu_outbox WHERE status IS NULL ORDER BY id LIMIT ?",
+                (self.__settings.batch_size,),
+            ).fetchall()
+        return [(transaction_id, InputEventDto.from_camel_case(json.loads(event))) for transaction_id, event in rows]
+
+    def __record(
+        self, transaction_ids: List[str], results: Sequence[Optional[EventDto]], charged: Collection[int]
+    ) -> int:
+        """Record the status of the acknowledged events, and a failed attempt for the charged ones (given by index)."""
+        now = time.time()
+        acknowledged: List[Tuple[str, float, str]] = []
+        failed: List[Tuple[int, str, float, str]] = []
+        for index, (transaction_id, result) in enumerate(zip(transaction_ids, results)):
+            if result is not None:
+                acknowledged.append((str(result.status), now, transaction_id))
+            elif index in charged:
+                failed.append((self.__settings.max_attempts, FAILED, now, transaction_id))
+
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                "UPDATE novu_outbox SET status = ?, updated_at = ? WHERE transaction_id = ?", acknowledged
+            )
+            self.__connection.executemany(
+                "UPDATE novu_outbox SET attempts = attempts + 1, "
+                "status = CASE WHEN attempts + 1 >= ? THEN ? END, updated_at = ? WHERE transaction_id = ?",
+                failed,
+            )
+
+        return len(acknowledged)
+
+    def __isolate(self, events: List[InputEventDto], results: Optional[_Results]) -> Tuple[_Results, Set[int]]:
+        """Send one by one the events of a batch not acknowledged by Novu (all of them if no results are given).
+
+        Returns:
+            The results of the events, and the indexes of the events to charge a failed attempt.
+        """
+        results = list(results) if results is not None else [None] * len(events)
+        charged: Set[int] = set()
+        for index, result in enumerate(results):
+            if result is not None:
+                continue
+            try:
+                results[index] = self.__settings.api.trigger_bulk([events[index]])[0]
+            except BulkTriggerError as error:
+                if _transient(error.failures[0][1]):
+                    break
+                charged.add(index)
+        return results, charged
+
+    def __run(self) -> None:
+        delay = self.__settings.retry_interval
+        while not self.__stopping.is_set():
+            self.__wakeup.clear()
+            try:
+                self.drain()
+            except Exception:  # pylint: disable=W0703
+                LOGGER.exception("Failed to drain the outbox, retrying in %s seconds.", delay)
+                self.__stopping.wait(delay)
+                delay = min(delay * 2, self.__settings.max_retry_interval)
+            else:
+                delay = self.__settings.retry_interval
+                self.__wakeup.wait(delay)
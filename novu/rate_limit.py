@@ -0,0 +1,190 @@
+"""This module is used to define the ``RateLimiter`` applied by the API classes before sending the requests."""
+
+import threading
+import time
+from typing import Dict, Mapping, Optional, Union
+
+from novu.constants import EVENTS_ENDPOINT, SUBSCRIBERS_ENDPOINT
+
+TRIGGERS = "triggers"
+"""The group of the requests triggering events"""
+
+SUBSCRIBER_WRITES = "subscriber_writes"
+"""The group of the requests creating, updating or deleting subscribers"""
+
+WRITES = "writes"
+"""The group of the other requests creating, updating or deleting resources"""
+
+READS = "reads"
+"""The group of the requests reading resources"""
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def endpoint_group(method: str, url: str) -> str:
+    """Classify a request into the endpoint group whose rate limit applies to it.
+
+    Args:
+        method: The HTTP method of the request.
+        url: The URL of the request.
+
+    Returns:
+        One of :data:`TRIGGERS`, :data:`SUBSCRIBER_WRITES`, :data:`WRITES` or :data:`READS`.
+    """
+    if method.upper() in _READ_METHODS:
+        return READS
+    if EVENTS_ENDPOINT in url:
+        return TRIGGERS
+    if SUBSCRIBERS_ENDPOINT in url:
+        return SUBSCRIBER_WRITES
+    return WRITES
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would wait longer than allowed for its rate limit."""
+
+    def __init__(self, group: str, delay: float):
+        self.group = group
+        """The endpoint group of the request"""
+
+        self.delay = delay
+        """The time the request would have waited, in seconds"""
+
+        super().__init__(f"The rate limit of the {group} requests would delay this request by {delay:.3f} seconds.")
+
+
+class TokenBucket:
+    """A thread-safe token bucket, refilled with ``rate`` tokens per second up to ``burst`` tokens.
+
+    The tokens can be reserved in advance: a reservation is granted at once, and tells how long to wait before
+    the tokens are actually available. Concurrent callers are then served in order, without polling.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Args:
+            rate: The number of tokens added per second.
+            burst: The maximum number of tokens stored. Defaults to the rate (one second of requests).
+
+        Raises:
+            ValueError: If the rate or the burst is not positive.
+        """
+        burst = rate if burst is None else burst
+        if rate <= 0 or burst <= 0:
+            raise ValueError(f"The rate and the burst must be positive, got {rate} and {burst}.")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        """Reserve tokens, unless they would not be available within ``max_wait`` seconds.
+
+        Args:
+            tokens: The number of tokens to take. Defaults to 1.
+            max_wait: The longest time to wait for the tokens, in seconds. Defaults to no limit.
+
+        Returns:
+            The time to wait before using the tokens, in seconds, or ``None`` if they were not reserved.
+        """
+        with self._lock:
+            delay = self.__wait_time(tokens)
+            if max_wait is not None and delay > max_wait:
+                return None
+            self._tokens -= tokens
+            return delay
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """Compute the time to wait for tokens to be available, in seconds, without reserving them."""
+        with self._lock:
+            return self.__wait_time(tokens)
+
+    def __wait_time(self, tokens: float) -> float:
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated_at) * self.rate, self.burst)
+        self._updated_at = now
+        return max(tokens - self._tokens, 0) / self.rate
+
+    def acquire(self, tokens: float = 1, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """Take tokens, waiting for them if needed.
+
+        Args:
+            tokens: The number of tokens to take. Defaults to 1.
+            blocking: Whether to wait for the tokens. Otherwise, the tokens are only taken if available at once.
+            timeout: The longest time to wait for the tokens, in seconds. Defaults to no limit.
+
+        Returns:
+            Whether the tokens were taken.
+        """
+        delay = self.reserve(tokens, timeout if blocking else 0)
+        if delay is None:
+            return False
+        if delay:
+            time.sleep(delay)
+        return True
+
+
+class RateLimiter:
+    """A client-side rate limiter, with a token bucket per endpoint group (see :func:`endpoint_group`).
+
+    A single limiter is meant to be shared by all the API instances (and threads) calling the same Novu account, so
+    that they send at most the requests allowed by its rate limits. The groups without limit are not limited.
+
+    Example:
+        >>> from novu.api.base import Api
+        >>> Api.rate_limiter = RateLimiter({TRIGGERS: 50, SUBSCRIBER_WRITES: 20, READS: TokenBucket(100, burst=200)})
+    """
+
+    def __init__(self, limits: Mapping[str, Union[float, TokenBucket]], max_wait: Optional[float] = None):
+        """
+        Args:
+            limits: The number of requests per second allowed for each endpoint group, or the bucket of the group.
+            max_wait: The longest time a request can wait for its rate limit, in seconds, after which
+                :class:`RateLimitExceeded` is raised instead. Use ``0`` to never wait. Defaults to no limit.
+        """
+        self.buckets: Dict[str, TokenBucket] = {
+            group: limit if isinstance(limit, TokenBucket) else TokenBucket(limit) for group, limit in limits.items()
+        }
+        """The bucket of each limited endpoint group"""
+
+        self.max_wait = max_wait
+        """The longest time a request can wait for its rate limit, in seconds"""
+
+    def reserve(self, method: str, url: str) -> float:
+        """Reserve the rate limit of a request.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The URL of the request.
+
+        Returns:
+            The time to wait before sending the request, in seconds.
+
+        Raises:
+            RateLimitExceeded: If the request would wait longer than ``max_wait``.
+        """
+        group = endpoint_group(method, url)
+        bucket = self.buckets.get(group)
+        if bucket is None:
+            return 0
+
+        delay = bucket.reserve(max_wait=self.max_wait)
+        if delay is None:
+            raise RateLimitExceeded(group, bucket.wait_time())
+        return delay
+
+    def acquire(self, method: str, url: str) -> None:
+        """Wait until a request can be sent.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The URL of the request.
+
+        Raises:
+            RateLimitExceeded: If the request would wait longer than ``max_wait``.
+        """
+        delay = self.reserve(method, url)
+        if delay:
+            time.sleep(delay)
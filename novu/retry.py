@@ -0,0 +1,182 @@
+"""This module is used to define the ``RetryPolicy`` applied by the API classes to the failed requests."""
+
+import dataclasses
+import email.utils
+import random
+import threading
+import time
+from typing import FrozenSet, Mapping, Optional
+
+from novu.constants import (
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_BUDGET_RATIO,
+    DEFAULT_RETRY_BUDGET_RESERVE,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_BACKOFF,
+    DEFAULT_RETRY_MAX_RETRY_AFTER,
+)
+
+
+class RetryBudget:
+    """Bound the retries to a ratio of the requests, so that retries cannot multiply the load of a struggling server.
+
+    Each request deposits ``ratio`` token and each retry withdraws one, up to ``reserve`` tokens: retries are free
+    while the requests mostly succeed, but cannot exceed ``ratio`` of the requests when most of them fail. A budget
+    can be shared by several policies, and is thread-safe.
+    """
+
+    def __init__(self, ratio: float = DEFAULT_RETRY_BUDGET_RATIO, reserve: float = DEFAULT_RETRY_BUDGET_RESERVE):
+        """
+        Args:
+            ratio: The number of retries allowed per request, once the reserve is spent. Defaults to 0.2.
+            reserve: The number of retries allowed at once. Defaults to 10.
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = float(reserve)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.reserve)
+
+    def withdraw(self) -> bool:
+        """Record a retry, if the budget allows it.
+
+        Returns:
+            Whether the retry is allowed.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """Definition of the retries of the requests failed with a transient error.
+
+    A request is retried when it fails with one of the ``statuses`` or without a response (connection error or
+    timeout), if it is idempotent and if the retry budget allows it. The delay before each retry is drawn uniformly
+    between zero and an exponential backoff (the "full jitter" strategy, so that the clients failed at the same time
+    do not retry at the same time), and is at least the delay asked by the ``Retry-After`` header of the response.
+
+    The idempotent requests are the ones using a ``safe_methods``, and the triggers with a transaction ID (which
+    the API deduplicates).
+
+    Example:
+        >>> from novu.api.base import Api
+        >>> Api.retry_policy = RetryPolicy(max_attempts=5)  # For all the API classes
+        >>> subscriber_api = SubscriberApi()
+        >>> subscriber_api.retry_policy = None  # Only for this instance
+    """
+
+    max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
+    """The maximum number of attempts of a request, including the first one."""
+
+    backoff: float = DEFAULT_RETRY_BACKOFF
+    """The maximum delay before the first retry, in seconds, doubled at each retry."""
+
+    max_backoff: float = DEFAULT_RETRY_MAX_BACKOFF
+    """The upper bound of the maximum delay before a retry, in seconds."""
+
+    max_retry_after: float = DEFAULT_RETRY_MAX_RETRY_AFTER
+    """The longest ``Retry-After`` delay to wait, in seconds. A request asking for more is not retried."""
+
+    statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    """The HTTP status codes of the transient errors."""
+
+    safe_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    """The idempotent HTTP methods, which can be retried whatever the request."""
+
+    budget: RetryBudget = dataclasses.field(default_factory=RetryBudget, compare=False)
+    """The retry budget shared by all the requests using this policy."""
+
+    def next_delay(
+        self,
+        attempt: int,
+        method: str,
+        idempotent: Optional[bool] = None,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Compute the delay before retrying a failed attempt of a request.
+
+        Args:
+            attempt: The number of the failed attempt, starting at 0.
+            method: The HTTP method of the request.
+            idempotent: Whether the request can be sent several times. Defaults to whether the method is safe.
+            status: The HTTP status code of the response, or ``None`` if no response was received.
+            retry_after: The ``Retry-After`` header of the response (a number of seconds or an HTTP date).
+
+        Returns:
+            The delay to wait before the next attempt, in seconds, or ``None`` if the request must not be retried.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if status is not None and status not in self.statuses:
+            return None
+        if not (method.upper() in self.safe_methods if idempotent is None else idempotent):
+            return None
+
+        delay = random.uniform(0, min(self.backoff * 2**attempt, self.max_backoff))  # nosec B311
+        wait = _parse_retry_after(retry_after)
+        if wait is not None:
+            if wait > self.max_retry_after:
+                return None
+            delay = max(delay, wait)
+
+        if not self.budget.withdraw():
+            return None
+        return delay
+
+    def start(self) -> None:
+        """Record a new request in the retry budget, before its first attempt."""
+        self.budget.deposit()
+
+    def response_delay(
+        self,
+        attempt: int,
+        method: str,
+        idempotent: Optional[bool],
+        status: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """Compute the delay before retrying an attempt of a request failed with an error response, honoring its
+        ``Retry-After`` header (see :meth:`next_delay`).
+
+        Args:
+            attempt: The number of the failed attempt, starting at 0.
+            method: The HTTP method of the request.
+            idempotent: Whether the request can be sent several times. Defaults to whether the method is safe.
+            status: The HTTP status code of the response.
+            headers: The headers of the response.
+
+        Returns:
+            The delay to wait before the next attempt, in seconds, or ``None`` if the request must not be retried.
+        """
+        retry_after = headers.get("Retry-After") if headers else None
+        return self.next_delay(attempt, method, idempotent, status, retry_after)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header into a number of seconds, or ``None`` if it is missing or invalid."""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+"""The policy used by default by all the API classes, sharing a single retry budget."""
@@ -0,0 +1,223 @@
+"""This module is used to define the transports sending the requests of the synchronous API classes."""
+
+import abc
+import io
+import json as jsonlib
+from collections.abc import Iterable
+from typing import Any, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    LocationParseError,
+    NewConnectionError,
+    ProxyError,
+    ReadTimeoutError,
+    SSLError,
+)
+
+from novu.constants import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+
+Timeout = Optional[Union[float, Tuple[Optional[float], Optional[float]]]]
+"""The timeout of a request, in seconds, or a ``(connect, read)`` tuple (like :mod:`requests`)"""
+
+
+class Transport(abc.ABC):
+    """Base class of the transports sending the requests of :meth:`~novu.api.base.Api.handle_request`.
+
+    A transport sends a single request and returns its response, whatever its status: the retries, rate limits and
+    errors on bad status are handled by the API classes. To plug in a custom transport, subclass this class,
+    implement :meth:`request` and set an instance as ``Api.transport``.
+
+    A transport must raise :class:`requests.ConnectionError` or :class:`requests.Timeout` (or their subclasses) when
+    no response is received, so that the failed requests can be retried.
+    """
+
+    @abc.abstractmethod
+    def request(  # pylint: disable=R0913
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[dict, list]] = None,
+        params: Optional[dict] = None,
+        timeout: Timeout = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request.
+
+        Args:
+            method: The HTTP method used during the request (e.g. "POST").
+            url: The URL to reach during the request.
+            headers: The headers to send.
+            json: The body to send, in json format. Defaults to None.
+            params: The query params to send (``None`` values are dropped). Defaults to None.
+            timeout: The timeout of the request. Defaults to no timeout.
+            **kwargs: The extra arguments given to :meth:`~novu.api.base.Api.handle_request`.
+
+        Returns:
+            The response of the request, with its body already read.
+
+        Raises:
+            requests.ConnectionError: If the connection failed.
+            requests.Timeout: If the request timed out.
+        """
+
+    def close(self) -> None:
+        """Release the connections of the transport."""
+
+
+class RequestsTransport(Transport):
+    """The default transport, sending the requests with a :class:`requests.Session`.
+
+    It supports all the features of :mod:`requests` (proxies from the environment, ``.netrc``, adapters mounted on
+    the session, ...) and all its keyword arguments.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: The session used to send the requests. Defaults to a new session.
+        """
+        self.session = session or requests.Session()
+
+    def request(  # pylint: disable=R0913
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[dict, list]] = None,
+        params: Optional[dict] = None,
+        timeout: Timeout = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        return self.session.request(
+            method=method, url=url, headers=headers, json=json, params=params, timeout=timeout, **kwargs
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _encode_params(params: Optional[dict]) -> str:
+    """Encode query params like :mod:`requests` does (drop ``None`` values and repeat the keys of the lists)."""
+    if not params:
+        return ""
+
+    pairs: List[Tuple[str, Any]] = []
+    for key, values in params.items():
+        if isinstance(values, (str, bytes)) or not isinstance(values, Iterable):
+            values = [values]
+        pairs.extend((key, value) for value in values if value is not None)
+    return urlencode(pairs)
+
+
+class Urllib3Transport(Transport):
+    """A lean transport, sending the requests with a :class:`urllib3.PoolManager`.
+
+    It skips the per-request work of :mod:`requests` (session settings merge, environment lookup, request
+    preparation, hooks), which shows up at high request rates. The responses are still :class:`requests.Response`
+    and the errors are still raised as :mod:`requests` exceptions, so the API classes behave the same.
+
+    Unlike :class:`RequestsTransport`, it ignores the proxies set in the environment (use a
+    :class:`urllib3.ProxyManager` instead), does not follow redirects and does not accept extra keyword arguments.
+
+    Example:
+        >>> from novu.api.base import Api
+        >>> Api.transport = Urllib3Transport()
+    """
+
+    def __init__(
+        self,
+        pool_manager: Optional[urllib3.PoolManager] = None,
+        num_pools: int = DEFAULT_POOL_CONNECTIONS,
+        maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
+        """
+        Args:
+            pool_manager: The pool manager used to send the requests. Defaults to a new pool manager, verifying
+                the certificates with the same CA bundle as :mod:`requests`.
+            num_pools: The number of host connection pools of the default pool manager. Defaults to 10.
+            maxsize: The maximum number of connections to keep alive per host in the default pool manager.
+                Defaults to 10.
+        """
+        self.pool_manager = pool_manager or urllib3.PoolManager(
+            num_pools=num_pools, maxsize=maxsize, cert_reqs="CERT_REQUIRED", ca_certs=DEFAULT_CA_BUNDLE_PATH
+        )
+        self._default_headers = urllib3.make_headers(keep_alive=True, accept_encoding=True)
+        self._default_headers["Accept"] = "*/*"
+
+    def request(  # pylint: disable=R0913
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[dict, list]] = None,
+        params: Optional[dict] = None,
+        timeout: Timeout = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} does not support the arguments {', '.join(kwargs)}.")
+
+        query = _encode_params(params)
+        if query:
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+
+        _headers = {**self._default_headers, **headers}
+        body = None
+        if json is not None:
+            body = jsonlib.dumps(json, allow_nan=False).encode("utf-8")
+            _headers.setdefault("Content-Type", "application/json")
+
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+        try:
+            raw = self.pool_manager.urlopen(
+                method,
+                url,
+                body=body,
+                headers=_headers,
+                timeout=urllib3.Timeout(connect=connect, read=read),
+                retries=False,
+                redirect=False,
+            )
+        except (HTTPError, OSError) as error:
+            raise _translate_error(error) from error
+
+        return _build_response(raw, url)
+
+    def close(self) -> None:
+        self.pool_manager.clear()
+
+
+def _build_response(raw: "urllib3.BaseHTTPResponse", url: str) -> requests.Response:
+    """Wrap a response of :mod:`urllib3`, whose body is already read, into a :class:`requests.Response`."""
+    response = requests.Response()
+    response.status_code = raw.status
+    response.reason = raw.reason or ""
+    response.url = url
+    response.headers = CaseInsensitiveDict(raw.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(raw.data)
+    return response
+
+
+def _translate_error(error: Exception) -> requests.RequestException:
+    """Translate an error of :mod:`urllib3` into the :mod:`requests` exception raised for it by :mod:`requests`."""
+    if isinstance(error, ConnectTimeoutError) and not isinstance(error, NewConnectionError):
+        return requests.ConnectTimeout(error)
+    if isinstance(error, ReadTimeoutError):
+        return requests.ReadTimeout(error)
+    if isinstance(error, SSLError):
+        return requests.exceptions.SSLError(error)
+    if isinstance(error, ProxyError):
+        return requests.exceptions.ProxyError(error)
+    if isinstance(error, LocationParseError):
+        return requests.exceptions.InvalidURL(error)
+    return requests.ConnectionError(error)
@@ -0,0 +1,463 @@
+import asyncio
+from typing import List
+from unittest import IsolatedAsyncioTestCase, TestCase, mock
+
+import httpx
+import pkg_resources
+
+from novu.aio.base import Api, ClientPool, PaginationIterator, _build_params
+from novu.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from novu.concurrency import AsyncAdaptiveConcurrencyLimiter
+from novu.config import NovuConfig
+from novu.dto.tenant import TenantDto
+from novu.rate_limit import READS, RateLimiter, TokenBucket
+from novu.retry import RetryPolicy
+from tests.factories import build_httpx_response
+
+__version__ = pkg_resources.get_distribution("novu").version
+
+
+class ApiTests(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        NovuConfig.configure("sample.novu.com", "api-key")
+        cls.api = Api()
+
+    async def asyncTearDown(self) -> None:
+        await ClientPool().aclose()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_handle_request_with_header_override(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(200, {"data": "value"})
+
+        res = await self.api.handle_request("GET", self.api._url, headers={"MyHeader": "value"})
+        self.assertEqual(res, {"data": "value"})
+
+        mock_request.assert_awaited_once_with(
+            method="GET",
+            url="sample.novu.com",
+            headers={
+                "Authorization": "ApiKey api-key",
+                "User-Agent": f"novu/python@{__version__}",
+                "MyHeader": "value",
+            },
+            json=None,
+            params=None,
+            timeout=5,
+        )
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_handle_request_no_content(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(204)
+
+        res = await self.api.handle_request("DELETE", self.api._url)
+        self.assertEqual(res, {})
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_handle_request_raise_with_details(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(500, {"details": "my-detail"})
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.handle_request("GET", self.api._url)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_handle_request_raise_without_details(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(500, raise_on_json_decode=True)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.handle_request("GET", self.api._url)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_override_requests_timeout(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(200)
+
+        api = Api(requests_timeout=60)
+        await api.handle_request("GET", api._url, payload={"page": 1})
+
+        mock_request.assert_awaited_once_with(
+            method="GET",
+            url="sample.novu.com",
+            headers={"Authorization": "ApiKey api-key", "User-Agent": f"novu/python@{__version__}"},
+            json=None,
+            params={"page": 1},
+            timeout=60,
+        )
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_use_client_session(self, mock_request: mock.AsyncMock) -> None:
+        session_mock = mock.MagicMock()
+        session_mock.request = mock.AsyncMock(return_value=build_httpx_response(200))
+        api = Api(session=session_mock)
+
+        res = await api.handle_request("GET", api._url)
+        self.assertEqual(res, {})
+
+        mock_request.assert_not_awaited()
+        session_mock.request.assert_awaited_once()
+
+    @mock.patch("asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_retry_transient_errors(self, mock_request: mock.AsyncMock, mock_sleep: mock.AsyncMock) -> None:
+        mock_request.side_effect = [
+            httpx.ConnectError("refused"),
+            build_httpx_response(429, headers={"Retry-After": "2"}),
+            build_httpx_response(200, {"data": "value"}),
+        ]
+        api = Api()
+        api.retry_policy = RetryPolicy(max_attempts=3)
+
+        self.assertEqual(await api.handle_request("GET", api._url), {"data": "value"})
+
+        self.assertEqual(mock_request.await_count, 3)
+        self.assertEqual(mock_sleep.await_count, 2)
+        self.assertGreaterEqual(mock_sleep.call_args_list[1].args[0], 2)
+
+    @mock.patch("asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_retry_only_idempotent_requests(
+        self, mock_request: mock.AsyncMock, mock_sleep: mock.AsyncMock
+    ) -> None:
+        mock_request.return_value = build_httpx_response(503)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.handle_request("POST", self.api._url)
+        self.assertEqual(mock_request.await_count, 1)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.handle_request("POST", self.api._url, idempotent=True)
+        self.assertEqual(mock_request.await_count, 4)
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    @mock.patch("asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_rate_limiter(self, mock_request: mock.AsyncMock, mock_sleep: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(200)
+        api = Api()
+        api.rate_limiter = RateLimiter({READS: TokenBucket(0.001, burst=1)})
+
+        await api.handle_request("GET", api._url)
+        await api.handle_request("GET", api._url)
+
+        self.assertEqual(mock_request.await_count, 2)
+        self.assertEqual(mock_sleep.await_args_list[0].args, (0,))
+        self.assertGreater(mock_sleep.await_args_list[1].args[0], 0)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_concurrency_limiter(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [build_httpx_response(200), build_httpx_response(503)]
+        api = Api()
+        api.retry_policy = None
+        api.concurrency_limiter = AsyncAdaptiveConcurrencyLimiter(initial_limit=8)
+
+        await api.handle_request("GET", api._url)
+        with self.assertRaises(httpx.HTTPStatusError):
+            await api.handle_request("GET", api._url)
+
+        self.assertEqual(api.concurrency_limiter.limit, 4)
+        self.assertEqual(api.concurrency_limiter.in_flight, 0)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_circuit_breaker(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = httpx.ConnectError("Unreachable")
+        api = Api()
+        api.retry_policy = None
+        api.circuit_breaker = CircuitBreaker(failure_threshold=1)
+
+        with self.assertRaises(httpx.ConnectError):
+            await api.handle_request("GET", f"{api._url}/v1/topics/key")
+        with self.assertRaises(CircuitOpenError):
+            await api.handle_request("GET", f"{api._url}/v1/topics/other")
+
+        mock_request.assert_awaited_once()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_circuit_breaker_recovers_after_cancelled_wait(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [build_httpx_response(503), build_httpx_response(200, {"data": "value"})]
+        api = Api()
+        api.retry_policy = None
+        api.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        api.concurrency_limiter = AsyncAdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        url = f"{api._url}/v1/topics/key"
+        with self.assertRaises(httpx.HTTPStatusError):
+            await api.handle_request("GET", url)
+
+        lease = await api.concurrency_limiter.acquire()
+        waiting = asyncio.ensure_future(api.handle_request("GET", url))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        api.concurrency_limiter.release(lease)
+
+        self.assertEqual(await api.handle_request("GET", url), {"data": "value"})
+        self.assertEqual(api.circuit_breaker.state(url), CircuitState.CLOSED)
+        self.assertEqual(api.concurrency_limiter.in_flight, 0)
+
+
+class PaginationIteratorTests(IsolatedAsyncioTestCase):
+    tenant_json = {"identifier": "tenant", "name": "Tenant"}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        NovuConfig.configure("sample.novu.com", "api-key")
+        cls.api = Api()
+
+    async def asyncTearDown(self) -> None:
+        await ClientPool().aclose()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_iterate_on_multiple_pages(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [
+            build_httpx_response(200, {"page": 0, "hasMore": True, "data": [self.tenant_json] * 10}),
+            build_httpx_response(200, {"page": 1, "hasMore": False, "data": [self.tenant_json]}),
+        ]
+
+        result = [item async for item in PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")]
+
+        self.assertEqual(result, [TenantDto("tenant", "Tenant")] * 11)
+        self.assertEqual(mock_request.await_count, 2)
+        self.assertEqual(
+            [call.kwargs["params"] for call in mock_request.await_args_list],
+            [{"limit": 10, "page": 0}, {"limit": 10, "page": 1}],
+        )
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_iterate_with_page_size(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [
+            build_httpx_response(200, {"page": 0, "totalCount": 3, "data": [self.tenant_json] * 2}),
+            build_httpx_response(200, {"page": 1, "totalCount": 3, "data": [self.tenant_json]}),
+        ]
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", page_size=2)
+        result = [item async for item in iterator]
+
+        self.assertEqual(result, [TenantDto("tenant", "Tenant")] * 3)
+        self.assertEqual(
+            [call.kwargs["params"] for call in mock_request.await_args_list],
+            [{"limit": 2, "page": 0}, {"limit": 2, "page": 1}],
+        )
+
+    def test_invalid_page_size(self) -> None:
+        self.assertRaises(ValueError, PaginationIterator, self.api, TenantDto, "sample.novu.com", page_size=0)
+        self.assertRaises(ValueError, PaginationIterator, self.api, TenantDto, "sample.novu.com", page_size=101)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_iterate_on_empty_result(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(200, {"page": 0, "data": []})
+
+        result = [item async for item in PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")]
+
+        self.assertEqual(result, [])
+        mock_request.assert_awaited_once()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_next_page_prefetched(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [
+            build_httpx_response(200, {"page": 0, "hasMore": True, "data": [self.tenant_json] * 2}),
+            build_httpx_response(200, {"page": 1, "hasMore": False, "data": [self.tenant_json]}),
+        ]
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        self.assertEqual(mock_request.await_count, 0)
+
+        await iterator.__anext__()
+        await asyncio.sleep(0)
+
+        # Second page is requested while the first one is still being consumed
+        self.assertEqual(mock_request.await_count, 2)
+        self.assertEqual(len([item async for item in iterator]), 2)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_aclose_cancel_prefetch(self, mock_request: mock.AsyncMock) -> None:
+        blocked = asyncio.Event()
+
+        async def request(**kwargs):
+            if kwargs["params"]["page"] == 0:
+                return build_httpx_response(200, {"page": 0, "hasMore": True, "data": [self.tenant_json]})
+            await blocked.wait()
+
+        mock_request.side_effect = request
+
+        async with PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants") as iterator:
+            await iterator.__anext__()
+            await asyncio.sleep(0)
+
+        self.assertEqual(mock_request.await_count, 2)
+        with self.assertRaises(StopAsyncIteration):
+            await iterator.__anext__()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_aclose_before_iteration(self, mock_request: mock.AsyncMock) -> None:
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        await iterator.aclose()
+
+        self.assertEqual([item async for item in iterator], [])
+        mock_request.assert_not_awaited()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_aclose_ignore_prefetch_error(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [
+            build_httpx_response(200, {"page": 0, "hasMore": True, "data": [self.tenant_json]}),
+            build_httpx_response(500),
+        ]
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        await iterator.__anext__()
+        await asyncio.sleep(0)
+
+        await iterator.aclose()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_prefetch_error_raised_on_next_page(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [
+            build_httpx_response(200, {"page": 0, "hasMore": True, "data": [self.tenant_json]}),
+            build_httpx_response(500),
+        ]
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        await iterator.__anext__()
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await iterator.__anext__()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_checkpoint_and_resume(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = [
+            build_httpx_response(200, {"page": 0, "totalCount": 15, "data": [self.tenant_json] * 10}),
+            build_httpx_response(200, {"page": 1, "totalCount": 15, "data": [self.tenant_json] * 5}),
+        ]
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        self.assertEqual(iterator.checkpoint(), {"page": 0, "index": 0, "page_size": 10})
+        for _ in range(4):
+            await iterator.next()
+        await iterator.aclose()
+
+        cursor = iterator.checkpoint()
+        self.assertEqual(cursor, {"page": 0, "index": 4, "page_size": 10})
+        self.assertEqual([item async for item in iterator], [])
+
+        mock_request.reset_mock(side_effect=True)
+        mock_request.side_effect = [
+            build_httpx_response(200, {"page": 2, "totalCount": 15, "data": [self.tenant_json] * 3}),
+        ]
+
+        resumed = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", page_size=2, resume_from=cursor)
+
+        self.assertEqual(resumed.checkpoint(), {"page": 2, "index": 0, "page_size": 2})
+        self.assertEqual(await resumed.next(), TenantDto("tenant", "Tenant"))
+        self.assertEqual(mock_request.await_args.kwargs["params"], {"limit": 2, "page": 2})
+        await resumed.aclose()
+
+    def build_pages(self, count: int) -> List[httpx.Response]:
+        return [
+            build_httpx_response(200, {"page": page, "hasMore": page < count - 1, "data": [self.tenant_json] * 3})
+            for page in range(count)
+        ]
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_pages(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.build_pages(3)
+
+        async with PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants") as iterator:
+            await iterator.next()
+            pages = [page async for page in iterator.pages()]
+
+        self.assertEqual([len(page) for page in pages], [2, 3, 3])
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_batches(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.build_pages(3)
+
+        async with PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants") as iterator:
+            batches = iterator.batches(2)
+            first = await batches.__anext__()
+            await batches.__anext__()
+            self.assertEqual(iterator.checkpoint(), {"page": 1, "index": 1, "page_size": 10})
+            remaining = [batch async for batch in batches]
+
+        self.assertEqual(first, [TenantDto("tenant", "Tenant")] * 2)
+        self.assertEqual([len(batch) for batch in remaining], [2, 2, 1])
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_batches_stopped_on_aclose(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.build_pages(3)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        batches = iterator.batches(3)
+        await batches.__anext__()
+        await iterator.aclose()
+
+        self.assertEqual([batch async for batch in batches], [])
+
+    def test_invalid_batch_size(self) -> None:
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertRaises(ValueError, iterator.batches, 0)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_iterate_raw(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.build_pages(2)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", raw=True)
+
+        self.assertEqual([item async for item in iterator], [self.tenant_json] * 6)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_iterate_columns(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.build_pages(2)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        batches = [columns async for columns in iterator.columns(4, fields=["name"])]
+
+        self.assertEqual([columns["name"] for columns in batches], [["Tenant"] * 4, ["Tenant"] * 2])
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_iterate_view(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.build_pages(2)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", view=True)
+
+        self.assertEqual([item async for item in iterator], [TenantDto.view()(self.tenant_json)] * 6)
+
+
+class ClientPoolTests(IsolatedAsyncioTestCase):
+    async def asyncTearDown(self) -> None:
+        await ClientPool().aclose()
+
+    async def test_client_shared_in_loop(self) -> None:
+        client = ClientPool().get("sample.novu.com", "api-key")
+
+        self.assertIsInstance(client, httpx.AsyncClient)
+        self.assertIs(ClientPool().get("sample.novu.com", "api-key"), client)
+        self.assertIsNot(ClientPool().get("sample.novu.com", "other-api-key"), client)
+
+    async def test_aclose(self) -> None:
+        client = ClientPool().get("sample.novu.com", "api-key")
+
+        await ClientPool().aclose()
+
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(ClientPool().get("sample.novu.com", "api-key"), client)
+
+    async def test_client_not_shared_between_loops(self) -> None:
+        client = ClientPool().get("sample.novu.com", "api-key")
+
+        async def get_client() -> httpx.AsyncClient:
+            other_client = ClientPool().get("sample.novu.com", "api-key")
+            await ClientPool().aclose()
+            return other_client
+
+        other_client = await asyncio.get_running_loop().run_in_executor(None, asyncio.run, get_client())
+
+        self.assertIsNot(other_client, client)
+        self.assertFalse(client.is_closed)
+
+
+class BuildParamsTests(TestCase):
+    def test_build_params(self) -> None:
+        self.assertIsNone(_build_params(None))
+        self.assertEqual(
+            _build_params({"page": 0, "search": None, "check": True, "channels": ["email"]}),
+            {"page": 0, "check": "True", "channels": ["email"]},
+        )
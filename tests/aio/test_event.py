@@ -0,0 +1,151 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, mock
+
+import httpx
+
+from novu.aio import EventApi
+from novu.aio.base import ClientPool
+from novu.api.event import BulkTriggerError
+from novu.config import NovuConfig
+from novu.dto.event import InputEventDto
+from tests.factories import build_httpx_response
+
+
+class EventApiTests(IsolatedAsyncioTestCase):
+    api: EventApi
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        NovuConfig.configure("sample.novu.com", "api-key")
+        cls.api = EventApi()
+
+    async def asyncTearDown(self) -> None:
+        await ClientPool().aclose()
+
+    def setUp(self) -> None:
+        self.in_flight = self.max_in_flight = 0
+
+    async def echo_bulk(self, **kwargs) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+        events = kwargs["json"]["events"]
+        if any(event["to"] == "failing" for event in events):
+            return build_httpx_response(500)
+        return build_httpx_response(
+            201,
+            {"data": [{"acknowledged": True, "status": "processed", "transactionId": event["to"]} for event in events]},
+        )
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_trigger_bulk_chunked(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+        events = [InputEventDto(name="test-template", recipients=f"recipient_{i}", payload={}) for i in range(25)]
+
+        result = await self.api.trigger_bulk(events, chunk_size=2, concurrency=3)
+
+        self.assertEqual([event.transaction_id for event in result], [f"recipient_{i}" for i in range(25)])
+        self.assertEqual(mock_request.await_count, 13)
+        self.assertEqual(self.max_in_flight, 3)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_trigger_bulk_failed_chunks(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+        events = [InputEventDto(name="test-template", recipients=f"recipient_{i}", payload={}) for i in range(4)]
+        events[0] = InputEventDto(name="test-template", recipients="failing", payload={})
+
+        with self.assertRaises(BulkTriggerError) as context:
+            await self.api.trigger_bulk(events, chunk_size=2)
+
+        self.assertEqual(
+            [event and event.transaction_id for event in context.exception.results],
+            [None, None, "recipient_2", "recipient_3"],
+        )
+        self.assertEqual([chunk for chunk, _ in context.exception.failures], [range(0, 2)])
+        self.assertIsInstance(context.exception.failures[0][1], httpx.HTTPStatusError)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_trigger_bulk_single_chunk_error(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+
+        with self.assertRaises(BulkTriggerError) as context:
+            await self.api.trigger_bulk([InputEventDto(name="test-template", recipients="failing", payload={})])
+
+        self.assertEqual(context.exception.results, [None])
+        self.assertIsInstance(context.exception.__cause__, httpx.HTTPStatusError)
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_batcher_groups_by_size(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+
+        async with self.api.batcher(max_batch=3, max_delay_ms=60_000) as batcher:
+            futures = [
+                batcher.submit(InputEventDto(name="test-template", recipients=f"recipient_{i}", payload={}))
+                for i in range(7)
+            ]
+
+        self.assertEqual([(await future).transaction_id for future in futures], [f"recipient_{i}" for i in range(7)])
+        self.assertEqual([len(call.kwargs["json"]["events"]) for call in mock_request.call_args_list], [3, 3, 1])
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_batcher_groups_by_delay(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+        batcher = self.api.batcher(max_delay_ms=1)
+
+        future = batcher.submit(InputEventDto(name="test-template", recipients="recipient", payload={}))
+
+        self.assertEqual((await asyncio.wait_for(future, 5)).transaction_id, "recipient")
+        await batcher.close()
+        mock_request.assert_awaited_once()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_batcher_flush_and_failures(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+
+        async with self.api.batcher(max_delay_ms=60_000) as batcher:
+            first = batcher.submit(InputEventDto(name="test-template", recipients="failing", payload={}))
+            await batcher.flush()
+            self.assertTrue(first.done())
+            second = batcher.submit(InputEventDto(name="test-template", recipients="recipient", payload={}))
+
+        self.assertIsInstance(first.exception(), httpx.HTTPStatusError)
+        self.assertEqual(second.result().transaction_id, "recipient")
+        with self.assertRaises(RuntimeError):
+            batcher.submit(InputEventDto(name="test-template", recipients="recipient", payload={}))
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_batcher_closed(self, mock_request: mock.AsyncMock) -> None:
+        batcher = self.api.batcher()
+        await batcher.close()
+
+        await asyncio.wait_for(batcher.flush(), 5)
+        await asyncio.wait_for(batcher.close(), 5)
+        mock_request.assert_not_awaited()
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_batcher_results_after_cancel(self, mock_request: mock.AsyncMock) -> None:
+        sent, respond = asyncio.Event(), asyncio.Event()
+
+        async def slow_bulk(**kwargs) -> httpx.Response:
+            sent.set()
+            await respond.wait()
+            return await self.echo_bulk(**kwargs)
+
+        mock_request.side_effect = slow_bulk
+        for recipient in ("recipient", "failing"):
+            with self.subTest(recipient=recipient):
+                sent.clear()
+                respond.clear()
+                async with self.api.batcher(max_delay_ms=60_000) as batcher:
+                    cancelled = batcher.submit(InputEventDto(name="test-template", recipients=recipient, payload={}))
+                    kept = batcher.submit(InputEventDto(name="test-template", recipients=recipient, payload={}))
+                    flushing = asyncio.ensure_future(batcher.flush())
+                    await asyncio.wait_for(sent.wait(), 5)
+                    cancelled.cancel()
+                    respond.set()
+                    await flushing
+
+                self.assertTrue(cancelled.cancelled())
+                self.assertEqual(kept.exception() is None, recipient != "failing")
@@ -0,0 +1,331 @@
+import inspect
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from unittest import IsolatedAsyncioTestCase, mock
+
+import httpx
+
+import novu.aio
+import novu.api
+from novu.aio.base import ClientPool, _build_params
+from novu.config import NovuConfig
+from novu.dto import (
+    IntegrationDto,
+    LayoutDto,
+    NotificationTemplateFormDto,
+    OrganizationBrandingDto,
+    SubscriberDto,
+    TriggerTopicDto,
+)
+from novu.dto.event import InputEventDto
+from novu.enums import Channel, MarkAsEnum, MessageActionStatus
+from tests.factories import MockResponse, build_httpx_response
+
+
+class Case(NamedTuple):
+    api: str
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = {}
+    response: Optional[dict] = None
+    status: int = 200
+
+
+event = {"acknowledged": True, "status": "processed", "transactionId": "transaction-id"}
+subscriber = {"subscriberId": "subscriber-id", "email": "subscriber@sample.com"}
+preference = {"preference": {"enabled": True, "channels": {"email": True}}, "template": {"_id": "template-id"}}
+message = {"_id": "message-id", "channel": "in_app", "content": "test"}
+integration = {"providerId": "sendgrid", "channel": "email", "active": True, "_id": "integration-id"}
+layout = {"name": "n", "identifier": "i", "description": "d", "content": "c", "isDefault": False, "_id": "layout-id"}
+notification = {"_environmentId": "env-id", "_organizationId": "org-id", "transactionId": "transaction-id"}
+template = {"name": "template", "_id": "template-id"}
+tenant = {"identifier": "tenant", "name": "Tenant"}
+
+CASES: List[Case] = [
+    Case("BlueprintApi", "get_by_id", ("id",), response={"data": {"name": "n", "description": "d"}}),
+    Case("BlueprintApi", "get_grouped_by_category", response={"data": {"category": "c", "general": [], "popular": []}}),
+    Case("ChangeApi", "list", (1, 10), response={"page": 1, "data": [{"_id": "change-id"}]}),
+    Case("ChangeApi", "count", response={"data": 2}),
+    Case("ChangeApi", "apply", ("id",), response={"data": [{"_id": "change-id"}]}),
+    Case("ChangeApi", "bulk_apply", (["id"],), response={"data": [[{"_id": "change-id"}]]}),
+    Case("EnvironmentApi", "list", response={"data": [{"name": "env"}]}),
+    Case("EnvironmentApi", "create", ("env", "parent"), response={"data": {"name": "env"}}),
+    Case("EnvironmentApi", "current", response={"data": {"name": "env"}}),
+    Case("EnvironmentApi", "api_keys", response={"data": [{"key": "k", "_userId": "u"}]}),
+    Case("EnvironmentApi", "regenerate_api_key", response={"data": [{"key": "k", "_userId": "u"}]}),
+    Case(
+        "EventApi",
+        "trigger",
+        ("event", "subscriber-id", {}),
+        {"overrides": {"a": 1}, "transaction_id": "t", "actor": "a", "tenant": "tenant"},
+        {"data": event},
+    ),
+    Case(
+        "EventApi",
+        "trigger_bulk",
+        ([InputEventDto("event", "subscriber-id", {}, {"a": 1}, "t", "a", "tenant")],),
+        response={"data": [event]},
+    ),
+    Case(
+        "EventApi",
+        "trigger_topic",
+        ("event", TriggerTopicDto("topic", "Topic"), {}),
+        {"overrides": {"a": 1}, "transaction_id": "t", "actor": "a", "tenant": "tenant"},
+        {"data": event},
+    ),
+    Case(
+        "EventApi",
+        "broadcast",
+        ("event", {}),
+        {"overrides": {"a": 1}, "transaction_id": "t", "actor": "a", "tenant": "tenant"},
+        {"data": event},
+    ),
+    Case("EventApi", "delete", ("transaction-id",), status=204),
+    Case("ExecutionDetailApi", "list", ("notification-id", "subscriber-id"), response={"data": [{"_id": "id"}]}),
+    Case("FeedApi", "list", response={"data": [{"name": "feed"}]}),
+    Case("FeedApi", "create", ("feed",), response={"data": {"name": "feed"}}),
+    Case("FeedApi", "delete", ("feed-id",), status=204),
+    Case("InboundParseApi", "validate_mx_record_setup", response={"data": {"mxRecordConfigured": True}}),
+    Case("IntegrationApi", "list", (True,), response={"data": [integration]}),
+    Case("IntegrationApi", "create", (IntegrationDto("sendgrid", "email", True),), response={"data": integration}),
+    Case("IntegrationApi", "status", ("sendgrid",), response={"data": True}),
+    Case(
+        "IntegrationApi",
+        "update",
+        (IntegrationDto("sendgrid", "email", True, _id="integration-id"),),
+        response={"data": integration},
+    ),
+    Case("IntegrationApi", "delete", ("integration-id",), status=204),
+    Case("IntegrationApi", "limit", (Channel.EMAIL,), response={"data": {"count": 1, "limit": 10}}),
+    Case("IntegrationApi", "set_primary", ("integration-id",), response={"data": integration}),
+    Case("LayoutApi", "list", (1, 10), response={"page": 1, "data": [layout]}),
+    Case("LayoutApi", "create", (LayoutDto("n", "i", "d", "c", False),), response={"data": layout}),
+    Case("LayoutApi", "get", ("layout-id",), response={"data": layout}),
+    Case("LayoutApi", "patch", (LayoutDto("n", "i", "d", "c", False, _id="layout-id"),), response={"data": layout}),
+    Case("LayoutApi", "delete", ("layout-id",), status=204),
+    Case("LayoutApi", "set_default", ("layout-id",), status=204),
+    Case("MessageApi", "list", (10, 0, "in_app", "subscriber-id", "t"), response={"data": [message]}),
+    Case("MessageApi", "delete", ("message-id",), response={"data": {"acknowledged": True}}),
+    Case("NotificationApi", "list", (["email"],), {"search": "s"}, {"data": [notification]}),
+    Case("NotificationApi", "stats", response={"data": {"weeklySent": 1, "monthlySent": 2}}),
+    Case(
+        "NotificationApi",
+        "graph_stats",
+        kwargs={"days": 5},
+        response={"data": [{"_id": "id", "count": 1, "templates": [], "channels": []}]},
+    ),
+    Case("NotificationApi", "get", ("notification-id",), response={"data": notification}),
+    Case("NotificationGroupApi", "list", response={"data": [{"name": "group"}]}),
+    Case("NotificationGroupApi", "create", ("group",), response={"data": {"name": "group"}}),
+    Case("NotificationGroupApi", "get", ("group-id",), response={"data": {"name": "group"}}),
+    Case("NotificationGroupApi", "patch", ("group-id", "group"), response={"data": {"name": "group"}}),
+    Case("NotificationGroupApi", "delete", ("group-id",), response={"data": {"name": "group"}}),
+    Case("NotificationTemplateApi", "list", (1, 10), response={"data": [template]}),
+    Case(
+        "NotificationTemplateApi",
+        "create",
+        (NotificationTemplateFormDto("template", "group-id"),),
+        response={"data": template},
+    ),
+    Case("NotificationTemplateApi", "get", ("template-id",), response={"data": template}),
+    Case(
+        "NotificationTemplateApi",
+        "update",
+        ("template-id", NotificationTemplateFormDto("template", "group-id")),
+        response={"data": template},
+    ),
+    Case("NotificationTemplateApi", "delete", ("template-id",), status=204),
+    Case("NotificationTemplateApi", "update_status", ("template-id", True), response={"data": template}),
+    Case("OrganizationApi", "list", response={"data": [{"name": "org"}]}),
+    Case("OrganizationApi", "create", ("org", "logo"), response={"data": {"name": "org"}}),
+    Case("OrganizationApi", "current", response={"data": {"name": "org"}}),
+    Case("OrganizationApi", "rename", ("org",), status=204),
+    Case("OrganizationApi", "list_members", response={"data": [{"_id": "member-id"}]}),
+    Case("OrganizationApi", "remove_member", ("member-id",), response={"data": {"_id": "member-id"}}),
+    Case(
+        "OrganizationApi",
+        "update_branding",
+        (OrganizationBrandingDto(color="#fff"),),
+        response={"data": {"color": "#fff"}},
+    ),
+    Case("SubscriberApi", "list", (1,), response={"page": 1, "data": [subscriber]}),
+    Case("SubscriberApi", "create", (SubscriberDto("subscriber-id"),), response={"data": subscriber}),
+    Case(
+        "SubscriberApi",
+        "bulk_create",
+        ([SubscriberDto("subscriber-id")],),
+        response={"data": {"created": [subscriber], "updated": [], "failed": []}},
+    ),
+    Case("SubscriberApi", "get", ("subscriber-id",), response={"data": subscriber}),
+    Case("SubscriberApi", "put", (SubscriberDto("subscriber-id"),), response={"data": subscriber}),
+    Case("SubscriberApi", "delete", ("subscriber-id",), status=204),
+    Case("SubscriberApi", "credentials", ("subscriber-id", "slack", "url", ["token"]), response={"data": subscriber}),
+    Case("SubscriberApi", "delete_credentials", ("subscriber-id", "slack"), status=204),
+    Case("SubscriberApi", "online_status", ("subscriber-id", True), response={"data": subscriber}),
+    Case("SubscriberApi", "preferences", ("subscriber-id",), response={"data": [preference]}),
+    Case(
+        "SubscriberApi",
+        "change_channel_preference",
+        ("subscriber-id", "template-id", Channel.EMAIL, False),
+        response={"data": preference},
+    ),
+    Case(
+        "SubscriberApi",
+        "change_preference_state",
+        ("subscriber-id", "template-id", False),
+        response={"data": preference},
+    ),
+    Case("SubscriberApi", "unseen_notifications", ("subscriber-id",), response={"data": {"count": 3}}),
+    Case("SubscriberApi", "mark_as", ("subscriber-id", "message-id", True, True), response={"data": [message]}),
+    Case("SubscriberApi", "mark_all_as", ("subscriber-id", MarkAsEnum.READ, ["feed"]), response={"data": 4}),
+    Case(
+        "SubscriberApi",
+        "mark_message_action",
+        ("subscriber-id", "message-id", "primary", MessageActionStatus.DONE, {"a": 1}),
+        response={"data": message},
+    ),
+    Case("TenantApi", "list", (1, 10), response={"data": [tenant]}),
+    Case("TenantApi", "create", ("tenant", "Tenant", {"a": 1}), response={"data": tenant}),
+    Case("TenantApi", "get", ("tenant",), response={"data": tenant}),
+    Case("TenantApi", "patch", ("tenant", "new", "New", {"a": 1}), response={"data": tenant}),
+    Case("TenantApi", "delete", ("tenant",), status=204),
+    Case("TopicApi", "list", (1, 10, "topic"), response={"page": 1, "data": [{"key": "topic"}]}),
+    Case("TopicApi", "create", ("topic", "Topic"), response={"data": {"key": "topic"}}),
+    Case("TopicApi", "get", ("topic",), response={"data": {"key": "topic"}}),
+    Case("TopicApi", "subscribe", ("topic", "subscriber-id"), response={"data": {"succeeded": ["subscriber-id"]}}),
+    Case("TopicApi", "unsubscribe", ("topic", ["subscriber-id"]), status=204),
+    Case("TopicApi", "rename", ("topic", "Topic"), response={"data": {"key": "topic"}}),
+    Case("TopicApi", "delete", ("topic",), status=204),
+    Case("TopicApi", "subscribed", ("topic", "subscriber-id"), response={"data": {}}),
+    Case("TopicApi", "subscribed", ("topic", "subscriber-id"), status=404),
+    # Same methods, using default values
+    Case("ChangeApi", "list", response={"data": []}),
+    Case("EnvironmentApi", "create", ("env",), response={"data": {"name": "env"}}),
+    Case("EventApi", "trigger", ("event", ["subscriber-id"], {}), response={"data": event}),
+    Case("EventApi", "trigger_bulk", ([InputEventDto("event", "subscriber-id", {})],), response={"data": [event]}),
+    Case("EventApi", "trigger_topic", ("event", [TriggerTopicDto("topic", "Topic")], {}), response={"data": event}),
+    Case("EventApi", "broadcast", ("event", {}), response={"data": event}),
+    Case("IntegrationApi", "list", response={"data": [integration]}),
+    Case("MessageApi", "list", response={"data": [message]}),
+    Case("NotificationTemplateApi", "list", response={"data": [template]}),
+    Case("OrganizationApi", "create", ("org",), response={"data": {"name": "org"}}),
+    Case("SubscriberApi", "list", response={"data": [subscriber]}),
+    Case("SubscriberApi", "credentials", ("subscriber-id", "slack"), response={"data": subscriber}),
+    Case("SubscriberApi", "mark_as", ("subscriber-id", "message-id"), response={"data": [message]}),
+    Case("SubscriberApi", "mark_all_as", ("subscriber-id", MarkAsEnum.SEEN), response={"data": 4}),
+    Case(
+        "SubscriberApi",
+        "mark_message_action",
+        ("subscriber-id", "message-id", "primary", MessageActionStatus.PENDING),
+        response={"data": message},
+    ),
+    Case("TenantApi", "list", response={"data": [tenant]}),
+    Case("TopicApi", "list", response={"data": []}),
+    # Paginated listings, returning the raw JSON response
+    Case("MessageApi", "list", kwargs={"raw": True}, response={"data": [message]}),
+    Case("NotificationApi", "list", (["email"],), {"raw": True}, {"data": [notification]}),
+    Case("NotificationTemplateApi", "list", kwargs={"raw": True}, response={"data": [template]}),
+    Case("SubscriberApi", "list", kwargs={"raw": True}, response={"data": [subscriber]}),
+    Case("TenantApi", "list", kwargs={"raw": True}, response={"data": [tenant]}),
+]
+
+
+class AsyncParityTests(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        NovuConfig.configure("sample.novu.com", "api-key")
+
+    async def asyncTearDown(self) -> None:
+        await ClientPool().aclose()
+
+    def test_same_methods_and_signatures(self) -> None:
+        self.assertEqual(novu.aio.__all__, novu.api.__all__)
+
+        for name in novu.api.__all__:
+            sync_cls, async_cls = getattr(novu.api, name), getattr(novu.aio, name)
+            for method_name, method in inspect.getmembers(sync_cls, inspect.isfunction):
+                if method_name.startswith("_"):
+                    continue
+                with self.subTest(api=name, method=method_name):
+                    async_method = getattr(async_cls, method_name)
+                    self.assertEqual(
+                        inspect.iscoroutinefunction(async_method) or inspect.isasyncgenfunction(async_method),
+                        method_name not in ("stream", "batcher"),
+                    )
+                    # The asynchronous streams always read the next page ahead, so they don't need a prefetch option
+                    self.assertEqual(
+                        list(inspect.signature(async_method).parameters),
+                        [param for param in inspect.signature(method).parameters if param != "prefetch"],
+                    )
+
+    def test_all_methods_covered(self) -> None:
+        covered = {(case.api, case.method) for case in CASES}
+        for name in novu.api.__all__:
+            for method_name, _ in inspect.getmembers(getattr(novu.api, name), inspect.isfunction):
+                if method_name.startswith("_") or method_name in ("stream", "batcher", "handle_request"):
+                    continue
+                self.assertIn((name, method_name), covered)
+
+    async def test_same_requests_and_results(self) -> None:
+        for case in CASES:
+            with self.subTest(api=case.api, method=case.method, status=case.status):
+                sync_api, async_api = getattr(novu.api, case.api)(), getattr(novu.aio, case.api)()
+
+                with mock.patch("requests.Session.request") as sync_request:
+                    sync_request.return_value = MockResponse(case.status, case.response)
+                    expected = getattr(sync_api, case.method)(*case.args, **case.kwargs)
+                    if inspect.isgenerator(expected):
+                        expected = list(expected)
+
+                with mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock) as async_request:
+                    async_request.return_value = build_httpx_response(case.status, case.response)
+                    result = getattr(async_api, case.method)(*case.args, **case.kwargs)
+                    if inspect.isasyncgen(result):
+                        result = [item async for item in result]
+                    else:
+                        result = await result
+
+                self.assertEqual(result, expected)
+
+                sync_kwargs, async_kwargs = sync_request.call_args.kwargs, async_request.call_args.kwargs
+                self.assertEqual(async_kwargs.pop("params"), _build_params(sync_kwargs.pop("params")))
+                self.assertEqual(async_kwargs, sync_kwargs)
+
+    async def test_same_streams(self) -> None:
+        streams = [
+            ("MessageApi", ("in_app", "subscriber-id"), {}, message),
+            ("MessageApi", (), {}, message),
+            ("NotificationApi", (["email"],), {"search": "s"}, notification),
+            ("NotificationTemplateApi", (), {}, template),
+            ("SubscriberApi", (), {}, subscriber),
+            ("TenantApi", (), {}, tenant),
+            ("TenantApi", (), {"raw": True}, tenant),
+        ]
+        for name, args, kwargs, item in streams:
+            with self.subTest(api=name):
+                pages = [
+                    {"page": 0, "hasMore": True, "data": [item] * 10},
+                    {"page": 1, "hasMore": False, "data": [item]},
+                ]
+
+                with mock.patch("requests.Session.request") as sync_request:
+                    sync_request.side_effect = [MockResponse(200, page) for page in pages]
+                    expected = list(getattr(novu.api, name)().stream(*args, **kwargs))
+
+                with mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock) as async_request:
+                    async_request.side_effect = [build_httpx_response(200, page) for page in pages]
+                    result = [item async for item in getattr(novu.aio, name)().stream(*args, **kwargs)]
+
+                self.assertEqual(result, expected)
+                # The synchronous iterator mutates its payload, so only the last page params can be compared
+                sync_params = _build_params(sync_request.call_args.kwargs["params"])
+                self.assertEqual(
+                    [call.kwargs["params"] for call in async_request.await_args_list],
+                    [{**sync_params, "page": 0}, {**sync_params, "page": 1}],
+                )
+
+    @mock.patch("httpx.AsyncClient.request", new_callable=mock.AsyncMock)
+    async def test_topic_subscribed_raise_on_error(self, mock_request: mock.AsyncMock) -> None:
+        mock_request.return_value = build_httpx_response(500)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await novu.aio.TopicApi().subscribed("topic", "subscriber-id")
@@ -1,11 +1,24 @@
+import gc
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional
 from unittest import TestCase, mock
 
 import pkg_resources
-from requests.exceptions import HTTPError
+from requests import Session
+from requests.exceptions import ConnectionError, HTTPError  # pylint: disable=W0622
 
-from novu.api.base import Api
+from novu.api.base import Api, PaginationIterator, SessionPool
+from novu.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from novu.concurrency import AdaptiveConcurrencyLimiter
 from novu.config import NovuConfig
-from tests.factories import MockResponse
+from novu.constants import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from novu.dto.tenant import TenantDto
+from novu.rate_limit import READS, RateLimiter, RateLimitExceeded
+from novu.retry import RetryPolicy
+from novu.transport import Transport, Urllib3Transport
+from tests.factories import MockResponse, StandInServer
 
 __version__ = pkg_resources.get_distribution("novu").version
 
@@ -16,7 +29,7 @@ class ApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = Api()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_handle_request_with_header_override(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {})
 
@@ -36,7 +49,7 @@ class ApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_handle_request_raise_with_details(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(500, {"details": "my-detail"})
 
@@ -57,7 +70,7 @@ class ApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_handle_request_raise_without_details(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(500, raise_on_json_decode=True)
 
@@ -78,7 +91,7 @@ class ApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_override_requests_timeout(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(500, raise_on_json_decode=True)
 
@@ -99,7 +112,7 @@ class ApiTests(TestCase):
             timeout=60,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_use_requests_session(self, mock_request: mock.MagicMock) -> None:
         session_mock = mock.MagicMock()
         session_mock.request.return_value = MockResponse(200, {})
@@ -121,3 +134,581 @@ class ApiTests(TestCase):
             params=None,
             timeout=5,
         )
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_retry_transient_errors(self, mock_request: mock.MagicMock, mock_sleep: mock.MagicMock) -> None:
+        mock_request.side_effect = [
+            ConnectionError(),
+            MockResponse(503, headers={"Retry-After": "2"}),
+            MockResponse(200, {"data": "value"}),
+        ]
+        api = Api()
+        api.retry_policy = RetryPolicy(max_attempts=3)
+
+        self.assertEqual(api.handle_request("GET", api._url), {"data": "value"})
+
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertGreaterEqual(mock_sleep.call_args_list[1].args[0], 2)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_retry_exhausted(self, mock_request: mock.MagicMock, mock_sleep: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(503)
+        api = Api()
+        api.retry_policy = RetryPolicy(max_attempts=2)
+
+        self.assertRaises(HTTPError, api.handle_request, "GET", api._url)
+
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_retry_only_idempotent_requests(self, mock_request: mock.MagicMock, mock_sleep: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(503)
+
+        self.assertRaises(HTTPError, self.api.handle_request, "POST", self.api._url)
+        self.assertEqual(mock_request.call_count, 1)
+
+        self.assertRaises(HTTPError, self.api.handle_request, "POST", self.api._url, idempotent=True)
+        self.assertEqual(mock_request.call_count, 4)
+
+        self.assertRaises(HTTPError, self.api.handle_request, "GET", self.api._url, idempotent=False)
+        self.assertEqual(mock_request.call_count, 5)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_retry_disabled(self, mock_request: mock.MagicMock, mock_sleep: mock.MagicMock) -> None:
+        mock_request.side_effect = ConnectionError()
+        api = Api()
+        api.retry_policy = None
+
+        self.assertRaises(ConnectionError, api.handle_request, "GET", api._url)
+
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @mock.patch("requests.Session.request")
+    def test_rate_limiter(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, {})
+        api = Api()
+        api.rate_limiter = RateLimiter({READS: 1}, max_wait=0)
+
+        api.handle_request("POST", api._url)
+        api.handle_request("GET", api._url)
+        self.assertRaises(RateLimitExceeded, api.handle_request, "GET", api._url)
+
+        self.assertEqual(mock_request.call_count, 2)
+
+    @mock.patch("requests.Session.request")
+    def test_concurrency_limiter(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = [MockResponse(200, {}), MockResponse(429), ConnectionError()]
+        api = Api()
+        api.retry_policy = None
+        api.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        api.handle_request("GET", api._url)
+        self.assertEqual(api.concurrency_limiter.limit, 8)
+        self.assertRaises(HTTPError, api.handle_request, "GET", api._url)
+        self.assertEqual(api.concurrency_limiter.limit, 4)
+        self.assertRaises(ConnectionError, api.handle_request, "GET", api._url)
+        self.assertEqual(api.concurrency_limiter.limit, 2)
+        self.assertEqual(api.concurrency_limiter.in_flight, 0)
+
+    @mock.patch("requests.Session.request")
+    def test_circuit_breaker(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = [MockResponse(503), ConnectionError(), MockResponse(200, {})]
+        api = Api()
+        api.retry_policy = None
+        api.circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+        self.assertRaises(HTTPError, api.handle_request, "GET", f"{api._url}/v1/subscribers/first")
+        self.assertRaises(ConnectionError, api.handle_request, "GET", f"{api._url}/v1/subscribers/second")
+        with self.assertRaises(CircuitOpenError) as context:
+            api.handle_request("GET", f"{api._url}/v1/subscribers/third")
+
+        self.assertEqual(context.exception.endpoint, "/v1/subscribers/{id}")
+        self.assertEqual(api.circuit_breaker.state(f"{api._url}/v1/subscribers/third"), CircuitState.OPEN)
+        api.handle_request("GET", f"{api._url}/v1/topics")
+        self.assertEqual(mock_request.call_count, 3)
+
+    @mock.patch("requests.Session.request")
+    def test_circuit_open_frees_limiter_slot(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(503)
+        api = Api()
+        api.retry_policy = None
+        api.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        api.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        url = f"{api._url}/v1/subscribers/subscriber-id"
+
+        self.assertRaises(HTTPError, api.handle_request, "GET", url)
+        baseline = api.concurrency_limiter.baseline(url)
+        self.assertRaises(CircuitOpenError, api.handle_request, "GET", url)
+
+        self.assertEqual(api.concurrency_limiter.limit, 4)
+        self.assertEqual(api.concurrency_limiter.in_flight, 0)
+        self.assertEqual(api.concurrency_limiter.baseline(url), baseline)
+        mock_request.assert_called_once()
+
+    def test_custom_transport(self) -> None:
+        transport = mock.MagicMock(spec=Transport)
+        transport.request.return_value = MockResponse(200, {"data": "value"})
+        api = Api()
+        api.transport = transport
+
+        self.assertEqual(api.handle_request("GET", api._url, payload={"page": 1}), {"data": "value"})
+
+        transport.request.assert_called_once_with(
+            method="GET",
+            url=api._url,
+            headers={"Authorization": "ApiKey api-key", "User-Agent": f"novu/python@{__version__}"},
+            json=None,
+            params={"page": 1},
+            timeout=5,
+        )
+
+    def test_urllib3_transport(self) -> None:
+        with StandInServer(capacity=0) as server:
+            api = Api(server.url)
+            api.transport = Urllib3Transport()
+            api.retry_policy = RetryPolicy(backoff=0)
+
+            self.assertRaises(HTTPError, api.handle_request, "GET", f"{server.url}/v1/subscribers")
+            self.assertEqual(server.rejected, 3)
+
+        with StandInServer(capacity=1, latency=0) as server:
+            res = api.handle_request("PUT", f"{server.url}/v1/subscribers/id", {"email": "email"})
+
+        self.assertEqual(res["data"]["body"], {"email": "email"})
+        api.transport.close()
+
+
+class SessionPoolTests(TestCase):
+    def tearDown(self) -> None:
+        SessionPool.configure(DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE)
+
+    def test_session_shared_between_apis(self) -> None:
+        session = SessionPool().get("sample.novu.com", "api-key")
+
+        self.assertIsInstance(session, Session)
+        self.assertIs(SessionPool().get("sample.novu.com", "api-key"), session)
+        self.assertIsNot(SessionPool().get("sample.novu.com", "other-api-key"), session)
+        self.assertIsNot(SessionPool().get("other.novu.com", "api-key"), session)
+
+    @mock.patch("requests.Session.request")
+    def test_api_use_shared_session(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, {})
+
+        Api("sample.novu.com", "api-key").handle_request("GET", "sample.novu.com")
+        Api("sample.novu.com", "api-key").handle_request("GET", "sample.novu.com")
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(len(SessionPool()._sessions), 1)
+
+    def test_configure_pool_size(self) -> None:
+        session = SessionPool().get("sample.novu.com", "api-key")
+
+        SessionPool.configure(pool_connections=2, pool_maxsize=50)
+
+        new_session = SessionPool().get("sample.novu.com", "api-key")
+        self.assertIsNot(new_session, session)
+
+        adapter = new_session.get_adapter("https://sample.novu.com")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 50)
+
+    def test_configure_keep_unset_values(self) -> None:
+        SessionPool.configure(pool_maxsize=20)
+
+        self.assertEqual(SessionPool().pool_connections, DEFAULT_POOL_CONNECTIONS)
+        self.assertEqual(SessionPool().pool_maxsize, 20)
+
+        SessionPool.configure(pool_connections=5)
+
+        self.assertEqual(SessionPool().pool_connections, 5)
+        self.assertEqual(SessionPool().pool_maxsize, 20)
+
+
+class PaginationIteratorTests(TestCase):
+    tenant_json = {"identifier": "tenant", "name": "Tenant"}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        NovuConfig.configure("sample.novu.com", "api-key")
+        cls.api = Api()
+
+    def build_pages(self, count: int) -> List[MockResponse]:
+        return [
+            MockResponse(200, {"page": page, "hasMore": page < count - 1, "data": [self.tenant_json] * 2})
+            for page in range(count)
+        ]
+
+    @mock.patch("requests.Session.request")
+    def test_iterate_with_prefetch(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(4)
+
+        with PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", prefetch=2) as iterator:
+            self.assertEqual(list(iterator), [TenantDto("tenant", "Tenant")] * 8)
+
+        self.assertEqual([call.kwargs["params"]["page"] for call in mock_request.call_args_list], [0, 1, 2, 3])
+
+    @mock.patch("requests.Session.request")
+    def test_prefetch_read_ahead_bounded(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(10)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", prefetch=2)
+        next(iterator)
+        next(iterator)
+        next(iterator)  # First item of the second page, the background thread starts to fetch the fourth page
+
+        for _ in range(50):
+            if mock_request.call_count == 4:
+                break
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        # First page, the page being consumed and two pages read ahead
+        self.assertEqual(mock_request.call_count, 4)
+        iterator.close()
+
+    @mock.patch("requests.Session.request")
+    def test_prefetch_stopped_on_close(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(10)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", prefetch=1)
+        next(iterator)
+        thread = iterator._PaginationIterator__thread  # type: ignore[attr-defined]
+        iterator.close()
+
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(list(iterator), [])
+
+    @mock.patch("requests.Session.request")
+    def test_prefetch_stopped_on_garbage_collection(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(10)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", prefetch=1)
+        next(iterator)
+        thread = iterator._PaginationIterator__thread  # type: ignore[attr-defined]
+        del iterator
+        gc.collect()
+
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+
+    @mock.patch("requests.Session.request")
+    def test_prefetch_error_raised_to_consumer(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = [*self.build_pages(2)[:1], MockResponse(500)]
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", prefetch=1)
+        next(iterator)
+        next(iterator)
+
+        self.assertRaises(HTTPError, lambda: next(iterator))
+        self.assertEqual(list(iterator), [])
+
+    @mock.patch("requests.Session.request")
+    def test_stop_on_empty_page(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = [
+            MockResponse(200, {"page": 0, "hasMore": True, "data": [self.tenant_json]}),
+            MockResponse(200, {"page": 1, "hasMore": True, "data": []}),
+        ]
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertEqual(list(iterator), [TenantDto("tenant", "Tenant")])
+
+    def test_invalid_prefetch(self) -> None:
+        self.assertRaises(ValueError, PaginationIterator, self.api, TenantDto, "sample.novu.com", prefetch=-1)
+
+    @staticmethod
+    def build_counted_pages(total_count: int, delays: Optional[Dict[int, float]] = None) -> Callable[..., MockResponse]:
+        def request(**kwargs) -> MockResponse:
+            page = kwargs["params"]["page"]
+            time.sleep((delays or {}).get(page, 0))
+            count = min(10, total_count - page * 10)
+            data = [{"identifier": f"tenant-{page}-{index}", "name": "Tenant"} for index in range(count)]
+            return MockResponse(200, {"page": page, "totalCount": total_count, "pageSize": 10, "data": data})
+
+        return request
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_ordered(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(45, delays={1: 0.05})
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        identifiers = [tenant.identifier for tenant in iterator.fetch_all(parallel=3)]
+
+        self.assertEqual(identifiers, [f"tenant-{page}-{index}" for page in range(5) for index in range(10)][:45])
+        self.assertEqual(sorted(call.kwargs["params"]["page"] for call in mock_request.call_args_list), [0, 1, 2, 3, 4])
+        self.assertEqual(list(iterator), [])
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_unordered(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(30, delays={1: 0.1})
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        identifiers = [tenant.identifier for tenant in iterator.fetch_all(parallel=2, ordered=False)]
+
+        self.assertEqual(
+            sorted(identifiers), sorted(f"tenant-{page}-{index}" for page in range(3) for index in range(10))
+        )
+        self.assertEqual(identifiers[-10:], [f"tenant-1-{index}" for index in range(10)])
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_bounded(self, mock_request: mock.MagicMock) -> None:
+        request = self.build_counted_pages(100, delays={page: 0.01 for page in range(1, 10)})
+        lock, in_flight, max_in_flight = threading.Lock(), [0], [0]
+
+        def counted_request(**kwargs) -> MockResponse:
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            try:
+                return request(**kwargs)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        mock_request.side_effect = counted_request
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertEqual(len(list(iterator.fetch_all(parallel=3))), 100)
+        self.assertEqual(mock_request.call_count, 10)
+        self.assertLessEqual(max_in_flight[0], 3)
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_after_partial_iteration(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        next(iterator)
+        identifiers = [tenant.identifier for tenant in iterator.fetch_all()]
+
+        self.assertEqual(len(identifiers), 24)
+        self.assertEqual(identifiers[0], "tenant-0-1")
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_single_page(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(5)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertEqual(len(list(iterator.fetch_all())), 5)
+        self.assertEqual(mock_request.call_count, 1)
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_capped_page_size(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(45)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", page_size=50)
+        identifiers = [tenant.identifier for tenant in iterator.fetch_all(parallel=3)]
+
+        self.assertEqual(identifiers, [f"tenant-{page}-{index}" for page in range(5) for index in range(10)][:45])
+        self.assertEqual(sorted(call.kwargs["params"]["page"] for call in mock_request.call_args_list), [0, 1, 2, 3, 4])
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_without_total_count(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(3)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertEqual(list(iterator.fetch_all()), [TenantDto("tenant", "Tenant")] * 6)
+        self.assertEqual([call.kwargs["params"]["page"] for call in mock_request.call_args_list], [0, 1, 2])
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_with_prefetch(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        with PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", prefetch=1) as iterator:
+            self.assertEqual(len(list(iterator.fetch_all())), 25)
+
+        self.assertEqual([call.kwargs["params"]["page"] for call in mock_request.call_args_list], [0, 1, 2])
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_error(self, mock_request: mock.MagicMock) -> None:
+        request = self.build_counted_pages(50)
+        mock_request.side_effect = lambda **kwargs: (
+            MockResponse(500) if kwargs["params"]["page"] == 1 else request(**kwargs)
+        )
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertRaises(HTTPError, list, iterator.fetch_all(parallel=2))
+
+    def test_fetch_all_invalid_parallel(self) -> None:
+        with mock.patch("requests.Session.request", side_effect=self.build_pages(1)):
+            iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertRaises(ValueError, iterator.fetch_all, parallel=0)
+
+    @mock.patch("requests.Session.request")
+    def test_lazy_first_page(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(1)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        mock_request.assert_not_called()
+
+        next(iterator)
+        mock_request.assert_called_once()
+
+    @mock.patch("requests.Session.request")
+    def test_checkpoint_and_resume(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        self.assertEqual(iterator.checkpoint(), {"page": 0, "index": 0, "page_size": 10})
+        for _ in range(13):
+            next(iterator)
+        cursor = json.loads(json.dumps(iterator.checkpoint()))
+        self.assertEqual(cursor, {"page": 1, "index": 3, "page_size": 10})
+        iterator.close()
+        self.assertEqual(iterator.checkpoint(), cursor)
+
+        mock_request.reset_mock()
+        resumed = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", resume_from=cursor)
+        self.assertEqual(resumed.checkpoint(), cursor)
+
+        identifiers = [tenant.identifier for tenant in resumed]
+        self.assertEqual(identifiers[0], "tenant-1-3")
+        self.assertEqual(len(identifiers), 12)
+        self.assertEqual([call.kwargs["params"]["page"] for call in mock_request.call_args_list], [1, 2])
+
+    @mock.patch("requests.Session.request")
+    def test_checkpoint_at_end_of_page(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        for _ in range(10):
+            next(iterator)
+
+        self.assertEqual(iterator.checkpoint(), {"page": 1, "index": 0, "page_size": 10})
+
+    @mock.patch("requests.Session.request")
+    def test_resume_with_another_page_size(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = [MockResponse(200, {"page": 3, "hasMore": False, "data": [self.tenant_json] * 5})]
+
+        cursor = {"page": 1, "index": 7, "page_size": 10}
+        iterator = PaginationIterator(
+            self.api, TenantDto, "sample.novu.com/v1/tenants", page_size=5, resume_from=cursor
+        )
+
+        self.assertEqual(iterator.checkpoint(), {"page": 3, "index": 2, "page_size": 5})
+        self.assertEqual(len(list(iterator)), 3)
+        self.assertEqual(mock_request.call_args.kwargs["params"], {"limit": 5, "page": 3})
+
+    @mock.patch("requests.Session.request")
+    def test_pages(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        next(iterator)
+        pages = iterator.pages()
+
+        self.assertEqual([tenant.identifier for tenant in next(pages)], [f"tenant-0-{index}" for index in range(1, 10)])
+        self.assertEqual(iterator.checkpoint(), {"page": 1, "index": 0, "page_size": 10})
+        self.assertEqual([len(page) for page in pages], [10, 5])
+        self.assertEqual(list(iterator), [])
+
+    @mock.patch("requests.Session.request")
+    def test_pages_release_buffer(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(10)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        page = next(iterator.pages())
+
+        self.assertEqual(len(page), 10)
+        self.assertEqual(iterator._PaginationIterator__buffer.items, [])  # type: ignore[attr-defined]
+
+    @mock.patch("requests.Session.request")
+    def test_batches(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        batches = iterator.batches(4)
+
+        self.assertEqual([tenant.identifier for tenant in next(batches)], [f"tenant-0-{index}" for index in range(4)])
+        next(batches)
+        third = next(batches)
+        self.assertEqual(
+            [tenant.identifier for tenant in third], ["tenant-0-8", "tenant-0-9", "tenant-1-0", "tenant-1-1"]
+        )
+        self.assertEqual(iterator.checkpoint(), {"page": 1, "index": 2, "page_size": 10})
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 4, 1])
+
+    @mock.patch("requests.Session.request")
+    def test_batches_stopped_on_close(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        batches = iterator.batches(10)
+        next(batches)
+        iterator.close()
+
+        self.assertEqual(list(batches), [])
+        mock_request.assert_called_once()
+
+    def test_invalid_batch_size(self) -> None:
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+
+        self.assertRaises(ValueError, iterator.batches, 0)
+
+    @mock.patch("requests.Session.request")
+    def test_iterate_raw(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(2)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", raw=True)
+
+        self.assertEqual(list(iterator), [self.tenant_json] * 4)
+
+    @mock.patch("requests.Session.request")
+    def test_iterate_view(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(2)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", view=True)
+        items = list(iterator)
+
+        self.assertEqual(items, [TenantDto.view()(self.tenant_json)] * 4)
+        self.assertEqual(items[0].to_dto(), TenantDto.from_camel_case(self.tenant_json))
+
+    @mock.patch("requests.Session.request")
+    def test_iterate_fields(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(1)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", fields=["identifier"])
+
+        self.assertEqual(list(iterator), [TenantDto(identifier="tenant", name=None)] * 2)  # type: ignore[arg-type]
+
+    @mock.patch("requests.Session.request")
+    def test_iterate_columns(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(2)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants")
+        batches = list(iterator.columns(3, fields=["identifier"], categorical=["identifier"]))
+
+        self.assertEqual([len(columns) for columns in batches], [3, 1])
+        self.assertEqual(batches[0]["identifier"], [0, 0, 0])
+        self.assertEqual(batches[0].categories["identifier"], ["tenant"])
+
+    @mock.patch("requests.Session.request")
+    def test_iterate_columns_raw(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_pages(1)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", raw=True)
+
+        self.assertEqual(next(iterator.columns(2))["name"], ["Tenant", "Tenant"])
+
+    @mock.patch("requests.Session.request")
+    def test_fetch_all_raw(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.build_counted_pages(25)
+
+        iterator = PaginationIterator(self.api, TenantDto, "sample.novu.com/v1/tenants", raw=True)
+        items = list(iterator.fetch_all())
+
+        self.assertEqual(len(items), 25)
+        self.assertEqual(items[-1], {"identifier": "tenant-2-4", "name": "Tenant"})
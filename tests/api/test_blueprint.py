@@ -62,7 +62,7 @@ class BlueprintApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = BlueprintApi()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_blueprint_by_id(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -79,7 +79,7 @@ class BlueprintApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_grouped_blueprints(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_grouped)
 
@@ -585,7 +585,7 @@ class ChangeApiTests(TestCase):
             ),
         ]
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.change_response_sample)
 
@@ -602,7 +602,7 @@ class ChangeApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_with_pagination(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.change_response_sample)
 
@@ -619,7 +619,7 @@ class ChangeApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_count(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": 4})
 
@@ -635,7 +635,7 @@ class ChangeApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_apply(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.change_response_sample)
 
@@ -652,7 +652,7 @@ class ChangeApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_bulk_apply(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200,
@@ -49,7 +49,7 @@ class EnvironmentApiTests(TestCase):
         )
         cls.maxDiff = None
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_environments(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json_env]})
 
@@ -66,7 +66,7 @@ class EnvironmentApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_environment(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, {"data": self.response_json_env})
 
@@ -83,7 +83,7 @@ class EnvironmentApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_environment_with_parent_id(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, {"data": self.response_json_env})
 
@@ -100,7 +100,7 @@ class EnvironmentApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_current_environment(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, {"data": self.response_json_env})
 
@@ -117,7 +117,7 @@ class EnvironmentApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_environment_api_keys(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json_api_key]})
 
@@ -134,7 +134,7 @@ class EnvironmentApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_regenerate_api_key(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json_api_key]})
 
@@ -1,8 +1,11 @@
 from unittest import TestCase, mock
 
 import pkg_resources
+from requests import RequestException
+from requests.models import HTTPError
 
 from novu.api import EventApi
+from novu.api.event import BulkTriggerError
 from novu.config import NovuConfig
 from novu.dto.event import EventDto, InputEventDto
 from novu.dto.topic import TriggerTopicDto
@@ -20,7 +23,17 @@ class EventApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = EventApi()
 
-    @mock.patch("requests.request")
+    @staticmethod
+    def echo_bulk(**kwargs) -> MockResponse:
+        events = kwargs["json"]["events"]
+        if any(event["to"] == "failing" for event in events):
+            return MockResponse(500)
+        return MockResponse(
+            201,
+            {"data": [{"acknowledged": True, "status": "processed", "transactionId": event["to"]} for event in events]},
+        )
+
+    @mock.patch("requests.Session.request")
     def test_trigger_with_single_recipient(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -41,7 +54,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_with_multiple_recipients(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -62,7 +75,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_with_overrides(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -83,7 +96,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_with_actor(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -104,7 +117,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_with_transaction_id(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -125,7 +138,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_with_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -146,7 +159,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_topic_with_single_topic(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -168,7 +181,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_topic_with_multiple_topics(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -195,7 +208,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_topic_with_overrides(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -222,7 +235,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_topic_with_actor(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -249,7 +262,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_topic_with_transaction_id(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -276,7 +289,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_topic_with_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -303,7 +316,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_bulk_with_one_event(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201,
@@ -340,7 +353,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_bulk_with_with_multiple(self, mock_request: mock.MagicMock) -> None:
         transaction_ids = ["sample-test", "another-sample-test"]
 
@@ -383,7 +396,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_bulk_with_multiple_events_and_overrides(self, mock_request: mock.MagicMock) -> None:
         transaction_ids = ["sample-test", "another-sample-test"]
 
@@ -426,7 +439,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_bulk_with_multiple_events_and_actor(self, mock_request: mock.MagicMock) -> None:
         transaction_ids = ["sample-test", "another-sample-test"]
 
@@ -469,7 +482,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_bulk_with_multiple_events_and_transaction_id(self, mock_request: mock.MagicMock) -> None:
         transaction_ids = ["sample-test", "another-sample-test"]
 
@@ -514,7 +527,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_trigger_bulk_with_multiple_events_and_tenant(self, mock_request: mock.MagicMock) -> None:
         transaction_ids = ["sample-test", "another-sample-test"]
 
@@ -557,7 +570,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_broadcast_with_overrides(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -582,7 +595,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_broadcast_with_actor(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -607,7 +620,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_broadcast_with_transaction_id(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -632,7 +645,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_broadcast_with_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"acknowledged": True, "status": EventStatus.PROCESSED, "transactionId": "sample-test"}}
@@ -657,7 +670,7 @@ class EventApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204)
 
@@ -671,3 +684,157 @@ class EventApiTests(TestCase):
             params=None,
             timeout=5,
         )
+
+    @mock.patch("requests.Session.request")
+    def test_trigger_bulk_chunked(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+        events = [InputEventDto(name="test-template", recipients=f"recipient_{i}", payload={}) for i in range(250)]
+
+        result = self.api.trigger_bulk(events)
+
+        self.assertEqual([event.transaction_id for event in result], [f"recipient_{i}" for i in range(250)])
+        self.assertEqual(
+            sorted(len(call.kwargs["json"]["events"]) for call in mock_request.call_args_list), [50, 100, 100]
+        )
+
+    @mock.patch("requests.Session.request")
+    def test_trigger_bulk_chunk_size(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+        events = [InputEventDto(name="test-template", recipients=f"recipient_{i}", payload={}) for i in range(7)]
+
+        result = self.api.trigger_bulk(events, chunk_size=2, concurrency=1)
+
+        self.assertEqual([event.transaction_id for event in result], [f"recipient_{i}" for i in range(7)])
+        self.assertEqual(mock_request.call_count, 4)
+
+    @mock.patch("requests.Session.request")
+    def test_trigger_bulk_failed_chunks(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+        events = [InputEventDto(name="test-template", recipients=f"recipient_{i}", payload={}) for i in range(6)]
+        events[3] = InputEventDto(name="test-template", recipients="failing", payload={})
+
+        with self.assertRaises(BulkTriggerError) as context:
+            self.api.trigger_bulk(events, chunk_size=2)
+
+        self.assertEqual(
+            [event and event.transaction_id for event in context.exception.results],
+            ["recipient_0", "recipient_1", None, None, "recipient_4", "recipient_5"],
+        )
+        self.assertEqual(len(context.exception.failures), 1)
+        self.assertEqual(context.exception.failures[0][0], range(2, 4))
+        self.assertIsInstance(context.exception.failures[0][1], HTTPError)
+        self.assertIn("events 2 to 3", str(context.exception))
+
+    @mock.patch("requests.Session.request")
+    def test_trigger_bulk_single_chunk_error(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+
+        with self.assertRaises(BulkTriggerError) as context:
+            self.api.trigger_bulk([InputEventDto(name="test-template", recipients="failing", payload={})])
+
+        self.assertEqual(context.exception.results, [None])
+        self.assertEqual([chunk for chunk, _ in context.exception.failures], [range(0, 1)])
+        self.assertIsInstance(context.exception.__cause__, HTTPError)
+        self.assertIsInstance(context.exception, RequestException)
+        self.assertEqual(context.exception.response.status_code, 500)
+
+    def test_trigger_bulk_invalid_arguments(self) -> None:
+        events = [InputEventDto(name="test-template", recipients="recipient", payload={})]
+
+        self.assertRaises(ValueError, self.api.trigger_bulk, events, chunk_size=0)
+        self.assertRaises(ValueError, self.api.trigger_bulk, events, chunk_size=101)
+        self.assertRaises(ValueError, self.api.trigger_bulk, events, concurrency=0)
+
+    @mock.patch("requests.Session.request")
+    def test_batcher_groups_by_size(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+
+        with self.api.batcher(max_batch=3, max_delay_ms=60_000) as batcher:
+            futures = [
+                batcher.submit(InputEventDto(name="test-template", recipients=f"recipient_{i}", payload={}))
+                for i in range(7)
+            ]
+
+        self.assertEqual([future.result().transaction_id for future in futures], [f"recipient_{i}" for i in range(7)])
+        self.assertEqual([len(call.kwargs["json"]["events"]) for call in mock_request.call_args_list], [3, 3, 1])
+        self.assertEqual(mock_request.call_args.kwargs["url"], "sample.novu.com/v1/events/trigger/bulk")
+
+    @mock.patch("requests.Session.request")
+    def test_batcher_groups_by_delay(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+        batcher = self.api.batcher(max_delay_ms=1)
+
+        future = batcher.submit(InputEventDto(name="test-template", recipients="recipient", payload={}))
+
+        self.assertEqual(future.result(timeout=5).transaction_id, "recipient")
+        batcher.close()
+        mock_request.assert_called_once()
+
+    @mock.patch("requests.Session.request")
+    def test_batcher_flush(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+
+        with self.api.batcher(max_delay_ms=60_000) as batcher:
+            first = batcher.submit(InputEventDto(name="test-template", recipients="recipient_0", payload={}))
+            batcher.flush()
+            self.assertTrue(first.done())
+            second = batcher.submit(InputEventDto(name="test-template", recipients="recipient_1", payload={}))
+
+        self.assertEqual(second.result().transaction_id, "recipient_1")
+        self.assertEqual(mock_request.call_count, 2)
+
+    @mock.patch("requests.Session.request")
+    def test_batcher_failed_batch(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = self.echo_bulk
+
+        with self.api.batcher(max_delay_ms=60_000) as batcher:
+            futures = [
+                batcher.submit(InputEventDto(name="test-template", recipients=recipient, payload={}))
+                for recipient in ("recipient", "failing")
+            ]
+
+        for future in futures:
+            self.assertIsInstance(future.exception(), HTTPError)
+
+    @mock.patch("requests.Session.request")
+    def test_batcher_closed(self, mock_request: mock.MagicMock) -> None:
+        batcher = self.api.batcher()
+        batcher.close()
+        batcher.close()
+        batcher.flush()
+
+        with self.assertRaises(RuntimeError):
+            batcher.submit(InputEventDto(name="test-template", recipients="recipient", payload={}))
+        mock_request.assert_not_called()
+
+    def test_batcher_invalid_arguments(self) -> None:
+        self.assertRaises(ValueError, self.api.batcher, max_batch=0)
+        self.assertRaises(ValueError, self.api.batcher, max_batch=101)
+        self.assertRaises(ValueError, self.api.batcher, max_delay_ms=-1)
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_retry_trigger_with_transaction_id(self, mock_request: mock.MagicMock, mock_sleep: mock.MagicMock) -> None:
+        mock_request.side_effect = [
+            MockResponse(503),
+            MockResponse(201, {"data": {"acknowledged": True, "status": "processed", "transactionId": "sample-test"}}),
+        ]
+
+        result = self.api.trigger("test-template", "sample-recipient", {}, transaction_id="sample-test")
+
+        self.assertEqual(result.transaction_id, "sample-test")
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_no_retry_trigger_without_transaction_id(
+        self, mock_request: mock.MagicMock, mock_sleep: mock.MagicMock
+    ) -> None:
+        mock_request.return_value = MockResponse(503)
+
+        with self.assertRaises(HTTPError):
+            self.api.trigger("test-template", "sample-recipient", {})
+
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
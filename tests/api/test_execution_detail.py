@@ -59,7 +59,7 @@ class ExecutionDetailApiTests(TestCase):
             updated_at="2023-02-13T22:32:14.733Z",
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_execution_details(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json]})
 
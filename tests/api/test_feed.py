@@ -42,7 +42,7 @@ class FeedApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = FeedApi()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_feeds(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json]})
 
@@ -59,7 +59,7 @@ class FeedApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_feed(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, {"data": self.response_json})
 
@@ -76,7 +76,7 @@ class FeedApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete_feed(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204)
 
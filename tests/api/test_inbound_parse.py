@@ -15,7 +15,7 @@ class InboundParseApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = InboundParseApi()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_validate_mx_record_setup(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": {"mxRecordConfigured": True}})
 
@@ -63,7 +63,7 @@ class IntegrationApiTests(TestCase):
             deleted=False,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_no_result(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": []})
 
@@ -80,7 +80,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_with_results(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -97,7 +97,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_only_active_no_result(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": []})
 
@@ -114,7 +114,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_with_results(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -131,7 +131,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_with_check_by_default(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -174,7 +174,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_without_check(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -218,7 +218,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_channel_without_credentials(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200,
@@ -280,7 +280,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_provider_status(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": True})
 
@@ -296,7 +296,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_update_with_check_by_default(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -340,7 +340,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_update_without_check(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -385,7 +385,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204)
 
@@ -400,7 +400,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_limit(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": {"limit": 300, "count": 3}})
 
@@ -418,7 +418,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_set_primary_with_valid_integration_id(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -433,7 +433,7 @@ class IntegrationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_set_primary_with_invalid_integration_id(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(400, self.response_get)
 
@@ -118,7 +118,7 @@ class LayoutApiTests(TestCase):
             is_deleted=False,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_layout(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -135,7 +135,7 @@ class LayoutApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_layout_with_filters(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -152,7 +152,7 @@ class LayoutApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_layout(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -212,7 +212,7 @@ class LayoutApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_layout(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -229,7 +229,7 @@ class LayoutApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_patch_layout(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -289,7 +289,7 @@ class LayoutApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete_layout(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204, raise_on_json_decode=True)
 
@@ -305,7 +305,7 @@ class LayoutApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_set_default_layout(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200)
 
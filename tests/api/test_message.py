@@ -73,7 +73,7 @@ class MessageApiTests(TestCase):
             last_seen_date="2023-02-02T00:10:21.544Z",
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_messages(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json]})
 
@@ -90,7 +90,7 @@ class MessageApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_messages_with_filters(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json]})
 
@@ -115,7 +115,7 @@ class MessageApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_stream_messages(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json]})
 
@@ -132,7 +132,7 @@ class MessageApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_stream_messages_with_filters(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json]})
 
@@ -149,7 +149,7 @@ class MessageApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete_message(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": {"acknowledged": True, "status": "deleted"}})
 
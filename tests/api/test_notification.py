@@ -146,7 +146,7 @@ class NotificationApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = NotificationApi()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -182,7 +182,24 @@ class NotificationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
+    def test_list_raw(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, self.response_list)
+
+        result = self.api.list(channels=["in_app"], raw=True)
+
+        self.assertEqual(result, self.response_list)
+
+    @mock.patch("requests.Session.request")
+    def test_stream_raw(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, self.response_list)
+
+        result = self.api.stream(channels=["in_app"], raw=True)
+
+        self.assertEqual(list(result), [self.notification_json])
+        mock_request.assert_called_once()
+
+    @mock.patch("requests.Session.request")
     def test_stream(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -219,7 +236,7 @@ class NotificationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_stats(self, mock_request: mock.MagicMock) -> None:
         response_stats = {"data": {"weeklySent": 100, "monthlySent": 500}}
         mock_request.return_value = MockResponse(200, response_stats)
@@ -237,7 +254,7 @@ class NotificationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_graph_stats(self, mock_request: mock.MagicMock) -> None:
         response_graph_stats = {
             "data": [
@@ -277,7 +294,7 @@ class NotificationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_notification)
         notification_id = "63dafed97779f59258e44954"
@@ -39,7 +39,7 @@ class NotificationGroupApiTests(TestCase):
             updated_at="2023-02-02T00:07:53.951Z",
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_notification_group(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -56,7 +56,7 @@ class NotificationGroupApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_notification_group(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, self.response_get)
 
@@ -73,7 +73,7 @@ class NotificationGroupApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_notification_group(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -90,7 +90,7 @@ class NotificationGroupApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_patch_notification_group(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -107,7 +107,7 @@ class NotificationGroupApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete_notification_group(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -147,7 +147,7 @@ class NotificationTemplateApiTests(TestCase):
             deleted=False,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_notification_template(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -164,7 +164,7 @@ class NotificationTemplateApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_notification_template_with_pagination(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -181,7 +181,7 @@ class NotificationTemplateApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_stream_notification_template(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -198,7 +198,7 @@ class NotificationTemplateApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_notification_template(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, self.response_get)
 
@@ -285,7 +285,7 @@ class NotificationTemplateApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_notification_template(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -302,7 +302,7 @@ class NotificationTemplateApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_update_notification_template(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -390,7 +390,7 @@ class NotificationTemplateApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete_notification_template(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204, raise_on_json_decode=True)
 
@@ -406,7 +406,7 @@ class NotificationTemplateApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_update_status_notification_template(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
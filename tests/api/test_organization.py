@@ -100,7 +100,7 @@ class OrganizationApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = OrganizationApi()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_organizations(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_json]})
 
@@ -117,7 +117,7 @@ class OrganizationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_organization_with_logo(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, {"data": self.response_json})
 
@@ -135,7 +135,7 @@ class OrganizationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_organization_without_logo(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, {"data": self.response_json})
 
@@ -152,7 +152,7 @@ class OrganizationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_current(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": self.response_json})
 
@@ -169,7 +169,7 @@ class OrganizationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_rename(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": self.response_json})
 
@@ -185,7 +185,7 @@ class OrganizationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_members(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": [self.response_member_json]})
 
@@ -202,7 +202,7 @@ class OrganizationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_remove_members(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": self.response_member_json})
 
@@ -219,7 +219,7 @@ class OrganizationApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_update_branding(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": self.response_branding_json})
 
@@ -1,3 +1,4 @@
+import dataclasses
 from collections.abc import Generator
 from unittest import TestCase, mock
 
@@ -124,7 +125,7 @@ class SubscriberApiTests(TestCase):
             data=None,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_subscriber(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -141,7 +142,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_subscriber_using_pagination(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -158,7 +159,46 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
+    def test_list_subscriber_raw(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, self.response_list)
+
+        result = self.api.list(raw=True)
+        self.assertEqual(result, self.response_list)
+
+    @mock.patch("requests.Session.request")
+    def test_stream_subscriber_raw(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, self.response_list)
+
+        result = self.api.stream(raw=True)
+        self.assertEqual(list(result), [self.subscriber_json])
+
+    @mock.patch("requests.Session.request")
+    def test_list_subscriber_fields(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, self.response_list)
+
+        result = self.api.list(fields=["subscriber_id", "_id"])
+        self.assertEqual(list(result.data), [SubscriberDto(self.expected_dto.subscriber_id, _id=self.expected_dto._id)])
+
+    @mock.patch("requests.Session.request")
+    def test_stream_subscriber_exclude(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, self.response_list)
+
+        result = list(self.api.stream(exclude=["channels", "data"]))
+        self.assertEqual(result, [dataclasses.replace(self.expected_dto, channels=None, data=None)])
+
+    def test_stream_subscriber_unknown_field(self) -> None:
+        self.assertRaises(ValueError, self.api.stream, fields=["unknown"])
+
+    @mock.patch("requests.Session.request")
+    def test_stream_subscriber_view(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(200, self.response_list)
+
+        result = list(self.api.stream(view=True))
+        self.assertEqual(result, [SubscriberDto.view()(self.subscriber_json)])
+        self.assertEqual(result[0].to_dto(), self.expected_dto)
+
+    @mock.patch("requests.Session.request")
     def test_stream_subscriber(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -175,7 +215,49 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
+    def test_stream_subscriber_with_page_size(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = [
+            MockResponse(200, {"page": 0, "totalCount": 3, "pageSize": 2, "data": [self.subscriber_json] * 2}),
+            MockResponse(200, {"page": 1, "totalCount": 3, "pageSize": 2, "data": [self.subscriber_json]}),
+        ]
+
+        result = self.api.stream(page_size=2)
+        self.assertEqual(list(result), [self.expected_dto] * 3)
+
+        self.assertEqual(mock_request.call_count, 2)
+        mock_request.assert_called_with(
+            method="GET",
+            url="sample.novu.com/v1/subscribers",
+            headers={"Authorization": "ApiKey api-key", "User-Agent": f"novu/python@{__version__}"},
+            json=None,
+            params={"page": 1, "limit": 2},
+            timeout=5,
+        )
+
+    @mock.patch("requests.Session.request")
+    def test_stream_subscriber_resume_from(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(
+            200, {"page": 1, "totalCount": 12, "pageSize": 10, "data": [self.subscriber_json] * 2}
+        )
+
+        result = self.api.stream(resume_from={"page": 1, "index": 1, "page_size": 10})
+        self.assertEqual(list(result), [self.expected_dto])
+
+        mock_request.assert_called_once_with(
+            method="GET",
+            url="sample.novu.com/v1/subscribers",
+            headers={"Authorization": "ApiKey api-key", "User-Agent": f"novu/python@{__version__}"},
+            json=None,
+            params={"page": 1, "limit": 10},
+            timeout=5,
+        )
+
+    def test_stream_subscriber_with_invalid_page_size(self) -> None:
+        self.assertRaises(ValueError, lambda: self.api.stream(page_size=0))
+        self.assertRaises(ValueError, lambda: self.api.stream(page_size=101))
+
+    @mock.patch("requests.Session.request")
     def test_create_subscriber(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201,
@@ -226,7 +308,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_bulk_create_subscribers(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201,
@@ -340,7 +422,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_subscriber(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -357,7 +439,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_subscriber_with_credentials_info(self, mock_request: mock.MagicMock) -> None:
         all_three = {
             "response": {"webhook_url": "TEST", "channel": "slack", "device_tokens": ["TEST"]},
@@ -449,7 +531,7 @@ class SubscriberApiTests(TestCase):
             )
             mock_request.reset_mock()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_update_subscriber(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -476,7 +558,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": {"acknowledged": True, "status": "deleted"}})
 
@@ -491,7 +573,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_credentials_update_webhook_url(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -508,7 +590,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_credentials_update_device_tokens(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -525,7 +607,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_online_status(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -542,7 +624,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_preferences(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200,
@@ -589,7 +671,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_change_channel_preference(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200,
@@ -631,7 +713,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_change_channel_preference_using_enum_in_params(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200,
@@ -673,7 +755,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_change_preference_state(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200,
@@ -715,7 +797,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_unseen_notifications(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": {"count": 0}})
 
@@ -731,7 +813,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete_credentials(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204)
 
@@ -746,7 +828,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_mark_as_read(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, data={"data": [self.message_json]})
 
@@ -762,7 +844,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_mark_as_seen(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, data={"data": [self.message_json]})
 
@@ -778,7 +860,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_mark_all_as(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, data={"data": 1})
 
@@ -794,7 +876,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_mark_all_as_with_identifier(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, data={"data": 1})
 
@@ -810,7 +892,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_mark_message_action(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, data={"data": self.message_json})
 
@@ -828,7 +910,7 @@ class SubscriberApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_mark_message_action_with_payload(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, data={"data": self.message_json})
 
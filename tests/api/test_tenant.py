@@ -37,7 +37,7 @@ class TenantApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = TenantApi()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -54,7 +54,7 @@ class TenantApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_tenant_using_pagination(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -71,7 +71,7 @@ class TenantApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_stream_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -88,7 +88,7 @@ class TenantApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_stream_with_multiple_pages_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.side_effect = [
             MockResponse(
@@ -110,7 +110,7 @@ class TenantApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             201, {"data": {"_id": "63e17e5b33a4f299199329b5", "identifier": "my-tenant", "name": "My Tenant"}}
@@ -130,7 +130,7 @@ class TenantApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -149,7 +149,7 @@ class TenantApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_patch_tenant(self, mock_request: mock.MagicMock) -> None:
         res_patch = copy.deepcopy(self.response_get)
         res_patch["data"]["identifier"] = "new-tenant-ref"
@@ -170,7 +170,7 @@ class TenantApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete_tenant(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204, raise_on_json_decode=True)
 
@@ -38,7 +38,7 @@ class TopicApiTests(TestCase):
         NovuConfig.configure("sample.novu.com", "api-key")
         cls.api = TopicApi()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_topic(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -55,7 +55,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_list_topic_using_pagination(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_list)
 
@@ -72,7 +72,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_create_topic(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(201, {"data": {"_id": "63e17e5b33a4f299199329b5", "key": "my-topic"}})
 
@@ -91,7 +91,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_get_topic(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -110,7 +110,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_subscribe_ok(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, {"data": {"succeeded": ["63dafed4117f8c850991ec4a"]}})
 
@@ -127,7 +127,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_subscribe_with_ok_and_failed(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200, {"data": {"succeeded": ["63dafed4117f8c850991ec4a"], "failed": {"notFound": ["not-defined"]}}}
@@ -146,7 +146,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_unsubscribe_single_subscriber(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204)
 
@@ -161,7 +161,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_unsubscribe_multiple_subscribers(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204)
 
@@ -176,7 +176,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_rename_200(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(200, self.response_get)
 
@@ -194,7 +194,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_delete(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(204)
 
@@ -209,7 +209,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_unsubscribed_ok(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(
             200,
@@ -241,7 +241,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_unsubscribed_ko(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(404)
 
@@ -256,7 +256,7 @@ class TopicApiTests(TestCase):
             timeout=5,
         )
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_unsubscribed_failure(self, mock_request: mock.MagicMock) -> None:
         mock_request.return_value = MockResponse(409)
 
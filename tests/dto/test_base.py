@@ -0,0 +1,364 @@
+import copy
+import dataclasses
+import pickle
+from typing import List, Optional
+from unittest import TestCase, mock
+
+from novu.dto.base import (
+    CamelCaseDto,
+    DtoDescriptor,
+    DtoIterableDescriptor,
+    DtoView,
+    clear_intern_pool,
+    get_compact_class,
+    get_decoder,
+    get_view_class,
+    intern_string,
+    set_interned_fields,
+)
+from novu.dto.subscriber import SubscriberDto
+
+
+@dataclasses.dataclass
+class ChildDto(CamelCaseDto["ChildDto"]):
+    child_id: str
+
+
+@dataclasses.dataclass
+class ParentDto(CamelCaseDto["ParentDto"]):
+    _id: str
+    parent_name: str
+    child: ChildDto = None  # type: ignore[assignment]
+    version_2: Optional[str] = None
+
+
+@dataclasses.dataclass
+class TaggedDto(CamelCaseDto["TaggedDto"]):
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
+class CamelCaseDtoTests(TestCase):
+    def test_from_camel_case(self) -> None:
+        result = ParentDto.from_camel_case({"_id": "id", "parentName": "name", "child": {"childId": "child-id"}})
+
+        self.assertEqual(result, ParentDto("id", "name", ChildDto("child-id")))
+
+    def test_from_camel_case_ignore_unknown_keys(self) -> None:
+        result = ParentDto.from_camel_case({"_id": "id", "parentName": "name", "unknownKey": "value"})
+
+        self.assertEqual(result, ParentDto("id", "name"))
+
+    def test_from_camel_case_not_reversible_field_name(self) -> None:
+        result = ParentDto.from_camel_case({"_id": "id", "parentName": "name", "version_2": "v2", "version2": "v3"})
+
+        self.assertEqual(result, ParentDto("id", "name", version_2="v2"))
+
+    def test_from_camel_case_other_spellings(self) -> None:
+        result = ParentDto.from_camel_case({"_id": "id", "parent-name": "name"})
+        self.assertEqual(result, ParentDto("id", "name"))
+
+        result = ParentDto.from_camel_case({"_id": "id", "ParentName": "name"})
+        self.assertEqual(result, ParentDto("id", "name"))
+
+    def test_from_camel_case_private_fields(self) -> None:
+        @dataclasses.dataclass
+        class PrivateDto(CamelCaseDto["PrivateDto"]):
+            _environment_id: str
+
+        self.assertEqual(PrivateDto.from_camel_case({"_environmentId": "env"}), PrivateDto("env"))
+
+    def test_from_camel_case_fields(self) -> None:
+        with mock.patch.object(ChildDto, "from_camel_case") as from_camel_case:
+            result = ParentDto.from_camel_case({"_id": "id", "child": {"childId": "child-id"}}, fields=["_id"])
+
+        self.assertEqual(result, ParentDto("id", None))  # type: ignore[arg-type]
+        from_camel_case.assert_not_called()
+
+    def test_from_camel_case_exclude(self) -> None:
+        result = ParentDto.from_camel_case(
+            {"_id": "id", "parentName": "name", "child": {"childId": "child-id"}, "version_2": "v2"},
+            exclude=["child", "parent_name"],
+        )
+
+        self.assertEqual(result, ParentDto("id", None, version_2="v2"))  # type: ignore[arg-type]
+
+    def test_from_camel_case_fields_and_exclude(self) -> None:
+        result = ParentDto.from_camel_case(
+            {"_id": "id", "parentName": "name"}, fields=["_id", "parent_name"], exclude=["_id"]
+        )
+
+        self.assertEqual(result, ParentDto(None, "name"))  # type: ignore[arg-type]
+
+    def test_from_camel_case_unknown_projected_field(self) -> None:
+        self.assertRaises(ValueError, ParentDto.from_camel_case, {}, fields=["unknown"])
+        self.assertRaises(ValueError, ParentDto.from_camel_case, {}, exclude=["unknown"])
+
+    def test_projected_decoder_built_once(self) -> None:
+        self.assertIs(get_decoder(ParentDto, fields=["_id"]), get_decoder(ParentDto, fields=("_id",)))
+        self.assertIs(get_decoder(ParentDto, exclude=[]), get_decoder(ParentDto))
+        self.assertIsNot(get_decoder(ParentDto, fields=["_id"]), get_decoder(ParentDto))
+
+    def test_decoder_built_once(self) -> None:
+        self.assertIs(get_decoder(SubscriberDto), get_decoder(SubscriberDto))
+        self.assertIsNot(get_decoder(SubscriberDto), get_decoder(ParentDto))
+
+    @mock.patch("novu.dto.base.DECODER_CACHE_SIZE", 0)
+    def test_decoder_cache_limit(self) -> None:
+        @dataclasses.dataclass
+        class LimitedDto(CamelCaseDto["LimitedDto"]):
+            limited_id: str
+
+        self.assertEqual(LimitedDto.from_camel_case({"LimitedId": "id", "other": 1}), LimitedDto("id"))
+        self.assertEqual(LimitedDto.from_camel_case({"limited-id": "id"}), LimitedDto("id"))
+
+
+class ToCamelCaseTests(TestCase):
+    def test_to_camel_case(self) -> None:
+        result = ParentDto("id", "name", ChildDto("child-id"), "v2").to_camel_case()
+
+        self.assertEqual(
+            result, {"_id": "id", "parentName": "name", "child": {"child_id": "child-id"}, "version2": "v2"}
+        )
+
+    def test_to_camel_case_fields_and_ignored(self) -> None:
+        @dataclasses.dataclass
+        class SelectedDto(CamelCaseDto["SelectedDto"]):
+            snake_case_to_camel_case_ignored = ["kept_name"]
+            camel_case_fields = ["kept_name", "other_name"]
+
+            kept_name: str
+            other_name: str
+            hidden_name: str
+
+        self.assertEqual(SelectedDto("a", "b", "c").to_camel_case(), {"kept_name": "a", "otherName": "b"})
+
+    def test_to_camel_case_does_not_copy_payloads(self) -> None:
+        data = {"nested": {"key": ["value"]}}
+        result = SubscriberDto("subscriber-id", data=data).to_camel_case()
+
+        self.assertIs(result["data"], data)
+
+    def test_to_camel_case_converts_nested_dataclasses(self) -> None:
+        @dataclasses.dataclass
+        class ContainerDto(CamelCaseDto["ContainerDto"]):
+            items: list
+            mapping: dict
+
+        payload = {"plain": [1, 2]}
+        result = ContainerDto(
+            [1, payload, ChildDto("a")], {"child": (ChildDto("b"),), "other": payload}
+        ).to_camel_case()
+
+        self.assertEqual(
+            result,
+            {
+                "items": [1, {"plain": [1, 2]}, {"child_id": "a"}],
+                "mapping": {"child": ({"child_id": "b"},), "other": {"plain": [1, 2]}},
+            },
+        )
+        self.assertIs(result["items"][1], payload)
+        self.assertIs(result["mapping"]["other"], payload)
+
+
+@dataclasses.dataclass
+class DescribedDto(CamelCaseDto["DescribedDto"]):
+    child: DtoDescriptor[ChildDto] = DtoDescriptor[ChildDto](item_cls=ChildDto)
+    children: DtoIterableDescriptor[ChildDto] = DtoIterableDescriptor[ChildDto](default_factory=list, item_cls=ChildDto)
+
+
+class CompactClassTests(TestCase):
+    def test_compact_class(self) -> None:
+        compact = ParentDto.compact()
+
+        result = compact.from_camel_case({"_id": "id", "parentName": "name", "child": {"childId": "child-id"}})
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertIs(type(result.child), ChildDto.compact())
+        self.assertFalse(hasattr(result.child, "__dict__"))
+        self.assertEqual(result, compact("id", "name", ChildDto.compact()("child-id")))
+        self.assertEqual(result.to_camel_case(), ParentDto("id", "name", ChildDto("child-id")).to_camel_case())
+        self.assertEqual(repr(result.child), "ChildDto.Compact(child_id='child-id')")
+
+    def test_compact_class_built_once(self) -> None:
+        self.assertIs(ParentDto.compact(), ParentDto.compact())
+        self.assertIs(ParentDto.compact().compact(), ParentDto.compact())
+        self.assertIs(get_compact_class(ParentDto), ParentDto.compact())
+
+    def test_compact_class_descriptors(self) -> None:
+        compact = DescribedDto.compact()
+
+        result = compact.from_camel_case({"child": {"childId": "a"}, "children": [{"childId": "b"}, ChildDto("c")]})
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(result.child, ChildDto.compact()("a"))
+        self.assertEqual(result.children, [ChildDto.compact()("b"), ChildDto("c")])
+        self.assertIsNone(compact().child)
+        self.assertIsNone(compact().children)
+
+    def test_compact_class_pickle(self) -> None:
+        parent = ParentDto.compact().from_camel_case({"_id": "id", "parentName": "name", "child": {"childId": "a"}})
+        described = DescribedDto.compact().from_camel_case({"child": {"childId": "b"}, "children": [{"childId": "c"}]})
+
+        for value in (parent, described):
+            with self.subTest(value=value):
+                result = pickle.loads(pickle.dumps(value))
+
+                self.assertIs(type(result), type(value))
+                self.assertEqual(result, value)
+                self.assertEqual(copy.deepcopy(value), value)
+
+
+class DescriptorTests(TestCase):
+    def test_descriptors_decode_on_first_access(self) -> None:
+        with mock.patch.object(ChildDto, "from_camel_case", wraps=ChildDto.from_camel_case) as from_camel_case:
+            result = DescribedDto.from_camel_case({"child": {"childId": "a"}, "children": [{"childId": "b"}]})
+            from_camel_case.assert_not_called()
+
+            self.assertEqual(result.child, ChildDto("a"))
+            self.assertIs(result.child, result.child)
+            self.assertEqual(result.children, [ChildDto("b")])
+            self.assertIs(result.children, result.children)
+            self.assertEqual(from_camel_case.call_count, 2)
+
+    def test_iterable_descriptor_consumes_iterators(self) -> None:
+        result = DescribedDto(children=iter([{"childId": "a"}]))
+
+        self.assertEqual(result.children, [ChildDto("a")])
+
+    def test_unnamed_descriptors(self) -> None:
+        result = DescribedDto(child=ChildDto("a"))
+
+        self.assertIsNone(DtoDescriptor[ChildDto](item_cls=ChildDto).__get__(result, DescribedDto))
+        self.assertIsNone(
+            DtoIterableDescriptor[ChildDto](default_factory=list, item_cls=ChildDto).__get__(result, DescribedDto)
+        )
+
+
+class ViewClassTests(TestCase):
+    def test_view(self) -> None:
+        data = {"_id": "id", "ParentName": "name", "child": {"childId": "child-id"}}
+
+        result = ParentDto.view()(data)
+
+        self.assertIsInstance(result, DtoView)
+        self.assertEqual(result._id, "id")
+        self.assertEqual(result.parent_name, "name")
+        self.assertEqual(result.child, ChildDto.view()({"childId": "child-id"}))
+        self.assertEqual(result.child.child_id, "child-id")
+        self.assertIsNone(result.version_2)
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(repr(result.child), "ChildDto.View({'childId': 'child-id'})")
+
+    def test_view_equality(self) -> None:
+        result = ChildDto.view()({"childId": "child-id"})
+
+        self.assertEqual(result, ChildDto.view()({"childId": "child-id"}))
+        self.assertNotEqual(result, ChildDto.view()({"childId": "other-id"}))
+        self.assertNotEqual(result, ChildDto("child-id"))
+        self.assertNotEqual(result, {"childId": "child-id"})
+
+    def test_view_default_factory(self) -> None:
+        first, second = TaggedDto.view()({}), TaggedDto.view()({})
+
+        self.assertEqual(first.tags, [])
+        self.assertIsNot(first.tags, second.tags)
+        self.assertEqual(TaggedDto.view()({"tags": ["a"]}).tags, ["a"])
+
+    def test_view_does_not_copy(self) -> None:
+        data = {"childId": "child-id"}
+
+        result = ChildDto.view()(data)
+        data["childId"] = "other-id"
+
+        self.assertEqual(result.child_id, "other-id")
+
+    def test_view_descriptors(self) -> None:
+        result = DescribedDto.view().from_camel_case({"child": {"childId": "a"}, "children": [{"childId": "b"}]})
+
+        self.assertEqual(result.child.child_id, "a")
+        self.assertEqual([child.child_id for child in result.children], ["b"])
+        self.assertIsNone(DescribedDto.view()({}).children)
+
+    def test_view_missing_required_field(self) -> None:
+        result = ChildDto.view()({})
+
+        self.assertRaises(AttributeError, getattr, result, "child_id")
+
+    def test_view_read_only(self) -> None:
+        result = ChildDto.view()({"childId": "child-id"})
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            result.child_id = "other-id"  # type: ignore[misc]
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            del result.child_id  # type: ignore[misc]
+
+    def test_view_to_dto(self) -> None:
+        data = {"_id": "id", "parentName": "name", "child": {"childId": "child-id"}}
+
+        result = ParentDto.view()(data)
+
+        self.assertEqual(result.to_dto(), ParentDto.from_camel_case(data))
+        self.assertEqual(result.to_camel_case(), ParentDto.from_camel_case(data).to_camel_case())
+
+    def test_view_class_built_once(self) -> None:
+        self.assertIs(ParentDto.view(), ParentDto.view())
+        self.assertIs(get_view_class(ParentDto), ParentDto.view())
+
+
+class InterningTests(TestCase):
+    def tearDown(self) -> None:
+        set_interned_fields(ParentDto, None)
+        clear_intern_pool()
+
+    def test_interned_fields(self) -> None:
+        set_interned_fields(ParentDto, ["parent_name"])
+
+        first = ParentDto.from_camel_case({"_id": "".join(["id", "-1"]), "parentName": "".join(["na", "me"])})
+        second = ParentDto.from_camel_case({"_id": "".join(["id", "-1"]), "parentName": "".join(["na", "me"])})
+
+        self.assertIs(first.parent_name, second.parent_name)
+        self.assertIsNot(first._id, second._id)
+        self.assertEqual(first, second)
+
+    def test_interned_fields_disabled(self) -> None:
+        set_interned_fields(ParentDto, ["parent_name"])
+        set_interned_fields(ParentDto, None)
+
+        first = ParentDto.from_camel_case({"_id": "id", "parentName": "".join(["na", "me"])})
+        second = ParentDto.from_camel_case({"_id": "id", "parentName": "".join(["na", "me"])})
+
+        self.assertIsNot(first.parent_name, second.parent_name)
+
+    def test_interned_fields_compact_class(self) -> None:
+        compact = ParentDto.compact()
+        set_interned_fields(ParentDto, ["parent_name"])
+
+        first = compact.from_camel_case({"_id": "id", "parentName": "".join(["na", "me"])})
+        second = compact.from_camel_case({"_id": "id", "parentName": "".join(["na", "me"])})
+
+        self.assertIs(first.parent_name, second.parent_name)
+
+    def test_interned_fields_without_compact_class(self) -> None:
+        @dataclasses.dataclass
+        class LabelDto(CamelCaseDto["LabelDto"]):
+            label: str
+
+        set_interned_fields(LabelDto, ["label"])
+
+        first = LabelDto.from_camel_case({"label": "".join(["la", "bel"])})
+        second = LabelDto.from_camel_case({"label": "".join(["la", "bel"])})
+
+        self.assertIs(first.label, second.label)
+        self.assertEqual(get_compact_class(LabelDto).interned_fields, ["label"])
+
+    def test_interned_fields_unknown_field(self) -> None:
+        self.assertRaises(ValueError, set_interned_fields, ParentDto, ["unknown"])
+
+    def test_intern_string(self) -> None:
+        self.assertIs(intern_string("".join(["va", "lue"])), intern_string("".join(["va", "lue"])))
+        self.assertEqual(intern_string(1), 1)
+        self.assertIsNone(intern_string(None))
+
+    @mock.patch("novu.dto.base.INTERN_POOL_SIZE", 0)
+    def test_intern_pool_full(self) -> None:
+        self.assertIsNot(intern_string("".join(["va", "lue"])), intern_string("".join(["va", "lue"])))
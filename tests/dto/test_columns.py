@@ -0,0 +1,107 @@
+from unittest import TestCase, mock
+
+from novu.dto.columns import Columns
+from novu.dto.message import MessageDto, PaginatedMessageDto
+from novu.dto.notification import (
+    ActivityNotificationDto,
+    PaginatedActivityNotificationDto,
+)
+from novu.enums import Channel
+
+
+class ColumnsTests(TestCase):
+    messages = [
+        MessageDto(_id="1", channel=Channel.EMAIL, status="sent", transaction_id="t1"),
+        MessageDto(_id="2", channel=Channel.SMS, status=None, transaction_id="t2"),
+        MessageDto(_id="3", channel=Channel.EMAIL, status="sent", transaction_id="t3"),
+    ]
+
+    def test_from_items(self) -> None:
+        columns = Columns.from_items(MessageDto, self.messages)
+
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns.fields, [f for f in columns])
+        self.assertEqual(repr(columns), f"Columns(MessageDto, fields={columns.fields!r}, length=3)")
+        self.assertEqual(columns["_id"], ["1", "2", "3"])
+        self.assertEqual(columns["transaction_id"], ["t1", "t2", "t3"])
+        self.assertEqual(columns["channel"], [0, 1, 0])
+        self.assertEqual(columns.categories["channel"], [Channel.EMAIL, Channel.SMS])
+        self.assertEqual(columns["status"], [0, -1, 0])
+        self.assertEqual(columns.values("status"), ["sent", None, "sent"])
+        self.assertEqual(columns.values("_id"), ["1", "2", "3"])
+
+    def test_from_items_fields_and_categorical(self) -> None:
+        columns = Columns.from_items(MessageDto, self.messages, fields=["_id", "status"], categorical=["_id"])
+
+        self.assertEqual(columns.fields, ["_id", "status"])
+        self.assertEqual(columns["_id"], [0, 1, 2])
+        self.assertEqual(columns["status"], ["sent", None, "sent"])
+        self.assertEqual(list(columns.categories), ["_id"])
+
+    def test_from_items_unknown_field(self) -> None:
+        self.assertRaises(ValueError, Columns.from_items, MessageDto, self.messages, fields=["unknown"])
+        self.assertRaises(ValueError, Columns.from_items, MessageDto, self.messages, categorical=["unknown"])
+
+    def test_from_items_dicts(self) -> None:
+        columns = Columns.from_items(
+            MessageDto, [{"_id": "1", "channel": "email"}, {"_id": "2"}], fields=["_id", "channel"]
+        )
+
+        self.assertEqual(columns["_id"], ["1", "2"])
+        self.assertEqual(columns["channel"], [0, -1])
+        self.assertEqual(columns.categories["channel"], ["email"])
+
+    def test_from_items_list_categories(self) -> None:
+        notifications = [
+            ActivityNotificationDto("env", "org", "t1", channels=["in_app"]),  # type: ignore[arg-type]
+            ActivityNotificationDto("env", "org", "t2", channels=["in_app"]),  # type: ignore[arg-type]
+        ]
+
+        columns = Columns.from_items(ActivityNotificationDto, notifications)
+
+        self.assertEqual(columns["channels"], [0, 0])
+        self.assertEqual(columns.categories["channels"], [["in_app"]])
+        self.assertEqual(columns["_environment_id"], [0, 0])
+
+    def test_empty(self) -> None:
+        columns = Columns.from_items(MessageDto, [])
+
+        self.assertEqual(len(columns), 0)
+        self.assertEqual(columns["_id"], [])
+
+    def test_page_to_columns(self) -> None:
+        page = PaginatedMessageDto(data=self.messages)  # type: ignore[arg-type]
+
+        self.assertEqual(page.to_columns(fields=["_id"])["_id"], ["1", "2", "3"])
+
+    def test_activity_page_to_columns(self) -> None:
+        page = PaginatedActivityNotificationDto.from_camel_case(
+            {
+                "page": 0,
+                "data": [
+                    {"_environmentId": "env", "_organizationId": "org", "transactionId": "t1"},
+                    {"_environmentId": "env", "_organizationId": "org", "transactionId": "t2"},
+                ],
+            }
+        )
+
+        columns = page.to_columns(fields=["transaction_id"])
+
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns["transaction_id"], ["t1", "t2"])
+
+    @mock.patch("importlib.import_module")
+    def test_to_numpy(self, import_module: mock.MagicMock) -> None:
+        numpy = import_module.return_value
+
+        arrays = Columns.from_items(MessageDto, self.messages, fields=["_id", "channel"]).to_numpy()
+
+        import_module.assert_called_once_with("numpy")
+        self.assertEqual(list(arrays), ["_id", "channel"])
+        numpy.asarray.assert_has_calls(
+            [mock.call(["1", "2", "3"], dtype=None), mock.call([0, 1, 0], dtype=numpy.int32)]
+        )
+
+    def test_to_numpy_not_installed(self) -> None:
+        with mock.patch("importlib.import_module", side_effect=ModuleNotFoundError):
+            self.assertRaises(ModuleNotFoundError, Columns.from_items(MessageDto, self.messages).to_numpy)
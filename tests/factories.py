@@ -1,5 +1,10 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from json.decoder import JSONDecodeError
 
+import httpx
 from requests.models import HTTPError
 
 
@@ -37,3 +42,84 @@ class MockResponse:
             else:
                 yield self.data[i : len(self.data)]  # noqa: E203
             i += chunk_size
+
+
+class FakeClock:
+    """A clock standing in for the :mod:`time` module of the time-based helpers: it only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.now += delay
+
+
+def build_httpx_response(
+    status, data=None, raise_on_json_decode=False, url="sample.novu.com", headers=None
+) -> httpx.Response:
+    request = httpx.Request("GET", f"https://{url}")
+    if raise_on_json_decode:
+        return httpx.Response(status, content=b"not-a-json", request=request, headers=headers)
+    if status == 204:
+        return httpx.Response(status, request=request, headers=headers)
+    return httpx.Response(status, json=data or {}, request=request, headers=headers)
+
+
+class StandInServer:
+    """A local HTTP server standing in for Novu: it serves at most ``capacity`` requests at once, each in ``latency``
+    seconds, and rejects the others at once with HTTP 429. The served requests are echoed in the ``data`` of the
+    responses."""
+
+    def __init__(self, capacity: int, latency: float = 0.01):
+        self.served = self.rejected = 0
+        self.lock = threading.Lock()
+        slots = threading.BoundedSemaphore(capacity)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # pylint: disable=C0103
+                content = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if slots.acquire(blocking=False):
+                    time.sleep(latency)
+                    slots.release()
+                    echo = {"method": self.command, "path": self.path, "headers": dict(self.headers)}
+                    echo["body"] = json.loads(content) if content else None
+                    status, body = 200, json.dumps({"data": echo}).encode()
+                else:
+                    status, body = 429, b'{"message": "Too many requests"}'
+
+                with server.lock:
+                    if status == 200:
+                        server.served += 1
+                    else:
+                        server.rejected += 1
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+            def log_message(self, *_):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.01,), daemon=True)
+
+    def __enter__(self) -> "StandInServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
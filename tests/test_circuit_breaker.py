@@ -0,0 +1,154 @@
+from typing import List, Tuple
+from unittest import TestCase, mock
+
+from novu.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    endpoint_template,
+)
+from tests.factories import FakeClock
+
+URL = "https://api.novu.co/v1/subscribers/subscriber-id"
+
+
+class EndpointTemplateTests(TestCase):
+    def test_replace_identifiers(self) -> None:
+        self.assertEqual(
+            endpoint_template("https://api.novu.co/v1/subscribers/subscriber-id/preferences/template-id?limit=10"),
+            "/v1/subscribers/{id}/preferences/{id}",
+        )
+        self.assertEqual(endpoint_template("https://api.novu.co/v1/events/trigger/bulk"), "/v1/events/trigger/bulk")
+        self.assertEqual(
+            endpoint_template("https://api.novu.co/v1/topics/key/subscribers/removal"),
+            "/v1/topics/{id}/subscribers/removal",
+        )
+        self.assertEqual(endpoint_template("https://api.novu.co/v1/subscribers"), "/v1/subscribers")
+
+    def test_url_without_scheme(self) -> None:
+        self.assertEqual(endpoint_template("api.novu.co/v1/layouts/layout-id/default"), "/v1/layouts/{id}/default")
+
+
+class CircuitBreakerTests(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = mock.patch("novu.circuit_breaker.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.changes: List[Tuple[str, str, str]] = []
+        self.breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=10,
+            on_state_change=lambda *change: self.changes.append(change),
+        )
+
+    def fail(self, url: str = URL) -> None:
+        self.breaker.release(self.breaker.acquire(url), failed=True)
+
+    def test_open_after_consecutive_failures(self) -> None:
+        self.fail()
+        self.breaker.release(self.breaker.acquire(URL), failed=False)
+        self.fail()
+        self.assertEqual(self.breaker.state(URL), CircuitState.CLOSED)
+
+        self.fail()
+
+        self.assertEqual(self.breaker.state(URL), CircuitState.OPEN)
+        self.assertEqual(self.changes, [("/v1/subscribers/{id}", CircuitState.CLOSED, CircuitState.OPEN)])
+
+    def test_fail_fast_while_open(self) -> None:
+        self.fail()
+        self.fail()
+        self.clock.now = 4
+
+        with self.assertRaises(CircuitOpenError) as context:
+            self.breaker.acquire("https://api.novu.co/v1/subscribers/other-id")
+
+        self.assertEqual(context.exception.endpoint, "/v1/subscribers/{id}")
+        self.assertEqual(context.exception.retry_in, 6)
+        self.breaker.acquire("https://api.novu.co/v1/subscribers")
+
+    def test_close_after_successful_trial(self) -> None:
+        self.fail()
+        self.fail()
+        self.clock.now = 10
+
+        token = self.breaker.acquire(URL)
+        self.assertTrue(token.trial)
+        self.assertEqual(self.breaker.state(URL), CircuitState.HALF_OPEN)
+        self.assertRaises(CircuitOpenError, self.breaker.acquire, URL)
+        self.breaker.release(token, failed=False)
+
+        self.assertEqual(self.breaker.state(URL), CircuitState.CLOSED)
+        self.assertEqual(
+            [change[1:] for change in self.changes],
+            [
+                (CircuitState.CLOSED, CircuitState.OPEN),
+                (CircuitState.OPEN, CircuitState.HALF_OPEN),
+                (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+            ],
+        )
+
+    def test_open_again_after_failed_trial(self) -> None:
+        self.fail()
+        self.fail()
+        self.clock.now = 10
+
+        self.fail()
+
+        self.assertEqual(self.breaker.state(URL), CircuitState.OPEN)
+        self.assertRaises(CircuitOpenError, self.breaker.acquire, URL)
+        self.clock.now = 20
+        self.breaker.acquire(URL)
+
+    def test_closed_request_over_during_trial(self) -> None:
+        token = self.breaker.acquire(URL)
+        self.fail()
+        self.fail()
+        self.clock.now = 10
+        trial = self.breaker.acquire(URL)
+
+        self.breaker.release(token, failed=False)
+
+        self.assertEqual(self.breaker.state(URL), CircuitState.HALF_OPEN)
+        self.assertRaises(CircuitOpenError, self.breaker.acquire, URL)
+        self.breaker.release(trial, failed=True)
+        self.assertEqual(self.breaker.state(URL), CircuitState.OPEN)
+
+    def test_stale_failures_ignored(self) -> None:
+        tokens = [self.breaker.acquire(URL) for _ in range(4)]
+        self.breaker.release(tokens[0], failed=True)
+        self.breaker.release(tokens[1], failed=True)
+        self.clock.now = 10
+        self.breaker.release(self.breaker.acquire(URL), failed=False)
+
+        self.breaker.release(tokens[2], failed=True)
+        self.breaker.release(tokens[3], failed=True)
+
+        self.assertEqual(self.breaker.state(URL), CircuitState.CLOSED)
+        self.fail()
+        self.assertEqual(self.breaker.state(URL), CircuitState.CLOSED)
+
+    def test_hook_errors_ignored(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, on_state_change=mock.Mock(side_effect=RuntimeError))
+
+        with self.assertLogs("novu.circuit_breaker", "ERROR"):
+            breaker.release(breaker.acquire(URL), failed=True)
+
+        self.assertEqual(breaker.state(URL), CircuitState.OPEN)
+
+    def test_reset(self) -> None:
+        token = self.breaker.acquire(URL)
+        self.fail()
+        self.fail()
+
+        self.breaker.reset()
+        self.breaker.release(token, failed=True)
+        self.fail()
+
+        self.assertEqual(self.breaker.state(URL), CircuitState.CLOSED)
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(ValueError, CircuitBreaker, failure_threshold=0)
+        self.assertRaises(ValueError, CircuitBreaker, half_open_max_calls=0)
@@ -0,0 +1,207 @@
+import asyncio
+import dataclasses
+import threading
+from typing import Optional
+from unittest import IsolatedAsyncioTestCase, TestCase, mock
+
+from requests.exceptions import HTTPError
+
+from novu.api.base import Api
+from novu.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    AsyncAdaptiveConcurrencyLimiter,
+    ConcurrencySettings,
+)
+from tests.factories import FakeClock, StandInServer
+
+
+class AdaptiveConcurrencyLimiterTests(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = mock.patch("novu.concurrency.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request(
+        self, limiter: AdaptiveConcurrencyLimiter, latency: float = 1, overloaded: bool = False, url: str = ""
+    ) -> None:
+        lease = limiter.acquire(url)
+        self.clock.now += latency
+        limiter.release(lease, overloaded)
+
+    def saturate(self, limiter: AdaptiveConcurrencyLimiter, latency: float = 1, overloaded: bool = False) -> None:
+        leases = [limiter.acquire() for _ in range(limiter.limit)]
+        self.clock.now += latency
+        for lease in leases:
+            limiter.release(lease, overloaded)
+
+    def test_additive_increase_when_saturated(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        self.request(limiter)
+        self.assertEqual(limiter.limit, 4)
+
+        self.saturate(limiter)
+        self.saturate(limiter)
+        self.assertEqual(limiter.limit, 4)
+        self.saturate(limiter)
+        self.assertEqual(limiter.limit, 5)
+
+    def test_multiplicative_decrease_once_per_window(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        self.saturate(limiter, overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+        self.saturate(limiter, overloaded=True)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_decrease_on_latency_spike(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2)
+
+        self.request(limiter, latency=1)
+        self.request(limiter, latency=1.5)
+        self.assertEqual(limiter.limit, 8)
+        self.request(limiter, latency=3)
+        self.assertEqual(limiter.limit, 4)
+        self.assertAlmostEqual(limiter.baseline(), 1.025, places=3)  # type: ignore[arg-type]
+
+    def test_baseline_per_endpoint(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2)
+
+        self.request(limiter, latency=0.1, url="https://api.novu.co/v1/subscribers/subscriber-id")
+        self.request(limiter, latency=1, url="https://api.novu.co/v1/events/trigger/bulk")
+        self.request(limiter, latency=1.5, url="https://api.novu.co/v1/events/trigger/bulk")
+        self.assertEqual(limiter.limit, 8)
+        self.assertEqual(limiter.baseline("https://api.novu.co/v1/subscribers/other-id"), 0.1)
+        self.assertAlmostEqual(limiter.baseline("/v1/events/trigger/bulk"), 1.005, places=3)  # type: ignore[arg-type]
+        self.assertIsNone(limiter.baseline("/v1/topics"))
+
+        self.request(limiter, latency=0.5, url="https://api.novu.co/v1/subscribers/subscriber-id")
+        self.assertEqual(limiter.limit, 4)
+
+    def test_bounds(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=3)
+
+        self.saturate(limiter, overloaded=True)
+        self.assertEqual(limiter.limit, 2)
+        for _ in range(10):
+            self.saturate(limiter)
+        self.assertEqual(limiter.limit, 3)
+
+    def test_acquire_waits_for_a_slot(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        lease = limiter.acquire()
+        acquired = threading.Event()
+
+        thread = threading.Thread(target=lambda: acquired.set() if limiter.acquire() is not None else None)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+
+        limiter.release(lease)
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_slot(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        with self.assertRaises(RuntimeError):
+            with limiter.slot():
+                raise RuntimeError()
+
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(ValueError, AdaptiveConcurrencyLimiter, initial_limit=0)
+        self.assertRaises(ValueError, AdaptiveConcurrencyLimiter, initial_limit=8, max_limit=4)
+        self.assertRaises(ValueError, AdaptiveConcurrencyLimiter, backoff=1)
+
+    def test_settings(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+
+        self.assertEqual(limiter.settings, ConcurrencySettings(initial_limit=2, max_limit=8))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            limiter.settings.max_limit = 16  # type: ignore[misc]
+
+
+class AsyncAdaptiveConcurrencyLimiterTests(IsolatedAsyncioTestCase):
+    async def test_acquire_waits_for_a_slot(self) -> None:
+        limiter = AsyncAdaptiveConcurrencyLimiter(initial_limit=1)
+        lease = await limiter.acquire()
+
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiting.done())
+
+        limiter.release(lease)
+        await asyncio.wait_for(waiting, 5)
+        self.assertEqual(limiter.in_flight, 1)
+
+    async def test_cancelled_acquire(self) -> None:
+        limiter = AsyncAdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        lease = await limiter.acquire()
+
+        cancelled, waiting = asyncio.ensure_future(limiter.acquire()), asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        limiter.release(lease)
+        lease = await asyncio.wait_for(waiting, 5)
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+
+        cancelled = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+        limiter.release(lease)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+class SimulationTests(TestCase):
+    """Run workers against a local server with a limited capacity, which rejects the requests above it."""
+
+    def simulate(self, server: StandInServer, limiter: Optional[AdaptiveConcurrencyLimiter], requests: int) -> int:
+        api = Api(url=server.url, api_key="api-key")
+        api.retry_policy = None
+        api.concurrency_limiter = limiter
+        remaining = iter(range(requests))
+        lock = threading.Lock()
+        self.max_limit = 0
+
+        def work() -> None:
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+                while True:
+                    try:
+                        api.handle_request("GET", f"{server.url}/v1/subscribers")
+                        break
+                    except HTTPError:
+                        pass
+                    finally:
+                        self.max_limit = max(self.max_limit, limiter.limit if limiter else 0)
+
+        workers = [threading.Thread(target=work) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(server.served, requests)
+        return server.rejected
+
+    def test_adaptive_limit_follows_capacity(self) -> None:
+        with StandInServer(capacity=4) as server:
+            rejected_without_limiter = self.simulate(server, None, 100)
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=32)
+        with StandInServer(capacity=4) as server:
+            rejected = self.simulate(server, limiter, 200)
+
+        self.assertGreaterEqual(self.max_limit, 3)
+        self.assertLessEqual(limiter.limit, 8)
+        self.assertLess(rejected, 40)
+        self.assertLess(rejected, rejected_without_limiter)
@@ -0,0 +1,251 @@
+import os
+import tempfile
+import time
+from unittest import TestCase, mock
+
+import requests
+
+from novu.api import EventApi
+from novu.api.event import BulkTriggerError
+from novu.config import NovuConfig
+from novu.dto.event import EventDto, InputEventDto
+from novu.enums import EventStatus
+from novu.outbox import FAILED, TriggerOutbox
+from tests.factories import MockResponse
+
+
+def echo_bulk(**kwargs) -> MockResponse:
+    events = kwargs["json"]["events"]
+    if any(event["to"] == "failing" for event in events):
+        return MockResponse(500)
+    if any(event["to"] == "invalid" for event in events):
+        return MockResponse(400)
+    return MockResponse(
+        201,
+        {
+            "data": [
+                {"acknowledged": True, "status": "processed", "transactionId": event["transactionId"]}
+                for event in events
+            ]
+        },
+    )
+
+
+class TriggerOutboxTests(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        NovuConfig.configure("sample.novu.com", "api-key")
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "outbox.sqlite3")
+
+    def open(self, **kwargs) -> TriggerOutbox:
+        outbox = TriggerOutbox(self.path, EventApi(), drain=False, **kwargs)
+        self.addCleanup(outbox.close)
+        return outbox
+
+    @staticmethod
+    def event(recipient: str, transaction_id=None) -> InputEventDto:
+        return InputEventDto(name="test-template", recipients=recipient, payload={}, transaction_id=transaction_id)
+
+    @mock.patch("requests.Session.request")
+    def test_drain_in_bulk(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        outbox = self.open(batch_size=3)
+        transaction_ids = [outbox.enqueue(self.event(f"recipient_{i}")) for i in range(5)]
+
+        self.assertEqual(outbox.pending(), 5)
+        self.assertEqual(outbox.drain(), 5)
+
+        self.assertEqual(outbox.pending(), 0)
+        self.assertEqual([len(call.kwargs["json"]["events"]) for call in mock_request.call_args_list], [3, 2])
+        self.assertEqual(
+            [event["transactionId"] for call in mock_request.call_args_list for event in call.kwargs["json"]["events"]],
+            transaction_ids,
+        )
+        self.assertEqual(outbox.status(transaction_ids[0]), EventStatus.PROCESSED)
+        self.assertEqual(outbox.drain(), 0)
+
+    @mock.patch("requests.Session.request")
+    def test_deduplicate_by_transaction_id(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        outbox = self.open()
+
+        self.assertEqual(outbox.enqueue(self.event("recipient", "transaction")), "transaction")
+        self.assertEqual(outbox.enqueue(self.event("other", "transaction")), "transaction")
+        outbox.drain()
+        outbox.enqueue(self.event("recipient", "transaction"))
+
+        self.assertEqual(outbox.pending(), 0)
+        mock_request.assert_called_once()
+        self.assertEqual(mock_request.call_args.kwargs["json"]["events"][0]["to"], "recipient")
+
+    @mock.patch("requests.Session.request")
+    def test_replay_after_crash(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        crashed = TriggerOutbox(self.path, drain=False)
+        crashed.enqueue(self.event("recipient", "transaction"))
+        crashed.close()
+
+        outbox = self.open()
+        outbox.enqueue(self.event("recipient", "transaction"))
+
+        self.assertEqual(outbox.drain(), 1)
+        mock_request.assert_called_once()
+
+    @mock.patch("requests.Session.request")
+    def test_failed_attempts(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        outbox = self.open(max_attempts=2)
+        outbox.enqueue(self.event("invalid", "invalid"))
+
+        self.assertRaises(BulkTriggerError, outbox.drain)
+        self.assertIsNone(outbox.status("invalid"))
+        self.assertRaises(BulkTriggerError, outbox.drain)
+
+        self.assertEqual(outbox.status("invalid"), FAILED)
+        self.assertEqual(outbox.pending(), 0)
+
+    def test_outage_keeps_events(self) -> None:
+        for name, side_effect in (
+            ("connection error", requests.ConnectionError("Connection refused")),
+            ("timeout", requests.ReadTimeout("Read timed out")),
+            ("server error", lambda **_: MockResponse(503)),
+            ("rate limit", lambda **_: MockResponse(429)),
+        ):
+            with self.subTest(name), mock.patch("requests.Session.request", side_effect=side_effect):
+                api = EventApi()
+                api.retry_policy = None
+                outbox = TriggerOutbox(f"{self.path}.{name}", api, max_attempts=3, drain=False)
+                self.addCleanup(outbox.close)
+                transaction_ids = [outbox.enqueue(self.event(f"recipient_{i}")) for i in range(5)]
+
+                for _ in range(10):
+                    self.assertRaises(BulkTriggerError, outbox.drain)
+
+                self.assertEqual(outbox.pending(), 5)
+                self.assertEqual([outbox.status(transaction_id) for transaction_id in transaction_ids], [None] * 5)
+
+    @mock.patch("requests.Session.request")
+    def test_failed_chunk(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        outbox = self.open()
+        for i in range(100):
+            outbox.enqueue(self.event(f"recipient_{i}", f"transaction_{i}"))
+        outbox.enqueue(self.event("failing", "failing"))
+
+        with self.assertRaises(BulkTriggerError) as context:
+            outbox.drain()
+
+        self.assertEqual([chunk for chunk, _ in context.exception.failures], [range(100, 101)])
+        self.assertEqual(outbox.status("transaction_0"), EventStatus.PROCESSED)
+        self.assertIsNone(outbox.status("failing"))
+        self.assertEqual(outbox.pending(), 1)
+        self.assertEqual(mock_request.call_count, 3)
+
+    @mock.patch("requests.Session.request")
+    def test_isolate_rejected_events(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        outbox = self.open(max_attempts=1)
+        for recipient in ("recipient_0", "invalid", "recipient_1"):
+            outbox.enqueue(self.event(recipient, recipient))
+
+        self.assertRaises(BulkTriggerError, outbox.drain)
+
+        self.assertEqual(outbox.status("recipient_0"), EventStatus.PROCESSED)
+        self.assertEqual(outbox.status("invalid"), FAILED)
+        self.assertEqual(outbox.status("recipient_1"), EventStatus.PROCESSED)
+        self.assertEqual([len(call.kwargs["json"]["events"]) for call in mock_request.call_args_list], [3, 1, 1, 1])
+
+    @mock.patch("requests.Session.request")
+    def test_isolation_stops_on_transient_error(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        outbox = self.open()
+        for recipient in ("failing", "recipient"):
+            outbox.enqueue(self.event(recipient, recipient))
+
+        self.assertRaises(BulkTriggerError, outbox.drain)
+
+        self.assertEqual(outbox.pending(), 2)
+        self.assertEqual([len(call.kwargs["json"]["events"]) for call in mock_request.call_args_list], [2, 1])
+
+    def test_isolate_after_unexpected_error(self) -> None:
+        api = mock.create_autospec(EventApi, instance=True)
+        api.trigger_bulk.side_effect = [
+            RuntimeError("Unexpected error"),
+            [EventDto(True, EventStatus.PROCESSED, "transaction_0")],
+            [EventDto(True, EventStatus.PROCESSED, "transaction_1")],
+        ]
+        outbox = TriggerOutbox(self.path, api, drain=False)
+        self.addCleanup(outbox.close)
+        for i in range(2):
+            outbox.enqueue(self.event(f"recipient_{i}", f"transaction_{i}"))
+
+        self.assertEqual(outbox.drain(), 2)
+
+        self.assertEqual(outbox.pending(), 0)
+        self.assertEqual([len(call.args[0]) for call in api.trigger_bulk.call_args_list], [2, 1, 1])
+
+    @mock.patch("requests.Session.request")
+    def test_purge_expired_events(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+        outbox = self.open(retention=-1)
+        outbox.enqueue(self.event("recipient", "transaction"))
+        outbox.drain()
+
+        outbox.enqueue(self.event("recipient", "transaction"))
+
+        self.assertEqual(outbox.pending(), 1)
+
+    @mock.patch("requests.Session.request")
+    def test_background_drainer(self, mock_request: mock.MagicMock) -> None:
+        mock_request.side_effect = echo_bulk
+
+        with TriggerOutbox(self.path) as outbox:
+            outbox.enqueue(self.event("recipient", "transaction"))
+            deadline = time.monotonic() + 5
+            while not outbox.status("transaction") and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(outbox.status("transaction"), EventStatus.PROCESSED)
+        mock_request.assert_called_once()
+
+    @mock.patch("requests.Session.request")
+    def test_background_drainer_retries(self, mock_request: mock.MagicMock) -> None:
+        mock_request.return_value = MockResponse(500)
+
+        with self.assertLogs("novu.outbox", "ERROR"):
+            with TriggerOutbox(self.path, retry_interval=0.01) as outbox:
+                outbox.enqueue(self.event("recipient", "transaction"))
+                deadline = time.monotonic() + 5
+                while mock_request.call_count < 4 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+        self.assertGreaterEqual(mock_request.call_count, 4)
+
+    @mock.patch.object(TriggerOutbox, "drain", side_effect=RuntimeError("Unexpected error"))
+    def test_background_drainer_backoff(self, drain: mock.MagicMock) -> None:
+        with self.assertLogs("novu.outbox", "ERROR") as logs:
+            with TriggerOutbox(self.path, retry_interval=0.01, max_retry_interval=0.04):
+                deadline = time.monotonic() + 5
+                while drain.call_count < 5 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+        self.assertEqual([record.args[0] for record in logs.records][:5], [0.01, 0.02, 0.04, 0.04, 0.04])
+
+    @mock.patch("requests.Session.request")
+    def test_drain_stopping(self, mock_request: mock.MagicMock) -> None:
+        outbox = self.open()
+        outbox.enqueue(self.event("recipient", "transaction"))
+        outbox._TriggerOutbox__stopping.set()  # type: ignore[attr-defined]
+
+        self.assertEqual(outbox.drain(), 0)
+
+        self.assertEqual(outbox.pending(), 1)
+        mock_request.assert_not_called()
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(ValueError, TriggerOutbox, self.path, batch_size=0)
+        self.assertRaises(ValueError, TriggerOutbox, self.path, max_attempts=0)
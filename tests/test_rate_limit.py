@@ -0,0 +1,92 @@
+from unittest import TestCase, mock
+
+from novu.rate_limit import (
+    READS,
+    SUBSCRIBER_WRITES,
+    TRIGGERS,
+    WRITES,
+    RateLimiter,
+    RateLimitExceeded,
+    TokenBucket,
+    endpoint_group,
+)
+from tests.factories import FakeClock
+
+
+class TokenBucketTests(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = mock.patch("novu.rate_limit.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self) -> None:
+        bucket = TokenBucket(rate=10, burst=2)
+
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0, 0, 0.1, 0.2])
+        self.clock.now = 1
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_refill_up_to_burst(self) -> None:
+        bucket = TokenBucket(rate=1)
+        bucket.reserve()
+        self.clock.now = 100
+
+        self.assertEqual([bucket.reserve() for _ in range(2)], [0, 1])
+
+    def test_acquire_blocking(self) -> None:
+        bucket = TokenBucket(rate=2, burst=1)
+
+        self.assertTrue(bucket.acquire())
+        self.assertTrue(bucket.acquire())
+        self.assertEqual(self.clock.now, 0.5)
+
+    def test_acquire_non_blocking(self) -> None:
+        bucket = TokenBucket(rate=2, burst=1)
+
+        self.assertTrue(bucket.acquire(blocking=False))
+        self.assertFalse(bucket.acquire(blocking=False))
+        self.assertFalse(bucket.acquire(timeout=0.4))
+        self.assertTrue(bucket.acquire(timeout=0.5))
+        self.assertEqual(self.clock.now, 0.5)
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(ValueError, TokenBucket, 0)
+        self.assertRaises(ValueError, TokenBucket, 1, burst=0)
+
+
+class RateLimiterTests(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = mock.patch("novu.rate_limit.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_endpoint_group(self) -> None:
+        self.assertEqual(endpoint_group("GET", "sample.novu.com/v1/subscribers"), READS)
+        self.assertEqual(endpoint_group("POST", "sample.novu.com/v1/events/trigger/bulk"), TRIGGERS)
+        self.assertEqual(endpoint_group("PUT", "sample.novu.com/v1/subscribers/id"), SUBSCRIBER_WRITES)
+        self.assertEqual(endpoint_group("POST", "sample.novu.com/v1/topics"), WRITES)
+
+    def test_limit_per_group(self) -> None:
+        limiter = RateLimiter({TRIGGERS: 1, READS: TokenBucket(10, burst=5)})
+
+        for _ in range(2):
+            limiter.acquire("POST", "sample.novu.com/v1/events/trigger")
+        self.assertEqual(self.clock.now, 1)
+
+        for _ in range(5):
+            limiter.acquire("GET", "sample.novu.com/v1/subscribers")
+        limiter.acquire("DELETE", "sample.novu.com/v1/subscribers/id")
+        self.assertEqual(self.clock.now, 1)
+
+    def test_max_wait(self) -> None:
+        limiter = RateLimiter({TRIGGERS: 2}, max_wait=0)
+        limiter.acquire("POST", "sample.novu.com/v1/events/trigger")
+        limiter.acquire("POST", "sample.novu.com/v1/events/trigger")
+
+        with self.assertRaises(RateLimitExceeded) as context:
+            limiter.acquire("POST", "sample.novu.com/v1/events/trigger")
+
+        self.assertEqual(context.exception.group, TRIGGERS)
+        self.assertEqual(context.exception.delay, 0.5)
@@ -0,0 +1,71 @@
+import email.utils
+import time
+from unittest import TestCase
+
+from novu.retry import RetryBudget, RetryPolicy, _parse_retry_after
+
+
+class RetryPolicyTests(TestCase):
+    def test_full_jitter_backoff(self) -> None:
+        policy = RetryPolicy(max_attempts=10, backoff=1, max_backoff=4, budget=RetryBudget(reserve=100))
+
+        for attempt, bound in enumerate([1, 2, 4, 4]):
+            delays = [policy.next_delay(attempt, "GET") for _ in range(20)]
+            self.assertTrue(all(0 <= delay <= bound for delay in delays))  # type: ignore[operator]
+            self.assertGreater(len(set(delays)), 1)
+
+    def test_max_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=2)
+
+        self.assertIsNotNone(policy.next_delay(0, "GET"))
+        self.assertIsNone(policy.next_delay(1, "GET"))
+
+    def test_statuses(self) -> None:
+        policy = RetryPolicy()
+
+        for status in (429, 502, 503, 504):
+            self.assertIsNotNone(policy.next_delay(0, "GET", status=status))
+        for status in (400, 404, 500):
+            self.assertIsNone(policy.next_delay(0, "GET", status=status))
+
+    def test_idempotency(self) -> None:
+        policy = RetryPolicy()
+
+        for method in ("get", "PUT", "DELETE"):
+            self.assertIsNotNone(policy.next_delay(0, method))
+        for method in ("POST", "PATCH"):
+            self.assertIsNone(policy.next_delay(0, method))
+        self.assertIsNotNone(policy.next_delay(0, "POST", idempotent=True))
+        self.assertIsNone(policy.next_delay(0, "GET", idempotent=False))
+
+    def test_retry_after(self) -> None:
+        policy = RetryPolicy(backoff=0.1, max_retry_after=30)
+
+        self.assertEqual(policy.next_delay(0, "GET", status=429, retry_after="12"), 12)
+        self.assertIsNone(policy.next_delay(0, "GET", status=429, retry_after="31"))
+        self.assertLessEqual(policy.next_delay(0, "GET", status=429, retry_after="invalid"), 0.1)  # type: ignore
+
+    def test_response_delay(self) -> None:
+        policy = RetryPolicy(backoff=0.1, max_retry_after=30)
+
+        self.assertEqual(policy.response_delay(0, "GET", None, 503, {"Retry-After": "12"}), 12)
+        self.assertLessEqual(policy.response_delay(0, "GET", None, 503, None), 0.1)  # type: ignore
+        self.assertIsNone(policy.response_delay(0, "POST", None, 503, {}))
+
+    def test_budget(self) -> None:
+        policy = RetryPolicy(max_attempts=5, budget=RetryBudget(ratio=0.5, reserve=2))
+
+        self.assertEqual([policy.next_delay(0, "GET") is not None for _ in range(3)], [True, True, False])
+        policy.budget.deposit()
+        self.assertIsNone(policy.next_delay(0, "GET"))
+        policy.start()
+        self.assertIsNotNone(policy.next_delay(0, "GET"))
+
+    def test_parse_retry_after(self) -> None:
+        self.assertEqual(_parse_retry_after("3"), 3)
+        self.assertEqual(_parse_retry_after("-3"), 0)
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after("soon"))
+        self.assertAlmostEqual(
+            _parse_retry_after(email.utils.formatdate(time.time() + 60, usegmt=True)), 60, delta=2  # type: ignore
+        )
@@ -0,0 +1,125 @@
+import socket
+from unittest import TestCase, mock
+
+import requests
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    LocationParseError,
+    NewConnectionError,
+    ProtocolError,
+    ProxyError,
+    ReadTimeoutError,
+    SSLError,
+)
+
+from novu.transport import (
+    RequestsTransport,
+    Transport,
+    Urllib3Transport,
+    _translate_error,
+)
+from tests.factories import StandInServer
+
+
+def unused_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+class TransportTests(TestCase):
+    def test_request_abstract(self) -> None:
+        class CustomTransport(Transport):
+            def request(self, *args, **kwargs) -> requests.Response:  # pylint: disable=W0221
+                return requests.Response()
+
+        self.assertRaises(TypeError, Transport)
+        transport = CustomTransport()
+        self.assertIsInstance(transport.request("GET", "http://127.0.0.1", {}), requests.Response)
+        transport.close()
+
+    def test_requests_transport_use_session(self) -> None:
+        session = mock.MagicMock(spec=requests.Session)
+        transport = RequestsTransport(session)
+
+        response = transport.request("GET", "http://127.0.0.1", {"X-Header": "value"}, params={"page": 1}, timeout=5)
+        transport.close()
+
+        self.assertIs(response, session.request.return_value)
+        session.request.assert_called_once_with(
+            method="GET",
+            url="http://127.0.0.1",
+            headers={"X-Header": "value"},
+            json=None,
+            params={"page": 1},
+            timeout=5,
+        )
+        session.close.assert_called_once()
+
+
+class Urllib3TransportTests(TestCase):
+    def setUp(self) -> None:
+        self.server = StandInServer(capacity=1, latency=0)
+        self.server.__enter__()  # pylint: disable=C2801
+        self.addCleanup(self.server.__exit__)
+
+        self.transport = Urllib3Transport()
+        self.addCleanup(self.transport.close)
+
+    def test_get_with_params(self) -> None:
+        response = self.transport.request(
+            "GET",
+            f"{self.server.url}/v1/subscribers?page=1",
+            {"Authorization": "ApiKey api-key"},
+            params={"limit": 10, "online": True, "ids": ["a", "b"], "after": None},
+            timeout=5,
+        )
+
+        self.assertTrue(response.ok)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        echo = response.json()["data"]
+        self.assertEqual(echo["method"], "GET")
+        self.assertEqual(echo["path"], "/v1/subscribers?page=1&limit=10&online=True&ids=a&ids=b")
+        self.assertEqual(echo["headers"]["Authorization"], "ApiKey api-key")
+        self.assertIsNone(echo["body"])
+
+    def test_post_json(self) -> None:
+        response = self.transport.request("POST", f"{self.server.url}/v1/events/trigger", {}, json={"name": "é"})
+
+        echo = response.json()["data"]
+        self.assertEqual(echo["body"], {"name": "é"})
+        self.assertEqual(echo["headers"]["Content-Type"], "application/json")
+
+    def test_error_status(self) -> None:
+        with StandInServer(capacity=0) as server:
+            response = self.transport.request("GET", server.url, {})
+
+        self.assertEqual(response.status_code, 429)
+        self.assertRaises(requests.HTTPError, response.raise_for_status)
+
+    def test_connection_error(self) -> None:
+        self.assertRaises(requests.ConnectionError, self.transport.request, "GET", unused_url(), {})
+
+    def test_read_timeout(self) -> None:
+        with StandInServer(capacity=1, latency=0.5) as server:
+            self.assertRaises(requests.ReadTimeout, self.transport.request, "GET", server.url, {}, timeout=0.05)
+
+    def test_unsupported_arguments(self) -> None:
+        self.assertRaises(TypeError, self.transport.request, "GET", self.server.url, {}, stream=True)
+
+    def test_translate_error(self) -> None:
+        for error, expected in (
+            (ConnectTimeoutError("connect timed out"), requests.ConnectTimeout),
+            (NewConnectionError(mock.Mock(), "connection refused"), requests.ConnectionError),
+            (ReadTimeoutError(mock.Mock(), "http://127.0.0.1", "read timed out"), requests.ReadTimeout),
+            (SSLError("certificate verify failed"), requests.exceptions.SSLError),
+            (ProxyError("proxy refused", OSError()), requests.exceptions.ProxyError),
+            (LocationParseError("http://[::1"), requests.exceptions.InvalidURL),
+            (ProtocolError("connection aborted"), requests.ConnectionError),
+            (OSError("network unreachable"), requests.ConnectionError),
+        ):
+            with self.subTest(error=type(error).__name__):
+                translated = _translate_error(error)
+
+                self.assertIs(type(translated), expected)
+                self.assertIs(translated.args[0], error)